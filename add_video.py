@@ -22,6 +22,9 @@ YouTube URL로 자막을 추출하고 발음 데이터를 생성하여
 
     # Claude Code로 기존 자막에 발음 추가
     python add_video.py --generate-pronunciation --use-claude-code VIDEO_ID
+
+    # 영상을 먼저 등록하고 발음을 앞부분부터 채우며 중간 저장 (생성 중에도 학습 가능)
+    python add_video.py --progressive --use-claude-code "https://www.youtube.com/watch?v=VIDEO_ID"
 """
 
 import json
@@ -30,14 +33,15 @@ import os
 import re
 import subprocess
 import sys
+import time
 from datetime import date
 from pathlib import Path
 
+from video_store import (load_index, load_video_data, mark_has_pronunciation, pronunciation_progress,
+                         save_video_data, set_pronunciation_progress, update_index, video_path)
+
 # 프로젝트 루트
 PROJECT_DIR = Path(__file__).parent
-PUBLIC_DIR = PROJECT_DIR / "public"
-VIDEOS_DIR = PUBLIC_DIR / "videos"
-INDEX_FILE = VIDEOS_DIR / "index.json"
 
 
 def extract_video_id(url: str) -> str:
@@ -88,12 +92,19 @@ def get_video_metadata(video_id: str) -> dict:
     }
 
 
-def extract_subtitles(youtube_url: str, video_id: str, fix_sentences: bool = True) -> list:
+def extract_subtitles(youtube_url: str, video_id: str, fix_sentences: bool = True,
+                      use_cache: bool = True, refresh_cache: bool = False,
+                      hedge_delay: float = None) -> list:
     """기존 extract_subtitles.py를 활용하여 자막을 추출합니다."""
     sys.path.insert(0, str(PROJECT_DIR))
     from extract_subtitles import SubtitleExtractor
+    from transcript_cache import TranscriptCache
 
-    extractor = SubtitleExtractor()
+    extractor = SubtitleExtractor(
+        cache=TranscriptCache() if use_cache else None,
+        refresh_cache=refresh_cache,
+        hedge_delay=hedge_delay,
+    )
     subtitles = extractor.extract(youtube_url, fix_sentences=fix_sentences)
 
     if not subtitles:
@@ -102,111 +113,274 @@ def extract_subtitles(youtube_url: str, video_id: str, fix_sentences: bool = Tru
     return subtitles
 
 
-def generate_pronunciation(subtitles: list) -> list:
-    """Anthropic API로 발음 데이터를 생성합니다."""
+# API 배치는 추정 토큰 예산으로 묶음 (응답이 max_tokens=4096 안에 들어오도록 여유 있게)
+API_BATCH_TOKENS = 1500
+API_BATCH_MAX_CUES = 12
+
+def merge_results(subtitles: list, results: dict) -> list:
+    """결과({index: 항목})를 자막 순서대로 합칩니다. 결과가 없는 자막도 발음 없이 남깁니다."""
+    from pronunciation_cache import text_hash
+    merged = []
+    for i, sub in enumerate(subtitles):
+        item = dict(sub, index=i + 1)
+        r = results.get(sub['index'])
+        if r:
+            item.update(pronunciation=r['pronunciation'], translation=r.get('translation', ''),
+                        notes=r.get('notes', []))
+            # 생성 시점의 텍스트 해시 기록 (gen_pronunciation --incremental 참고)
+            item['textHash'] = text_hash(sub['text'])
+        merged.append(item)
+    return merged
+
+
+def collect_batch(batch: list, items: dict) -> tuple:
+    """배치 하나에서 받은 항목({index: 항목})을 검증합니다.
+
+    Returns: (검증 통과 목록, 발음에 영어가 섞인 fallback 목록)
+    """
+    from gen_pronunciation import resolve_reference_notes, validate_batch
+    if not items:
+        return [], []
+    return validate_batch(resolve_reference_notes(list(items.values()), batch),
+                          [s['index'] for s in batch], verbose=False)
+
+
+class _ApiRun:
+    """계획(pronunciation_pipeline.PronunciationPlan)의 남은 작업을 Anthropic API로 보내 결과를 채우는 실행 하나
+
+    모든 배치(--route면 fast/strong 모두)를 한꺼번에 보내고, fast 배치에서 검증을 통과하지 못한 문장은
+    같은 이벤트 루프 안에서 strong 모델로 한 번 더 보냅니다. 배치가 끝날 때마다 결과를 계획에 채우므로
+    (캐시 저장 포함) 호출한 쪽은 plan에서 결과를 읽으면 됩니다.
+    """
+
+    def __init__(self, plan, api_key: str, limiter=None, on_partial=None,
+                 route_models: bool = False, route_threshold: float = None):
+        self.plan = plan
+        self.api_key = api_key
+        self.limiter = limiter
+        self.on_partial = on_partial
+        self.route_models = route_models
+        self.route_threshold = route_threshold
+        self.tier_stats = None
+        self.escalated = []      # fast 모델이 실패한 작업 (strong으로 다시 보냄)
+        self.done = 0
+        self.total = 0
+        self.last_partial = None
+
+    def pack(self, cues: list) -> list:
+        """토큰 예산으로 배치를 묶습니다. on_partial이 있으면 영상 첫 부분은 작은 배치로 먼저 받습니다."""
+        from gen_pronunciation import PROGRESSIVE_START_BUDGET
+        from pronunciation_batcher import pack_batches
+        if self.on_partial and cues:
+            head = pack_batches(cues, PROGRESSIVE_START_BUDGET, API_BATCH_MAX_CUES)[0]
+            return [head] + pack_batches(cues[len(head):], API_BATCH_TOKENS, API_BATCH_MAX_CUES)
+        return pack_batches(cues, API_BATCH_TOKENS, API_BATCH_MAX_CUES)
+
+    def plan_batches(self, work: list) -> list:
+        """[(모델 단계, 배치)] 목록. 라우팅하지 않으면 단계는 None (기본 모델)입니다."""
+        if not self.route_models:
+            return [(None, batch) for batch in self.pack(work)]
+        from model_router import DEFAULT_THRESHOLD, TIER_FAST, TIER_STRONG, TierStats, route
+        self.tier_stats = TierStats()
+        routed = route(work, DEFAULT_THRESHOLD if self.route_threshold is None else self.route_threshold)
+        print(f"  🧭 난이도 라우팅: fast {len(routed[TIER_FAST])}개, strong {len(routed[TIER_STRONG])}개")
+        return [(tier, batch) for tier, cues in routed.items() for batch in self.pack(cues)]
+
+    async def run(self, work: list) -> None:
+        from anthropic_backend import AnthropicBackend
+        from model_router import API_MODELS, TIER_STRONG, TIERS
+        from pronunciation_batcher import pack_batches
+
+        batches = self.plan_batches(work)
+        self.total = len(batches)
+        print(f"  🔄 Claude API로 발음 데이터 생성 중... ({len(work)}개, {len(batches)}개 배치)")
+        backend = AnthropicBackend(self.api_key, limiter=self.limiter)
+        try:
+            await self.send(backend, batches)
+            if self.escalated:
+                # 빠른 모델 결과가 검증을 통과하지 못한 문장은 기본 모델로 한 번 더 보냄
+                self.tier_stats.escalated = len(self.escalated)
+                print(f"  🧭 fast 모델이 실패한 {len(self.escalated)}개를 strong 모델로 다시 보냅니다")
+                escalated = sorted(self.escalated, key=lambda w: w['index'])
+                extra = [(TIER_STRONG, batch)
+                         for batch in pack_batches(escalated, API_BATCH_TOKENS, API_BATCH_MAX_CUES)]
+                self.total += len(extra)
+                await self.send(backend, extra, first=len(batches))
+        finally:
+            await backend.aclose()
+
+        if self.tier_stats:
+            by_model = {API_MODELS[tier]: tier for tier in TIERS}
+            for model, seconds in backend.timings:
+                self.tier_stats.add_latency(by_model[model], seconds)
+            for line in self.tier_stats.report().splitlines():
+                print(f"  🧭 {line}")
+
+    async def send(self, backend, batches: list, first: int = 0) -> None:
+        """배치들을 동시에 보내고 끝나는 대로 finish_batch로 넘깁니다 (배치 번호는 first + 1부터)."""
+        from gen_pronunciation import build_prompt
+        from model_router import API_MODELS
+
+        # 스트리밍으로 항목이 닫히는 즉시 채우므로 응답이 잘리거나 요청이 실패해도 그때까지 받은 항목은 남음
+        # (재시도로 다시 온 항목은 덮어씀)
+        streamed = [{} for _ in batches]
+
+        def on_item(i, item):
+            streamed[i][item.get('index')] = item
+
+        def on_done(i, result):
+            tier, batch = batches[i]
+            self.finish_batch(first + i + 1, tier, batch, streamed[i], result)
+
+        await backend.complete_all([build_prompt(batch) for _, batch in batches], on_done=on_done,
+                                   on_item=on_item, models=[API_MODELS[tier] if tier else None
+                                                            for tier, _ in batches])
+
+    def finish_batch(self, number: int, tier, batch: list, items: dict, result) -> None:
+        """끝난 배치 하나를 검증해 계획에 채우고, on_partial이 있으면 중간 결과를 넘깁니다."""
+        from gen_pronunciation import PROGRESSIVE_FLUSH_INTERVAL
+        from model_router import TIER_FAST
+
+        self.done += 1
+        if isinstance(result, BaseException):
+            print(f"    ⚠ 배치 {number} 실패: {result}")
+        elif not items:
+            print(f"    ⚠ 배치 {number}: JSON 파싱 실패, 건너뜀")
+        else:
+            print(f"    배치 {number} 완료 ({self.done}/{self.total})")
+
+        validated, fallback = collect_batch(batch, items)
+        if items and len(validated) < len(batch):
+            print(f"    ⚠ 배치 {number}: {len(batch)}개 중 {len(validated)}개 검증 통과")
+        if self.tier_stats:
+            self.tier_stats.record(tier, batch, len(validated))
+        if tier == TIER_FAST:
+            # 빠른 모델 결과 표시 (발음 캐시에 넣지 않음)
+            for item in validated:
+                item['tier'] = tier
+            ok = {item['index'] for item in validated}
+            self.escalated.extend(w for w in batch if w['index'] not in ok)
+        self.plan.assign(validated)
+        self.plan.assign(fallback, fallback=True)
+
+        if self.on_partial and validated and (
+                self.last_partial is None or time.monotonic() - self.last_partial >= PROGRESSIVE_FLUSH_INTERVAL):
+            self.on_partial()
+            self.last_partial = time.monotonic()
+
+
+def resolve_locally(subtitles: list, use_cache: bool = True, use_rules: bool = True,
+                    use_memory: bool = True, video_id: str = None):
+    """발음 캐시, 규칙 발음, 번역 메모리로 채울 수 있는 자막을 채운 계획(PronunciationPlan)을 만듭니다.
+
+    Returns: (계획, 영상 키) — 영상 상태는 plan.videos[영상 키]
+    """
+    from gen_pronunciation import PROMPT_TEMPLATE
+    from pronunciation_cache import prompt_version
+    from pronunciation_pipeline import PronunciationPlan
+
+    cache = None
+    if use_cache:
+        from pronunciation_cache import PronunciationCache
+        cache = PronunciationCache()
+    plan = PronunciationPlan(prompt_version(PROMPT_TEMPLATE), cache=cache, use_memory=use_memory)
+    key = video_id or ''
+    plan.add_video(key, subtitles, subtitles)
+    plan.resolve_local(use_rules, budget=API_BATCH_TOKENS, max_cues=API_BATCH_MAX_CUES,
+                       on_report=lambda _, icon, line: print(f"  {icon} {line}"))
+    if cache:
+        print(f"  💾 {cache.report()}")
+    return plan, key
+
+
+def generate_pronunciation(subtitles: list, limiter=None, use_cache: bool = True,
+                           use_rules: bool = True, use_memory: bool = True,
+                           on_partial=None, route_models: bool = False,
+                           route_threshold: float = None, video_id: str = None) -> list:
+    """Anthropic API로 발음 데이터를 생성합니다.
+
+    로컬에서 채우기(캐시, 규칙 발음, 번역 메모리)와 같은 문장 묶기는 gen_pronunciation과 같은
+    계층(pronunciation_pipeline)을 쓰고, 남은 문장은 토큰 예산(API_BATCH_TOKENS)으로 묶어
+    AsyncAnthropic으로 동시에 보냅니다 (_ApiRun, anthropic_backend 참고). 프롬프트도 gen_pronunciation과
+    같은 INDEX=N TEXT="..." 입력 / index + 생성 필드 출력 형식이라 발음 캐시 항목을 두 경로가 함께 씁니다.
+    limiter(anthropic_backend.RateLimiter)를 넘기면 동시 요청 수와 분당 요청/토큰 한도를
+    여러 영상에서 함께 씁니다. 결과는 자막 순서대로 합칩니다.
+    video_id를 넘기면 그 영상(다시 만드는 대상)의 예전 자막은 번역 메모리에서 뺍니다.
+    on_partial(자막 목록)을 넘기면 첫 배치를 작게(PROGRESSIVE_START_BUDGET) 만들어 영상 앞부분을 먼저
+    받고, 배치가 끝날 때 PROGRESSIVE_FLUSH_INTERVAL초마다 그때까지의 결과를 합쳐 넘깁니다 (--progressive).
+    route_models면 난이도 점수(model_router)가 route_threshold 이하인 문장은 빠른 모델로 보내고,
+    빠른 모델 결과가 검증을 통과하지 못한 문장은 기본 모델로 한 번 더 보냅니다 (--route).
+    """
     api_key = os.environ.get('ANTHROPIC_API_KEY')
     if not api_key:
         return None
 
     try:
-        import anthropic
+        import anthropic  # noqa: F401
     except ImportError:
         print("  ⚠ anthropic 패키지가 없습니다. pip install anthropic")
         return None
 
-    print(f"  🔄 Claude API로 발음 데이터 생성 중... ({len(subtitles)}개)")
-
-    client = anthropic.Anthropic(api_key=api_key)
-    all_results = []
-
-    # 5개씩 배치 처리
-    batch_size = 5
-    for i in range(0, len(subtitles), batch_size):
-        batch = subtitles[i:i + batch_size]
-        batch_num = i // batch_size + 1
-        total_batches = (len(subtitles) + batch_size - 1) // batch_size
-        print(f"    배치 {batch_num}/{total_batches} 처리 중...")
-
-        prompt = f"""다음 영어 자막들의 실제 발음을 한글로 표기해주세요.
-
-규칙:
-- 교과서 발음이 아닌 원어민의 실제 빠른 발음을 한글로 표기
-- going to → 거나(gonna), want to → 워나(wanna), got to → 가라(gotta)
-- 모음 사이의 t → ㄹ (water → 워러)
-- d+y → 쥬, t+y → 추
-- 자음+모음 연결 (연음)
-- 약한 음절은 축약
-- notes에는 2~4개의 발음 포인트를 포함
-
-입력:
-{json.dumps(batch, ensure_ascii=False, indent=2)}
-
-출력 형식 (JSON 배열만, 마크다운 없이):
-[
-  {{
-    "index": 숫자,
-    "start": 숫자,
-    "end": 숫자,
-    "text": "영어 원문",
-    "pronunciation": "한글 발음",
-    "translation": "한국어 번역",
-    "notes": [
-      {{"word": "영어", "actual": "한글발음", "meaning": "설명"}}
-    ]
-  }}
-]"""
-
-        try:
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            text = response.content[0].text
-            # JSON 추출
-            json_match = re.search(r'\[[\s\S]*\]', text)
-            if json_match:
-                batch_results = json.loads(json_match.group())
-                all_results.extend(batch_results)
-            else:
-                print(f"    ⚠ 배치 {batch_num}: JSON 파싱 실패, 건너뜀")
-        except Exception as e:
-            print(f"    ⚠ 배치 {batch_num} 실패: {e}")
+    import asyncio
+    sys.path.insert(0, str(PROJECT_DIR))
 
-    if all_results:
-        # index 재정렬
-        for i, item in enumerate(all_results):
-            item['index'] = i + 1
-        return all_results
-    return None
+    plan, key = resolve_locally(subtitles, use_cache, use_rules, use_memory, video_id)
+    work = plan.plan_work()
+    video = plan.videos[key]
+
+    publish = None
+    if on_partial:
+        def publish():
+            on_partial(merge_results(subtitles, video.results))
+        if video.results:
+            # 캐시/규칙/번역 메모리로 채운 자막은 API 응답 전에 바로 공개
+            publish()
+
+    if work:
+        asyncio.run(_ApiRun(plan, api_key, limiter, publish, route_models, route_threshold).run(work))
+    if plan.cache:
+        plan.cache.close()
+
+    results = video.final_results()
+    if not results:
+        return None
+    return merge_results(subtitles, results)
 
 
-def load_index() -> list:
-    """영상 목록 index.json을 로드합니다."""
-    if INDEX_FILE.exists():
-        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return []
+def register_video(video_id: str, metadata: dict, data: list) -> int:
+    """index.json에 영상을 추가하거나 갱신합니다. 영상 수를 반환합니다.
 
+    hasPronunciation/pronunciationProgress는 자막 상태로 정합니다 (발음 없는 자막이 남으면 진행 상황 기록).
+    """
+    def update(index):
+        entry = next((v for v in index if v['id'] == video_id), None)
+        if entry is None:
+            entry = {'id': video_id}
+            index.append(entry)
+        entry.update({
+            'title': metadata['title'],
+            'channel': metadata['channel'],
+            'subtitleCount': len(data),
+            'duration': metadata.get('duration', 0),
+            'addedAt': str(date.today()),
+        })
+        set_pronunciation_progress(entry, data)
 
-def save_index(index: list):
-    """영상 목록 index.json을 저장합니다."""
-    VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
-    with open(INDEX_FILE, 'w', encoding='utf-8') as f:
-        json.dump(index, f, ensure_ascii=False, indent=2)
+    return len(update_index(update))
 
 
-def save_video_data(video_id: str, data: list):
-    """영상 자막 데이터를 저장합니다."""
-    VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
-    filepath = VIDEOS_DIR / f"{video_id}.json"
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    return filepath
+def save_partial(video_id: str, data: list):
+    """생성 중인 자막을 저장하고 index.json의 pronunciationProgress를 갱신합니다 (--progressive)."""
+    save_video_data(video_id, data)
+    mark_has_pronunciation(video_id, data)
+    progress = pronunciation_progress(data)
+    print(f"    💾 중간 저장: {progress['done']}/{progress['total']}개, "
+          f"처음 {progress['readyUntil']:.0f}초까지 학습 가능")
 
 
-def generate_pronunciation_claude_code(subtitles: list, video_id: str, retry: bool = True) -> list:
+def generate_pronunciation_claude_code(subtitles: list, video_id: str, retry: bool = True,
+                                      use_cache: bool = True, progressive: bool = False,
+                                      route_models: bool = False) -> list:
     """Claude Code CLI로 발음 데이터를 생성합니다 (API 키 불필요)."""
     try:
         subprocess.run(['claude', '--version'], capture_output=True, timeout=5)
@@ -218,13 +392,11 @@ def generate_pronunciation_claude_code(subtitles: list, video_id: str, retry: bo
     from gen_pronunciation import generate_for_video
 
     # 먼저 자막 파일을 임시 저장
-    filepath = VIDEOS_DIR / f"{video_id}.json"
-    VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(subtitles, f, ensure_ascii=False, indent=2)
+    filepath = save_video_data(video_id, subtitles)
 
     # gen_pronunciation 실행
-    success = generate_for_video(video_id, batch_size=24, retry=retry)
+    success = generate_for_video(video_id, retry=retry, use_cache=use_cache, progressive=progressive,
+                                 route_models=route_models)
     if not success:
         return None
 
@@ -234,8 +406,15 @@ def generate_pronunciation_claude_code(subtitles: list, video_id: str, retry: bo
 
 
 def add_video(youtube_url: str, skip_pronunciation: bool = False, use_claude_code: bool = False,
-              retry: bool = True, fix_sentences: bool = True):
-    """새 영상을 추가합니다."""
+              retry: bool = True, fix_sentences: bool = True, use_cache: bool = True,
+              refresh_cache: bool = False, hedge_delay: float = None, limiter=None,
+              use_pronunciation_cache: bool = True, progressive: bool = False,
+              route_models: bool = False):
+    """새 영상을 추가합니다.
+
+    progressive면 발음 생성 전에 자막만으로 영상을 먼저 등록하고, 생성 중에는 앞부분부터 채운
+    결과를 주기적으로 저장합니다 (index.json의 pronunciationProgress로 진행 상황 표시).
+    """
     video_id = extract_video_id(youtube_url)
     full_url = f"https://www.youtube.com/watch?v={video_id}"
 
@@ -264,7 +443,9 @@ def add_video(youtube_url: str, skip_pronunciation: bool = False, use_claude_cod
 
     # 2. 자막 추출
     print(f"\n📝 Step 2: 자막 추출...")
-    subtitles = extract_subtitles(full_url, video_id, fix_sentences=fix_sentences)
+    subtitles = extract_subtitles(full_url, video_id, fix_sentences=fix_sentences,
+                                  use_cache=use_cache, refresh_cache=refresh_cache,
+                                  hedge_delay=hedge_delay)
     print(f"   ✓ {len(subtitles)}개 자막 추출 완료")
 
     # 3. 발음 데이터 생성
@@ -272,15 +453,28 @@ def add_video(youtube_url: str, skip_pronunciation: bool = False, use_claude_cod
     has_pronunciation = False
 
     if not skip_pronunciation:
+        on_partial = None
+        if progressive:
+            # 자막만으로 먼저 공개하고 발음은 생성되는 대로 채움
+            save_video_data(video_id, subtitles)
+            register_video(video_id, metadata, subtitles)
+            on_partial = lambda data: save_partial(video_id, data)  # noqa: E731
+            print(f"\n📣 자막을 먼저 공개했습니다. 발음은 앞부분부터 채워집니다.")
         print(f"\n🔊 Step 3: 발음 데이터 생성...")
         if use_claude_code:
-            pronunciation_data = generate_pronunciation_claude_code(subtitles, video_id, retry=retry)
+            pronunciation_data = generate_pronunciation_claude_code(
+                subtitles, video_id, retry=retry, use_cache=use_pronunciation_cache,
+                progressive=progressive, route_models=route_models)
         else:
-            pronunciation_data = generate_pronunciation(subtitles)
+            pronunciation_data = generate_pronunciation(subtitles, limiter=limiter,
+                                                        use_cache=use_pronunciation_cache,
+                                                        on_partial=on_partial, route_models=route_models,
+                                                        video_id=video_id)
         if pronunciation_data:
             final_data = pronunciation_data
-            has_pronunciation = True
-            print(f"   ✓ {len(pronunciation_data)}개 발음 데이터 생성 완료")
+            progress = pronunciation_progress(final_data)
+            has_pronunciation = progress['done'] == progress['total']
+            print(f"   ✓ {progress['done']}/{progress['total']}개 발음 데이터 생성 완료")
         else:
             if use_claude_code:
                 print("   ⚠ Claude Code 발음 생성 실패, 자막만 저장합니다.")
@@ -299,46 +493,30 @@ def add_video(youtube_url: str, skip_pronunciation: bool = False, use_claude_cod
     print(f"   ✓ {filepath}")
 
     # 5. index.json 업데이트
-    if existing:
-        existing.update({
-            'title': metadata['title'],
-            'channel': metadata['channel'],
-            'subtitleCount': len(final_data),
-            'duration': metadata.get('duration', 0),
-            'hasPronunciation': has_pronunciation,
-            'addedAt': str(date.today()),
-        })
-    else:
-        index.append({
-            'id': video_id,
-            'title': metadata['title'],
-            'channel': metadata['channel'],
-            'subtitleCount': len(final_data),
-            'duration': metadata.get('duration', 0),
-            'hasPronunciation': has_pronunciation,
-            'addedAt': str(date.today()),
-        })
-
-    save_index(index)
-    print(f"   ✓ index.json 업데이트 ({len(index)}개 영상)")
+    count = register_video(video_id, metadata, final_data)
+    print(f"   ✓ index.json 업데이트 ({count}개 영상)")
 
     # 완료
     print(f"\n✅ 완료!")
     print(f"   영상: {metadata['title']}")
     print(f"   자막: {len(final_data)}개")
-    print(f"   발음: {'✓ 생성됨' if has_pronunciation else '✗ 없음 (자막만 저장)'}")
+    if has_pronunciation:
+        print(f"   발음: ✓ 생성됨")
+    elif final_data is not subtitles:
+        print(f"   발음: △ 일부 자막 없음 (--generate-pronunciation으로 다시 생성)")
+    else:
+        print(f"   발음: ✗ 없음 (자막만 저장)")
     print(f"   npm run dev 로 확인하세요.\n")
 
 
-def generate_pronunciation_for_existing(video_id: str):
+def generate_pronunciation_for_existing(video_id: str, limiter=None, use_cache: bool = True,
+                                        progressive: bool = False, route_models: bool = False):
     """이미 추출된 자막에 발음 데이터를 추가합니다."""
-    filepath = VIDEOS_DIR / f"{video_id}.json"
-    if not filepath.exists():
+    if not video_path(video_id).exists():
         print(f"✗ {video_id}.json 파일이 없습니다.")
         sys.exit(1)
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        subtitles = json.load(f)
+    subtitles = load_video_data(video_id)
 
     # 이미 발음 데이터가 있는지 확인
     if subtitles and 'pronunciation' in subtitles[0]:
@@ -348,17 +526,18 @@ def generate_pronunciation_for_existing(video_id: str):
             return
 
     print(f"🔊 {video_id}: 발음 데이터 생성 중...")
-    result = generate_pronunciation(subtitles)
+    on_partial = (lambda data: save_partial(video_id, data)) if progressive else None
+    result = generate_pronunciation(subtitles, limiter=limiter, use_cache=use_cache, on_partial=on_partial,
+                                    route_models=route_models, video_id=video_id)
     if result:
         save_video_data(video_id, result)
-        # index 업데이트
-        index = load_index()
-        for v in index:
-            if v['id'] == video_id:
-                v['hasPronunciation'] = True
-                v['subtitleCount'] = len(result)
-        save_index(index)
-        print(f"✅ {len(result)}개 발음 데이터 저장 완료")
+        # index 업데이트 (hasPronunciation은 발음 없는 자막이 남았는지로 정함)
+        mark_has_pronunciation(video_id, result, subtitle_count=True)
+        progress = pronunciation_progress(result)
+        if progress['done'] == progress['total']:
+            print(f"✅ {len(result)}개 발음 데이터 저장 완료")
+        else:
+            print(f"⚠ {progress['done']}/{progress['total']}개 발음 데이터 저장 (발음 없는 자막 남음)")
     else:
         print("✗ 발음 생성 실패")
         sys.exit(1)
@@ -384,6 +563,9 @@ def main():
 
   # 자막만 추출 (발음 생성 건너뛰기)
   python add_video.py --skip-pronunciation "https://www.youtube.com/watch?v=VIDEO_ID"
+
+  # 먼저 등록하고 발음은 앞부분부터 채우며 중간 저장
+  python add_video.py --progressive --use-claude-code "https://www.youtube.com/watch?v=VIDEO_ID"
         '''
     )
 
@@ -398,20 +580,56 @@ def main():
                         help='발음 생성 실패 시 재시도 안 함')
     parser.add_argument('--no-sentence-fix', action='store_true',
                         help='문장 단위 자막 보정을 건너뜁니다')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='원본 자막 디스크 캐시를 사용하지 않습니다')
+    parser.add_argument('--refresh-cache', action='store_true',
+                        help='캐시를 무시하고 자막을 새로 받아 캐시를 갱신합니다')
+    parser.add_argument('--hedge-delay', type=float, default=None, metavar='SECONDS',
+                        help='youtube-transcript-api가 이 시간 안에 끝나지 않으면 yt-dlp를 동시에 '
+                             '시작해 먼저 성공한 결과를 씁니다 (0: 처음부터 동시에)')
+    parser.add_argument('--no-pronunciation-cache', action='store_true',
+                        help='발음 캐시를 사용하지 않습니다 (모든 문장을 새로 생성)')
+    parser.add_argument('--progressive', action='store_true',
+                        help='자막만으로 영상을 먼저 등록하고 발음을 앞부분부터 채우며 중간 저장합니다')
+    parser.add_argument('--route', action='store_true',
+                        help='난이도가 낮은 자막은 빠른 모델로, 어려운 자막과 빠른 모델이 검증에 실패한 '
+                             '자막은 기본 모델로 보냅니다')
+    parser.add_argument('--api-concurrency', type=int, default=4,
+                        help='Claude API 동시 요청 수 (기본: 4)')
+    parser.add_argument('--api-rpm', type=float, default=50,
+                        help='Claude API 분당 요청 수 한도 (기본: 50)')
+    parser.add_argument('--api-tpm', type=float, default=40000,
+                        help='Claude API 분당 토큰 수 한도 (기본: 40000)')
 
     args = parser.parse_args()
 
+    sys.path.insert(0, str(PROJECT_DIR))
+    from movietalk import configure_logging
+    configure_logging()
+
+    from anthropic_backend import RateLimiter
+    limiter = RateLimiter(requests_per_minute=args.api_rpm, tokens_per_minute=args.api_tpm,
+                          max_concurrency=args.api_concurrency)
+
     if args.generate_pronunciation:
         if args.use_claude_code:
             from gen_pronunciation import generate_for_video
             print(f"🎬 Claude Code로 발음 데이터 생성: {args.url}")
-            generate_for_video(args.url, retry=not args.no_retry)
+            generate_for_video(args.url, retry=not args.no_retry,
+                               use_cache=not args.no_pronunciation_cache, progressive=args.progressive,
+                               route_models=args.route)
         else:
-            generate_pronunciation_for_existing(args.url)
+            generate_pronunciation_for_existing(args.url, limiter=limiter,
+                                                use_cache=not args.no_pronunciation_cache,
+                                                progressive=args.progressive, route_models=args.route)
     else:
         add_video(args.url, skip_pronunciation=args.skip_pronunciation,
                   use_claude_code=args.use_claude_code, retry=not args.no_retry,
-                  fix_sentences=not args.no_sentence_fix)
+                  fix_sentences=not args.no_sentence_fix,
+                  use_cache=not args.no_cache, refresh_cache=args.refresh_cache,
+                  hedge_delay=args.hedge_delay, limiter=limiter,
+                  use_pronunciation_cache=not args.no_pronunciation_cache,
+                  progressive=args.progressive, route_models=args.route)
 
 
 if __name__ == '__main__':
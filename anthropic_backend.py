@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk Anthropic API 비동기 백엔드
+
+AsyncAnthropic으로 여러 요청을 동시에 보내되,
+- 동시 요청 수 상한 (max_concurrency)
+- 분당 요청 수 / 분당 토큰 수 토큰 버킷 (requests_per_minute, tokens_per_minute)
+- 429(rate limit) / 529(overloaded) / 5xx / 연결 오류에 대한 지터 백오프 재시도 (retry-after 존중)
+를 적용합니다.
+
+on_item을 넘기면 응답을 스트리밍으로 받아 JSON 배열 항목이 닫히는 즉시 넘겨 줍니다
+(json_stream 참고). 응답이 max_tokens나 연결 끊김으로 중간에 잘려도 그때까지의 항목은 남습니다.
+
+RateLimiter 하나를 여러 AnthropicBackend(여러 영상)가 함께 쓰면 한 번의 실행 전체가
+같은 한도를 나눠 씁니다.
+
+complete_all(models=...)로 프롬프트마다 다른 모델을 쓸 수 있으며 (난이도 라우팅, model_router 참고)
+성공한 요청마다 (모델, 응답 시간)을 timings에 남깁니다.
+
+API 주소는 ANTHROPIC_BASE_URL 환경 변수(또는 base_url 인자)로 바꿀 수 있으므로
+scripts/fake_anthropic_server.py 같은 로컬 가짜 서버로 시험할 수 있습니다.
+
+사용 예:
+    limiter = RateLimiter(requests_per_minute=50, tokens_per_minute=40000, max_concurrency=4)
+    backend = AnthropicBackend(api_key, limiter=limiter)
+    texts = asyncio.run(backend.complete_all(prompts))
+"""
+
+import asyncio
+import random
+import time
+from typing import Callable, List, Optional, Tuple, Union
+
+from json_stream import JSONItemStream
+
+DEFAULT_MODEL = "claude-sonnet-4-20250514"
+FAST_MODEL = "claude-3-5-haiku-20241022"   # 난이도 라우팅에서 쉬운 자막용
+RETRY_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+class TokenBucket:
+    """분당 rate만큼 채워지는 토큰 버킷. 한 이벤트 루프 안에서 사용합니다.
+
+    acquire는 토큰이 생길 때까지 기다립니다. charge는 기다리지 않고 차감하며
+    잔량이 음수가 될 수 있습니다 (실제 사용량이 추정보다 많았던 경우 이후 요청을 늦춤).
+    """
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        # 한 요청이 버킷보다 크면 가득 찬 버킷만큼만 기다림
+        amount = min(amount, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def charge(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= amount
+
+
+class RateLimiter:
+    """동시 요청 수 + 분당 요청/토큰 한도. 여러 영상 처리에서 하나를 공유할 수 있습니다."""
+
+    def __init__(self, requests_per_minute: float = 50, tokens_per_minute: float = 40000,
+                 max_concurrency: int = 4):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.max_concurrency = max(1, max_concurrency)
+        self._loop = None
+        self._semaphore = None
+
+    def semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프용 세마포어 (asyncio.run을 여러 번 해도 새 루프에 맞게 다시 만듦)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        await self.requests.acquire(1)
+        await self.tokens.acquire(estimated_tokens)
+
+
+def estimate_tokens(prompt: str) -> int:
+    """입력 토큰 수 대략 추정 (한글/영문 섞인 프롬프트 기준 3글자 ≈ 1토큰)"""
+    return len(prompt) // 3 + 1
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None,
+                  base: float = 1.0, cap: float = 60.0) -> float:
+    """full jitter 지수 백오프. 서버가 retry-after를 주면 그보다 짧게 기다리지 않습니다."""
+    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def _retry_after(error) -> Optional[float]:
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+class AnthropicBackend:
+    """AsyncAnthropic + RateLimiter + 재시도"""
+
+    def __init__(self, api_key: str, limiter: Optional[RateLimiter] = None,
+                 model: str = DEFAULT_MODEL, max_tokens: int = 4096, max_retries: int = 6,
+                 base_url: Optional[str] = None, timeout: float = 120.0):
+        import anthropic
+
+        self._anthropic = anthropic
+        # 재시도는 여기서 직접 하므로 SDK 자체 재시도는 끔
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key, base_url=base_url, max_retries=0, timeout=timeout,
+        )
+        self.limiter = limiter or RateLimiter()
+        self.model = model
+        self.max_tokens = max_tokens
+        self.max_retries = max_retries
+        self.timings: List[Tuple[str, float]] = []   # 성공한 요청의 (모델, 요청~응답 초)
+
+    def _is_retryable(self, error) -> bool:
+        anthropic = self._anthropic
+        if isinstance(error, (anthropic.APIConnectionError, anthropic.APITimeoutError)):
+            return True
+        return isinstance(error, anthropic.APIStatusError) and error.status_code in RETRY_STATUS
+
+    async def complete(self, prompt: str, on_item: Optional[Callable] = None,
+                       model: Optional[str] = None) -> str:
+        """프롬프트 하나를 보내고 응답 텍스트를 반환합니다.
+
+        on_item이 있으면 스트리밍으로 받으며, 응답의 JSON 배열 항목이 닫힐 때마다 on_item(항목)을
+        호출합니다. 재시도하면 같은 항목이 다시 올 수 있으므로 받는 쪽에서 index로 합쳐야 합니다.
+        model을 넘기면 이 요청만 그 모델로 보냅니다 (없으면 self.model).
+
+        Raises:
+            anthropic.APIError: 재시도할 수 없는 오류이거나 재시도를 모두 실패한 경우
+        """
+        model = model or self.model
+        estimated = estimate_tokens(prompt)
+        async with self.limiter.semaphore():
+            for attempt in range(self.max_retries + 1):
+                await self.limiter.acquire(estimated)
+                started = time.monotonic()
+                try:
+                    if on_item is None:
+                        response = await self.client.messages.create(
+                            model=model,
+                            max_tokens=self.max_tokens,
+                            messages=[{"role": "user", "content": prompt}],
+                        )
+                    else:
+                        response = await self._stream(prompt, on_item, model)
+                except self._anthropic.APIError as e:
+                    if attempt == self.max_retries or not self._is_retryable(e):
+                        raise
+                    delay = backoff_delay(attempt, _retry_after(e))
+                    status = getattr(e, 'status_code', type(e).__name__)
+                    print(f"    ↻ {status} — {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                    await asyncio.sleep(delay)
+                    continue
+
+                self.timings.append((model, time.monotonic() - started))
+                # 실제 사용량과 추정치의 차이를 토큰 버킷에 반영
+                usage = getattr(response, 'usage', None)
+                if usage is not None:
+                    actual = (usage.input_tokens or 0) + (usage.output_tokens or 0)
+                    self.limiter.tokens.charge(actual - estimated)
+                if getattr(response, 'stop_reason', None) == 'max_tokens':
+                    print(f"    ⚠ 응답이 max_tokens({self.max_tokens})에서 잘렸습니다")
+                return ''.join(
+                    block.text for block in response.content if getattr(block, 'type', '') == 'text'
+                )
+
+    async def _stream(self, prompt: str, on_item: Callable, model: str):
+        """스트리밍으로 요청하고 JSON 항목이 닫힐 때마다 on_item을 호출합니다. 최종 메시지를 반환합니다."""
+        items = JSONItemStream()
+        async with self.client.messages.stream(
+            model=model,
+            max_tokens=self.max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            async for text in stream.text_stream:
+                for item in items.feed(text):
+                    on_item(item)
+            return await stream.get_final_message()
+
+    async def complete_all(self, prompts: List[str], on_done: Optional[Callable] = None,
+                           on_item: Optional[Callable] = None,
+                           models: Optional[List[Optional[str]]] = None) -> List[Union[str, BaseException]]:
+        """여러 프롬프트를 한도 안에서 동시에 보냅니다.
+
+        입력 순서대로 응답 텍스트를 반환하며, 실패한 항목은 예외 객체가 들어갑니다.
+        on_done(번호, 결과)는 요청 하나가 끝날 때마다 호출됩니다 (진행 상황 출력용).
+        on_item(번호, 항목)을 넘기면 스트리밍으로 받아 JSON 항목이 닫힐 때마다 호출합니다.
+        models(프롬프트별 모델, None이면 self.model)를 넘기면 프롬프트마다 다른 모델로 보냅니다.
+        """
+        async def run(i: int, prompt: str):
+            try:
+                result = await self.complete(
+                    prompt, on_item=(lambda item: on_item(i, item)) if on_item else None,
+                    model=models[i] if models else None)
+            except Exception as e:
+                result = e
+            if on_done:
+                on_done(i, result)
+            return result
+
+        return await asyncio.gather(*(run(i, p) for i, p in enumerate(prompts)))
+
+    async def aclose(self) -> None:
+        await self.client.close()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk claude CLI 상주 워커 (stream-json)
+
+`claude -p 프롬프트`를 배치마다 새로 실행하면 프로세스 시작 비용과 긴 규칙 프롬프트를
+매번 다시 냅니다. 이 모듈은 claude를 스트리밍 JSON 입출력 모드로 띄워 두고
+배치를 메시지로 하나씩 보내 응답을 받습니다.
+
+    claude -p --input-format stream-json --output-format stream-json --verbose \\
+           --include-partial-messages --append-system-prompt 규칙
+
+- 규칙(시스템 프롬프트)은 프로세스를 띄울 때 한 번만 넘기고, 메시지에는 배치 입력만 넣습니다.
+- 입력: 한 줄에 하나 {"type": "user", "message": {"role": "user", "content": "..."}}
+- 출력: 한 줄에 하나의 이벤트. {"type": "result"} 이벤트가 메시지 하나의 응답입니다.
+  응답 텍스트 조각(stream_event의 text_delta)도 받아 두므로, 시간이 초과되면 그때까지 받은
+  부분 응답을 돌려줍니다 (닫힌 JSON 항목은 json_stream으로 살릴 수 있음).
+- 대화 기록이 쌓이면 매 턴 입력이 길어지므로 max_turns 턴마다 프로세스를 새로 띄웁니다.
+- 시간 초과나 오류가 나면 그 프로세스는 버리고 다음 요청에서 새로 띄웁니다.
+- model을 넘기면 --model로 모델을 지정합니다 (없으면 CLI 기본 모델).
+
+scripts/fake_claude_cli.py로 실제 claude 없이 시험/벤치마크할 수 있습니다.
+
+사용 예:
+    with ClaudeWorkerPool(size=2, system_prompt=rules) as pool:
+        text = pool.run("INDEX=1 TEXT=...")
+"""
+
+import json
+import logging
+import queue
+import subprocess
+import threading
+import time
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TURNS = 8
+
+_EOF = object()
+
+
+class ClaudeWorker:
+    """stream-json 모드로 상주하는 claude 프로세스 하나 (한 번에 한 스레드에서 사용)"""
+
+    def __init__(self, system_prompt: str, timeout: float = 120.0,
+                 max_turns: int = DEFAULT_MAX_TURNS, command: str = 'claude', model: Optional[str] = None):
+        self.system_prompt = system_prompt
+        self.timeout = timeout
+        self.max_turns = max_turns
+        self.command = command
+        self.model = model
+        self.proc = None
+        self.turns = 0
+        self.started = 0   # 프로세스를 띄운 횟수
+        self._lines = None
+
+    def _start(self) -> None:
+        self.proc = subprocess.Popen(
+            [self.command, '-p', '--input-format', 'stream-json', '--output-format', 'stream-json',
+             '--verbose', '--include-partial-messages', '--append-system-prompt', self.system_prompt]
+            + (['--model', self.model] if self.model else []),
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8', bufsize=1,
+        )
+        self._lines = queue.Queue()
+        threading.Thread(target=self._read, args=(self.proc.stdout, self._lines), daemon=True).start()
+        self.turns = 0
+        self.started += 1
+
+    @staticmethod
+    def _read(stream, lines: queue.Queue) -> None:
+        for line in stream:
+            lines.put(line)
+        lines.put(_EOF)
+
+    def ask(self, message: str) -> Optional[str]:
+        """메시지 하나를 보내고 응답 텍스트를 반환합니다.
+
+        실패하면 None, 시간이 초과되면 그때까지 받은 부분 응답(없으면 None)을 반환합니다.
+        """
+        if self.proc is None or self.proc.poll() is not None or self.turns >= self.max_turns:
+            self.close()
+            self._start()
+
+        try:
+            self.proc.stdin.write(json.dumps(
+                {'type': 'user', 'message': {'role': 'user', 'content': message}},
+                ensure_ascii=False) + '\n')
+            self.proc.stdin.flush()
+        except OSError as e:
+            logger.warning(f"claude 워커에 쓰기 실패: {e}")
+            self.close()
+            return None
+        self.turns += 1
+
+        partial = []
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                # 늦게 온 응답이 다음 메시지의 응답으로 읽히지 않도록 프로세스를 버림
+                print(f"    ✗ claude 응답 시간 초과 ({self.timeout:.0f}초)"
+                      + (f", 부분 응답 {sum(map(len, partial))}글자 사용" if partial else ""))
+                self.close()
+                return ''.join(partial) or None
+            if line is _EOF:
+                print("    ✗ claude 워커가 종료되었습니다")
+                self.close()
+                return None
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if event.get('type') == 'stream_event':
+                delta = event.get('event', {}).get('delta', {})
+                if delta.get('type') == 'text_delta':
+                    partial.append(delta.get('text', ''))
+                continue
+            if event.get('type') != 'result':
+                continue
+            if event.get('is_error') or event.get('subtype', 'success') != 'success':
+                print(f"    ✗ claude 실행 실패: {str(event.get('result', event.get('subtype')))[:200]}")
+                return None
+            return event.get('result', '')
+
+    def close(self) -> None:
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+        self.proc = None
+
+
+class ClaudeWorkerPool:
+    """ClaudeWorker 여러 개를 스레드에서 나눠 쓰는 풀. run()은 여러 스레드에서 동시에 호출할 수 있습니다."""
+
+    def __init__(self, size: int, system_prompt: str, timeout: float = 120.0,
+                 max_turns: int = DEFAULT_MAX_TURNS, command: str = 'claude', model: Optional[str] = None):
+        self.workers: List[ClaudeWorker] = [
+            ClaudeWorker(system_prompt, timeout, max_turns, command, model) for _ in range(max(1, size))
+        ]
+        self._idle = queue.Queue()
+        for worker in self.workers:
+            self._idle.put(worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def run(self, message: str) -> Optional[str]:
+        worker = self._idle.get()
+        try:
+            return worker.ask(message)
+        finally:
+            self._idle.put(worker)
+
+    @property
+    def processes_started(self) -> int:
+        return sum(w.started for w in self.workers)
+
+    def close(self) -> None:
+        for worker in self.workers:
+            worker.close()
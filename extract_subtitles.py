@@ -10,6 +10,7 @@ MovieTalk 자막 추출 스크립트
 주요 기능:
 - youtube-transcript-api를 사용한 자막 추출 (1차 시도)
 - yt-dlp CLI를 사용한 자막 추출 (2차 폴백)
+- 헤지 모드: 1차가 늦으면 일정 시간 뒤 2차를 동시에 시작해 먼저 성공한 결과 사용
 - 한글, 영어 자막 자동 감지
 - 자동 생성 자막 지원
 - 구조화된 JSON 출력
@@ -19,33 +20,79 @@ import json
 import argparse
 import logging
 import os
+import queue
 import re
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import glob
+from collections import namedtuple
 from pathlib import Path
-from typing import List, Dict, Optional
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('extract_subtitles.log', encoding='utf-8')
-    ]
-)
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sentence_segmenter import segment_sentences
+from subtitle_parser import iter_subtitle_file
+from transcript_cache import NO_TRANSCRIPT, TranscriptCache
+
+# 로깅 설정은 실행 진입점(main, movietalk.py)에서만 합니다
 logger = logging.getLogger(__name__)
 
+# yt-dlp로 받은 자막 파일 하나 (_select_track에 넘기기 위한 형태)
+_SubtitleTrack = namedtuple('_SubtitleTrack', ['language_code', 'is_generated', 'path'])
+
+
+class _NoTrack:
+    """자막 추출 방법이 "이 영상에는 자막이 없다"를 확인한 결과.
+
+    None(네트워크 오류, 429, 타임아웃, 도구 없음 등 다시 시도할 만한 실패)처럼 거짓으로 평가되지만,
+    _fetch_raw는 이 값일 때만 "자막 없음"을 캐시합니다.
+    """
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return 'NO_TRACK'
+
+
+NO_TRACK = _NoTrack()
+
+
+def _is_no_transcript_error(e: Exception) -> bool:
+    """youtube-transcript-api의 자막 없음/자막 꺼짐 예외인지 (일시적 오류와 구분)"""
+    try:
+        from youtube_transcript_api import NoTranscriptFound, TranscriptsDisabled
+    except ImportError:
+        return False
+    return isinstance(e, (NoTranscriptFound, TranscriptsDisabled))
+
 
 class SubtitleExtractor:
     """유튜브 영상에서 자막을 추출하는 클래스"""
 
-    def __init__(self, cookies_from_browser: str = None, cookies_file: str = None):
+    def __init__(self, cookies_from_browser: str = None, cookies_file: str = None,
+                 cache=None, refresh_cache: bool = False, ytdlp_single_pass: bool = True,
+                 hedge_delay: Optional[float] = None):
+        """
+        Args:
+            cookies_from_browser: yt-dlp에 넘길 브라우저 쿠키 (예: chrome)
+            cookies_file: yt-dlp에 넘길 쿠키 파일 경로
+            cache: 원본 자막 캐시 (transcript_cache.TranscriptCache). None이면 캐시하지 않음
+            refresh_cache: True면 캐시를 읽지 않고 새로 받아 덮어씁니다
+            ytdlp_single_pass: True면 yt-dlp를 한 번만 호출해 모든 후보 트랙을 받습니다
+            hedge_delay: None이면 youtube-transcript-api → yt-dlp 순서대로 시도합니다.
+                숫자면 youtube-transcript-api가 그 시간(초) 안에 끝나지 않을 때 yt-dlp를
+                동시에 시작하고 먼저 성공한 결과를 씁니다 (0이면 처음부터 동시에)
+        """
         self.subtitles_data = []
         self.cookies_from_browser = cookies_from_browser
         self.cookies_file = cookies_file
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+        self.ytdlp_single_pass = ytdlp_single_pass
+        self.hedge_delay = hedge_delay
 
     @staticmethod
     def _extract_video_id(url: str) -> Optional[str]:
@@ -78,10 +125,12 @@ class SubtitleExtractor:
                 return True
         return False
 
-    def _try_youtube_transcript_api(self, video_id: str) -> Optional[List[Dict]]:
+    def _try_youtube_transcript_api(self, video_id: str) -> Optional[Tuple[List[Dict], Dict]]:
         """
         방법 1: youtube-transcript-api 사용 (가장 안정적)
         v1.x (인스턴스 기반) 과 v0.x (클래스 메서드 기반) 모두 지원.
+
+        Returns: (자막 목록, 트랙 정보), 자막이 없다고 확인되면 NO_TRACK, 그 밖의 실패는 None
         """
         try:
             from youtube_transcript_api import YouTubeTranscriptApi
@@ -103,9 +152,9 @@ class SubtitleExtractor:
 
         except Exception as e:
             logger.warning(f"youtube-transcript-api 실패: {e}")
-            return None
+            return NO_TRACK if _is_no_transcript_error(e) else None
 
-    def _transcript_api_v1(self, ApiClass, video_id: str) -> Optional[List[Dict]]:
+    def _transcript_api_v1(self, ApiClass, video_id: str) -> Optional[Tuple[List[Dict], Dict]]:
         """youtube-transcript-api v1.x (인스턴스 기반 API)"""
         logger.info("  API 버전: v1.x (인스턴스 기반)")
         api = ApiClass()
@@ -120,69 +169,71 @@ class SubtitleExtractor:
             return self._transcript_api_v1_direct_fetch(api, video_id)
 
         # 우선순위에 따라 자막 선택
-        selected = None
-        for t in transcript_list:
-            if t.language_code.startswith('en') and not t.is_generated:
-                selected = t
-                logger.info(f"  선택: 수동 영어 ({t.language_code})")
-                break
-
-        if not selected:
-            for t in transcript_list:
-                if t.language_code == 'ko' and not t.is_generated:
-                    selected = t
-                    logger.info(f"  선택: 수동 한국어")
-                    break
-
-        if not selected:
-            for t in transcript_list:
-                if t.language_code.startswith('en') and t.is_generated:
-                    selected = t
-                    logger.info(f"  선택: 자동 생성 영어 ({t.language_code})")
-                    break
-
-        if not selected:
-            for t in transcript_list:
-                if t.language_code == 'ko' and t.is_generated:
-                    selected = t
-                    logger.info(f"  선택: 자동 생성 한국어")
-                    break
-
-        if not selected:
-            # 아무 자막이나 선택
-            for t in transcript_list:
-                selected = t
-                logger.info(f"  선택: {t.language_code} (기타)")
-                break
-
+        selected = self._select_track(list(transcript_list))
         if not selected:
             logger.warning("  적절한 자막을 찾지 못했습니다.")
-            return None
+            return NO_TRACK
 
         # 자막 fetch
         raw_data = selected.fetch()
-        return self._parse_transcript_snippets(raw_data)
+        return self._with_track(
+            self._parse_transcript_snippets(raw_data),
+            selected.language_code, 'transcript-api-v1', selected.is_generated,
+        )
 
-    def _transcript_api_v1_direct_fetch(self, api, video_id: str) -> Optional[List[Dict]]:
-        """목록 조회 실패 시 직접 fetch 시도 (v1.x)"""
+    @staticmethod
+    def _select_track(tracks: list):
+        """자막 트랙 우선순위: 수동 영어 > 수동 한국어 > 자동 영어 > 자동 한국어 > 기타.
+
+        tracks의 각 항목은 language_code, is_generated 속성을 가져야 합니다.
+        """
+        priorities = [
+            (lambda t: t.language_code.startswith('en') and not t.is_generated, "수동 영어"),
+            (lambda t: t.language_code == 'ko' and not t.is_generated, "수동 한국어"),
+            (lambda t: t.language_code.startswith('en') and t.is_generated, "자동 생성 영어"),
+            (lambda t: t.language_code == 'ko' and t.is_generated, "자동 생성 한국어"),
+            (lambda t: True, "기타"),
+        ]
+        for matches, desc in priorities:
+            for t in tracks:
+                if matches(t):
+                    logger.info(f"  선택: {desc} ({t.language_code})")
+                    return t
+        return None
+
+    def _transcript_api_v1_direct_fetch(self, api, video_id: str) -> Optional[Tuple[List[Dict], Dict]]:
+        """목록 조회 실패 시 직접 fetch 시도 (v1.x)
+
+        모든 시도가 자막 없음/자막 꺼짐 예외로 실패했을 때만 NO_TRACK을 반환합니다.
+        """
+        confirmed = True
         for langs in [['en'], ['en-US'], ['ko']]:
             try:
                 logger.info(f"  직접 fetch 시도: {langs}")
                 raw_data = api.fetch(video_id, languages=langs)
-                return self._parse_transcript_snippets(raw_data)
-            except Exception:
+                return self._with_track(
+                    self._parse_transcript_snippets(raw_data),
+                    getattr(raw_data, 'language_code', langs[0]), 'transcript-api-v1',
+                    getattr(raw_data, 'is_generated', None),
+                )
+            except Exception as e:
+                confirmed = confirmed and _is_no_transcript_error(e)
                 continue
 
         # 언어 지정 없이 기본 자막 시도
         try:
             logger.info("  기본 자막 fetch 시도...")
             raw_data = api.fetch(video_id)
-            return self._parse_transcript_snippets(raw_data)
+            return self._with_track(
+                self._parse_transcript_snippets(raw_data),
+                getattr(raw_data, 'language_code', ''), 'transcript-api-v1',
+                getattr(raw_data, 'is_generated', None),
+            )
         except Exception as e:
             logger.warning(f"  직접 fetch 실패: {e}")
-            return None
+            return NO_TRACK if confirmed and _is_no_transcript_error(e) else None
 
-    def _transcript_api_v0(self, ApiClass, video_id: str) -> Optional[List[Dict]]:
+    def _transcript_api_v0(self, ApiClass, video_id: str) -> Optional[Tuple[List[Dict], Dict]]:
         """youtube-transcript-api v0.x (클래스 메서드 기반 API)"""
         logger.info("  API 버전: v0.x (클래스 메서드 기반)")
 
@@ -190,7 +241,7 @@ class SubtitleExtractor:
             transcript_list = ApiClass.list_transcripts(video_id)
         except Exception as e:
             logger.warning(f"  자막 목록 조회 실패: {e}")
-            return None
+            return NO_TRACK if _is_no_transcript_error(e) else None
 
         transcript = None
         for find_fn, desc in [
@@ -207,10 +258,27 @@ class SubtitleExtractor:
                 continue
 
         if not transcript:
-            return None
+            # 목록은 받았지만 영어/한국어 트랙이 없음
+            return NO_TRACK
 
         raw_data = transcript.fetch()
-        return self._parse_transcript_entries(raw_data)
+        return self._with_track(
+            self._parse_transcript_entries(raw_data),
+            transcript.language_code, 'transcript-api-v0', transcript.is_generated,
+        )
+
+    @staticmethod
+    def _with_track(subtitles: Optional[List[Dict]], language: str, source: str,
+                    generated: Optional[bool]) -> Optional[Tuple[List[Dict], Dict]]:
+        """자막 목록에 트랙 정보(언어, 소스, 자동 생성 여부)를 붙입니다."""
+        if not subtitles:
+            return None
+        return subtitles, {'language': language, 'source': source, 'generated': generated}
+
+    @staticmethod
+    def _has_word_timings(cues: List[Dict]) -> bool:
+        """단어별 타임스탬프(word_starts)가 있는지. YouTube 자동 생성 VTT에만 있으므로 자동 자막의 근거로 씁니다."""
+        return any('word_starts' in c for c in cues)
 
     def _parse_transcript_snippets(self, raw_data) -> List[Dict]:
         """v1.x FetchedTranscriptSnippet 객체 리스트를 파싱합니다."""
@@ -257,10 +325,21 @@ class SubtitleExtractor:
         logger.info(f"  자막 추출 완료: {len(subtitles)}개")
         return subtitles if subtitles else None
 
-    def _try_ytdlp_cli(self, youtube_url: str) -> Optional[List[Dict]]:
+    def _try_ytdlp_cli(self, youtube_url: str,
+                       cancel: Optional[threading.Event] = None) -> Optional[Tuple[List[Dict], Dict]]:
         """
         방법 2: yt-dlp CLI를 subprocess로 호출 (Python API보다 안정적)
+
+        ytdlp_single_pass면 한 번의 호출로 모든 후보 트랙을 받고,
+        아니면 조합을 바꿔 가며 최대 4번 호출합니다.
+        cancel이 set되면 실행 중인 yt-dlp 프로세스를 종료하고 None을 반환합니다.
+
+        Returns: (자막 목록, 트랙 정보), yt-dlp가 모든 시도를 정상 종료했는데 자막 파일이 없으면
+            NO_TRACK, 그 밖의 실패(yt-dlp 없음, 오류 종료, 타임아웃, 취소)는 None
         """
+        if self.ytdlp_single_pass:
+            return self._try_ytdlp_single_pass(youtube_url, cancel)
+
         temp_dir = tempfile.mkdtemp(prefix='movietalk_subs_')
 
         try:
@@ -284,15 +363,17 @@ class SubtitleExtractor:
                 logger.warning("yt-dlp를 찾을 수 없습니다. (CLI 및 python -m 모두 실패)")
                 return None
 
-            # 여러 조합으로 시도
+            # 여러 조합으로 시도 (generated: 자동 생성 여부, 둘 다 요청하면 알 수 없음)
             attempts = [
-                ("자동+수동 영어 자막", ['--write-auto-sub', '--write-sub', '--sub-lang', 'en']),
-                ("자동 영어 자막", ['--write-auto-sub', '--sub-lang', 'en']),
-                ("수동 영어 자막", ['--write-sub', '--sub-lang', 'en']),
-                ("자동+수동 한국어 자막", ['--write-auto-sub', '--write-sub', '--sub-lang', 'ko']),
+                ("자동+수동 영어 자막", ['--write-auto-sub', '--write-sub', '--sub-lang', 'en'], None),
+                ("자동 영어 자막", ['--write-auto-sub', '--sub-lang', 'en'], True),
+                ("수동 영어 자막", ['--write-sub', '--sub-lang', 'en'], False),
+                ("자동+수동 한국어 자막", ['--write-auto-sub', '--write-sub', '--sub-lang', 'ko'], None),
             ]
 
-            for desc, extra_opts in attempts:
+            # 모든 시도가 정상 종료(returncode 0)했는데 파일이 없어야 자막 없음으로 확인
+            confirmed = True
+            for desc, extra_opts, generated in attempts:
                 cmd = ytdlp_cmd + [
                     '--skip-download',
                     '--sub-format', 'vtt/srt/best',
@@ -300,15 +381,15 @@ class SubtitleExtractor:
                 ] + extra_opts
 
                 # 쿠키 옵션 추가
-                if self.cookies_from_browser:
-                    cmd += ['--cookies-from-browser', self.cookies_from_browser]
-                elif self.cookies_file:
-                    cmd += ['--cookies', self.cookies_file]
-
+                cmd += self._cookie_args()
                 cmd.append(youtube_url)
 
                 logger.info(f"  시도: {desc}")
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+                result = self._run_ytdlp(cmd, timeout=60, cancel=cancel)
+                if result is None:
+                    logger.info("  yt-dlp CLI: 취소됨")
+                    return None
+                confirmed = confirmed and result.returncode == 0
 
                 # 다운로드된 자막 파일 확인
                 sub_files = (
@@ -318,14 +399,89 @@ class SubtitleExtractor:
 
                 if sub_files:
                     logger.info(f"  성공! 파일: {sub_files[0]}")
-                    return self._parse_subtitle_file(sub_files[0])
+                    return self._with_track(
+                        self._parse_subtitle_file(sub_files[0]),
+                        self._subtitle_file_language(sub_files[0]), 'yt-dlp', generated,
+                    )
 
                 # 다음 시도를 위해 temp_dir 비우기
                 for f in glob.glob(os.path.join(temp_dir, '*')):
                     os.remove(f)
 
             logger.warning("yt-dlp CLI: 모든 시도 실패")
+            return NO_TRACK if confirmed else None
+
+        except subprocess.TimeoutExpired:
+            logger.warning("yt-dlp CLI: 타임아웃")
             return None
+        except Exception as e:
+            logger.warning(f"yt-dlp CLI 실패: {e}")
+            return None
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _try_ytdlp_single_pass(self, youtube_url: str,
+                               cancel: Optional[threading.Event] = None) -> Optional[Tuple[List[Dict], Dict]]:
+        """yt-dlp를 한 번만 실행해 영어/한국어 수동·자동 자막을 모두 받은 뒤
+        _select_track과 같은 우선순위로 로컬에서 고릅니다."""
+        temp_dir = tempfile.mkdtemp(prefix='movietalk_subs_')
+
+        try:
+            logger.info("방법 2: yt-dlp CLI로 자막 추출 시도 (단일 호출)...")
+
+            ytdlp_cmd = self._find_ytdlp_cmd()
+            if not ytdlp_cmd:
+                logger.warning("yt-dlp를 찾을 수 없습니다. (CLI 및 python -m 모두 실패)")
+                return None
+
+            # --dump-json + --no-simulate: 자막 파일을 쓰면서 수동 자막 목록(subtitles)도 받음
+            cmd = ytdlp_cmd + [
+                '--skip-download',
+                '--write-auto-sub', '--write-sub',
+                '--sub-lang', 'en.*,ko',
+                '--sub-format', 'vtt/srt/best',
+                '--dump-json', '--no-simulate',
+                '-o', os.path.join(temp_dir, '%(id)s'),
+            ] + self._cookie_args() + [youtube_url]
+
+            result = self._run_ytdlp(cmd, timeout=120, cancel=cancel)
+            if result is None:
+                logger.info("  yt-dlp CLI: 취소됨")
+                return None
+
+            manual_langs = None
+            for line in reversed(result.stdout.splitlines()):
+                try:
+                    manual_langs = set(json.loads(line).get('subtitles') or {})
+                    break
+                except (json.JSONDecodeError, AttributeError):
+                    continue
+
+            tracks = [
+                _SubtitleTrack(
+                    language_code=self._subtitle_file_language(path),
+                    # 목록을 못 받았으면 수동 여부를 알 수 없음
+                    is_generated=None if manual_langs is None
+                    else self._subtitle_file_language(path) not in manual_langs,
+                    path=path,
+                )
+                for path in sorted(
+                    glob.glob(os.path.join(temp_dir, '*.vtt')) +
+                    glob.glob(os.path.join(temp_dir, '*.srt'))
+                )
+            ]
+            if not tracks:
+                logger.warning(f"yt-dlp CLI: 자막 파일 없음 {result.stderr.strip()[-200:]}")
+                # 정상 종료하고 영상 정보까지 받았으면 자막이 없는 영상
+                return NO_TRACK if result.returncode == 0 and manual_langs is not None else None
+
+            logger.info(f"  받은 자막: {[t.language_code for t in tracks]}")
+            selected = self._select_track(tracks)
+            return self._with_track(
+                self._parse_subtitle_file(selected.path),
+                selected.language_code, 'yt-dlp', selected.is_generated,
+            )
 
         except subprocess.TimeoutExpired:
             logger.warning("yt-dlp CLI: 타임아웃")
@@ -337,15 +493,62 @@ class SubtitleExtractor:
             import shutil
             shutil.rmtree(temp_dir, ignore_errors=True)
 
-    def _parse_subtitle_file(self, filepath: str) -> List[Dict]:
-        """자막 파일을 파싱합니다."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+    @staticmethod
+    def _find_ytdlp_cmd() -> Optional[List[str]]:
+        """프로세스를 띄우지 않고 yt-dlp 실행 명령을 찾습니다 (CLI 우선, 없으면 python -m)."""
+        import shutil
+        import importlib.util
+
+        if shutil.which('yt-dlp'):
+            return ['yt-dlp']
+        if importlib.util.find_spec('yt_dlp'):
+            return [sys.executable, '-m', 'yt_dlp']
+        return None
 
-        if filepath.endswith('.vtt'):
-            return self._parse_vtt_content(content)
-        else:
-            return self._parse_srt_content(content)
+    @staticmethod
+    def _run_ytdlp(cmd: List[str], timeout: float,
+                   cancel: Optional[threading.Event] = None) -> Optional[subprocess.CompletedProcess]:
+        """subprocess.run(capture_output=True, text=True)과 같지만 cancel로 중단할 수 있습니다.
+
+        cancel이 set되면 프로세스를 종료하고 None을 반환합니다.
+
+        Raises:
+            subprocess.TimeoutExpired: timeout 초 안에 끝나지 않은 경우
+        """
+        if cancel is None:
+            return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=0.2)
+                return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+            except subprocess.TimeoutExpired:
+                if cancel.is_set() or time.monotonic() > deadline:
+                    proc.kill()
+                    proc.communicate()
+                    if cancel.is_set():
+                        return None
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+
+    def _cookie_args(self) -> List[str]:
+        """yt-dlp 쿠키 옵션"""
+        if self.cookies_from_browser:
+            return ['--cookies-from-browser', self.cookies_from_browser]
+        if self.cookies_file:
+            return ['--cookies', self.cookies_file]
+        return []
+
+    @staticmethod
+    def _subtitle_file_language(filepath: str) -> str:
+        """yt-dlp 자막 파일명({id}.{언어}.vtt)에서 언어 코드를 꺼냅니다."""
+        parts = os.path.basename(filepath).split('.')
+        return parts[-2] if len(parts) >= 3 else ''
+
+    def _parse_subtitle_file(self, filepath: str) -> List[Dict]:
+        """자막 파일을 한 줄씩 스트리밍 파싱합니다 (subtitle_parser 참고)."""
+        return list(iter_subtitle_file(filepath, word_times=True))
 
     def _parse_timestamp(self, timestamp_str: str) -> float:
         """자막 타임스탬프를 초 단위로 변환합니다."""
@@ -361,7 +564,7 @@ class SubtitleExtractor:
             return 0.0
 
     def _parse_srt_content(self, content: str) -> List[Dict]:
-        """SRT 형식 파싱"""
+        """SRT 형식 파싱 (문자열 전체 대상 정규식 버전, 파일은 _parse_subtitle_file 사용)"""
         subtitles = []
         pattern = r'(\d+)\n(\d{2}:\d{2}:\d{2}[.,]\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2}[.,]\d{3})\n([\s\S]*?)(?=\n\n|\Z)'
         for match in re.finditer(pattern, content):
@@ -378,7 +581,7 @@ class SubtitleExtractor:
         return subtitles
 
     def _parse_vtt_content(self, content: str) -> List[Dict]:
-        """VTT 형식 파싱"""
+        """VTT 형식 파싱 (문자열 전체 대상 정규식 버전, 파일은 _parse_subtitle_file 사용)"""
         subtitles = []
         if 'WEBVTT' in content:
             parts = content.split('\n\n', 1)
@@ -401,194 +604,8 @@ class SubtitleExtractor:
         return subtitles
 
     def _fix_sentence_boundaries(self, subtitles: List[Dict]) -> List[Dict]:
-        """자막을 문장 단위로 재분할합니다.
-
-        YouTube 자막은 시간 기반으로 잘려 문장 중간에서 끊기는 경우가 많습니다.
-        이 함수는 문장 부호(. ! ?)를 기준으로 자막을 재분할하여
-        문장 경계와 자막 경계가 일치하도록 보정합니다.
-
-        - 구두점 비율 30% 미만이면 보정을 건너뜁니다 (자동 생성 자막 등).
-        - 1~2단어 조각은 인접 자막에 합칩니다.
-        - 20단어 초과 문장은 쉼표/접속사에서 분리합니다.
-        """
-        if not subtitles or len(subtitles) < 2:
-            return subtitles
-
-        # 구두점이 있는 자막 비율 확인 — 너무 낮으면 보정 불가
-        punctuated = sum(
-            1 for s in subtitles
-            if re.search(r'[.!?]["\'\u201d\u2019)]*$', s['text'].strip())
-        )
-        ratio = punctuated / len(subtitles)
-        if ratio < 0.3:
-            logger.info(f"  문장 부호 비율 {ratio:.0%} — 문장 보정 건너뜀")
-            return subtitles
-
-        # 1. 워드 레벨 타임라인 구축 (non-breaking space 정규화)
-        word_times = []  # (word, start, end)
-        for sub in subtitles:
-            text = sub['text'].replace('\xa0', ' ')
-            words = text.split()
-            if not words:
-                continue
-            dur = sub['end'] - sub['start']
-            per_word = dur / len(words)
-            for i, w in enumerate(words):
-                ws = sub['start'] + i * per_word
-                we = sub['start'] + (i + 1) * per_word
-                word_times.append((w, ws, we))
-
-        if not word_times:
-            return subtitles
-
-        # 2. 문장 경계 탐지
-        ABBREVS = {
-            'Mr.', 'Mrs.', 'Ms.', 'Dr.', 'St.', 'Jr.', 'Sr.', 'Prof.',
-            'vs.', 'etc.', 'i.e.', 'e.g.', 'U.S.', 'U.K.', 'a.m.', 'p.m.',
-            'Mt.', 'Ft.', 'Lt.', 'Gen.', 'Gov.', 'Sgt.', 'Inc.', 'Ltd.',
-            'Corp.', 'Co.', 'Dept.', 'Univ.', 'Ave.', 'Blvd.', 'No.',
-        }
-
-        boundaries = []  # 문장이 끝나는 워드 인덱스
-        for i, (word, _, _) in enumerate(word_times):
-            # 문장 종결 부호 확인 (.!?), 닫는 따옴표/괄호 포함
-            stripped = word.rstrip('"\'\u201d\u2019)')
-            if not re.search(r'[.!?]$', stripped):
-                continue
-
-            # 약어 제외
-            if stripped in ABBREVS or word in ABBREVS:
-                continue
-
-            # 이니셜 (A. B. 등) 제외
-            if re.match(r'^[A-Z]\.$', stripped):
-                continue
-
-            # 소수점 제외 (3.5, $10.99 등)
-            if re.match(r'^[\$€£¥]?\d+\.\d*$', stripped):
-                continue
-
-            # 줄임표(...) — 다음 단어가 대문자면 문장 끝으로 처리
-            if stripped.endswith('...'):
-                if i + 1 < len(word_times):
-                    nxt = word_times[i + 1][0].lstrip('"\u201c\u2018(')
-                    if nxt and nxt[0].isupper():
-                        boundaries.append(i)
-                continue
-
-            # !나 ?는 거의 항상 문장 끝
-            if stripped[-1] in '!?':
-                boundaries.append(i)
-                continue
-
-            # . 의 경우: 다음 단어가 대문자면 문장 끝
-            if i + 1 < len(word_times):
-                nxt = word_times[i + 1][0].lstrip('"\u201c\u2018(')
-                if nxt and nxt[0].isupper():
-                    boundaries.append(i)
-            else:
-                # 마지막 단어
-                boundaries.append(i)
-
-        if not boundaries:
-            return subtitles
-
-        # 마지막 단어가 경계에 없으면 추가
-        if boundaries[-1] != len(word_times) - 1:
-            boundaries.append(len(word_times) - 1)
-
-        # 3. 문장 생성
-        sentences = []
-        start_idx = 0
-        for end_idx in boundaries:
-            if end_idx < start_idx:
-                continue
-            words = [word_times[j][0] for j in range(start_idx, end_idx + 1)]
-            sentences.append({
-                'text': ' '.join(words),
-                'start': word_times[start_idx][1],
-                'end': word_times[end_idx][2],
-            })
-            start_idx = end_idx + 1
-
-        if not sentences:
-            return subtitles
-
-        # 4. 너무 짧은 문장(1~2단어)은 인접 문장에 합치기
-        merged = []
-        for sent in sentences:
-            wc = len(sent['text'].split())
-            if wc <= 2 and merged:
-                prev = merged[-1]
-                prev['text'] = prev['text'] + ' ' + sent['text']
-                prev['end'] = sent['end']
-            else:
-                merged.append(dict(sent))
-
-        # 첫 항목이 여전히 1~2단어면 다음에 합치기
-        if len(merged) >= 2 and len(merged[0]['text'].split()) <= 2:
-            merged[1]['text'] = merged[0]['text'] + ' ' + merged[1]['text']
-            merged[1]['start'] = merged[0]['start']
-            merged.pop(0)
-
-        sentences = merged
-
-        # 5. 너무 긴 문장(20단어 초과)은 절 단위로 분리
-        MAX_WORDS = 20
-        final = []
-        for sent in sentences:
-            words = sent['text'].split()
-            if len(words) <= MAX_WORDS:
-                final.append(sent)
-                continue
-
-            # 쉼표, 접속사 위치 탐색
-            split_candidates = []
-            for j, w in enumerate(words):
-                if j < 3 or j > len(words) - 3:
-                    continue
-                if w.endswith(','):
-                    split_candidates.append(j + 1)
-                elif w.lower() in ('and', 'but', 'or', 'so', 'because', 'when',
-                                   'while', 'if', 'though', 'although', 'since',
-                                   'where', 'which', 'before', 'after'):
-                    split_candidates.append(j)
-
-            if not split_candidates:
-                final.append(sent)
-                continue
-
-            # 중간 지점에 가장 가까운 분할점 선택
-            mid = len(words) // 2
-            best_pos = min(split_candidates, key=lambda p: abs(p - mid))
-
-            # 시간 분배 (워드 비율)
-            total_dur = sent['end'] - sent['start']
-            split_ratio = best_pos / len(words)
-            mid_time = sent['start'] + total_dur * split_ratio
-
-            final.append({
-                'text': ' '.join(words[:best_pos]),
-                'start': sent['start'],
-                'end': round(mid_time, 2),
-            })
-            final.append({
-                'text': ' '.join(words[best_pos:]),
-                'start': round(mid_time, 2),
-                'end': sent['end'],
-            })
-
-        # 6. 인덱스 재부여 및 시간 반올림
-        result = []
-        for i, s in enumerate(final):
-            result.append({
-                'index': i,
-                'start': round(s['start'], 2),
-                'end': round(s['end'], 2),
-                'text': s['text'],
-            })
-
-        return result
+        """자막을 문장 단위로 재분할합니다 (sentence_segmenter.segment_sentences 참고)."""
+        return segment_sentences(subtitles)
 
     def _merge_duplicate_subtitles(self, subtitles: List[Dict]) -> List[Dict]:
         """연속으로 같은 텍스트인 자막을 병합합니다."""
@@ -609,60 +626,280 @@ class SubtitleExtractor:
             sub['index'] = i
         return merged
 
+    @staticmethod
+    def _overlap_length(prev_words: List[str], curr_words: List[str]) -> int:
+        """prev_words의 접미사와 curr_words의 접두사가 겹치는 최대 단어 수.
+
+        KMP 접두사 함수로 계산하므로 두 목록 길이의 합에 비례하는 시간이 걸립니다.
+        """
+        m = min(len(prev_words), len(curr_words))
+        if not m:
+            return 0
+        seq = curr_words[:m] + [None] + prev_words[-m:]
+        pi = [0] * len(seq)
+        for i in range(1, len(seq)):
+            k = pi[i - 1]
+            while k and seq[i] != seq[k]:
+                k = pi[k - 1]
+            if seq[i] == seq[k]:
+                k += 1
+            pi[i] = k
+        return pi[-1]
+
+    def _dedupe_rolling_captions(self, subtitles: List[Dict], min_overlap: int = 2) -> List[Dict]:
+        """자동 생성 자막에서 이웃한 자막끼리 겹치는 텍스트와 시간을 잘라냅니다.
+
+        YouTube 자동 자막은 앞 자막의 끝부분을 다음 자막 앞에 다시 보여주고(rolling),
+        시간도 다음 자막과 겹치게 잡습니다.
+        - 앞 자막 끝과 현재 자막 앞이 min_overlap 단어 이상 같으면 현재 자막에서 잘라냄
+          (rolling이라는 근거가 있을 때만: 현재 자막이 앞 자막이 끝나기 전에 시작하거나 word_starts가 있음.
+          시간이 겹치지 않는 반복 문장은 연습 영상의 실제 대사일 수 있으므로 그대로 둠)
+        - 잘라낸 뒤 남는 단어가 없으면 현재 자막을 버리고 앞 자막 시간을 늘림
+        - 현재 자막이 앞 자막이 끝나기 전에 시작하면 앞 자막의 end를 당김
+        """
+        if not subtitles:
+            return subtitles
+
+        punct = '.,!?;:"\'()[]-\u2026\u201c\u201d\u2018\u2019'
+        result = []
+        prev_norm = []
+        for sub in subtitles:
+            words = sub['text'].split()
+            norm = [w.lower().strip(punct) for w in words]
+
+            k = 0
+            if result and (sub['start'] < result[-1]['end'] or sub.get('word_starts')):
+                k = self._overlap_length(prev_norm, norm)
+                if k < min_overlap:
+                    k = 0
+                elif k == len(words):
+                    result[-1]['end'] = max(result[-1]['end'], sub['end'])
+                    continue
+                words, norm = words[k:], norm[k:]
+
+            cue = dict(sub)
+            cue['text'] = ' '.join(words)
+            if k and cue.get('word_starts'):
+                # 남은 단어의 실제 시작 시간이 있으면 자막 시작도 거기에 맞춤
+                cue['word_starts'] = cue['word_starts'][k:]
+                cue['start'] = max(cue['start'], cue['word_starts'][0])
+            if result and cue['start'] < result[-1]['end']:
+                result[-1]['end'] = cue['start']
+            result.append(cue)
+            prev_norm = norm
+
+        for i, sub in enumerate(result, 1):
+            sub['index'] = i
+        return result
+
     def extract(self, youtube_url: str, fix_sentences: bool = True) -> List[Dict]:
         """
         유튜브 영상에서 자막을 추출합니다.
         3가지 방법을 순서대로 시도:
         1. youtube-transcript-api (가장 안정적)
         2. yt-dlp CLI (subprocess)
+        hedge_delay가 있으면 1이 늦을 때 2를 동시에 시작합니다 (_fetch_hedged 참고).
 
         Args:
             youtube_url: 유튜브 영상 URL
             fix_sentences: True면 문장 단위로 자막 경계를 보정합니다
         """
-        if not self._validate_youtube_url(youtube_url):
-            logger.error("유효하지 않은 유튜브 URL입니다.")
+        try:
+            self.subtitles_data = self._extract_one(youtube_url, fix_sentences)
+        except (ValueError, RuntimeError) as e:
+            logger.error(str(e))
             return []
+        return self.subtitles_data
+
+    def extract_many(self, urls: List[str], max_workers: int = 4,
+                     fix_sentences: bool = True) -> Iterator[Tuple[str, Optional[List[Dict]], Optional[Exception]]]:
+        """
+        여러 영상의 자막을 스레드 풀에서 병렬로 추출합니다.
+
+        완료되는 순서대로 (video_id, subtitles, error)를 yield합니다.
+        성공하면 error가 None, 실패하면 subtitles가 None입니다.
+        self.subtitles_data는 건드리지 않으므로 한 인스턴스를 여러 스레드에서 공유해도 안전합니다.
+
+        Args:
+            urls: 유튜브 영상 URL 목록
+            max_workers: 동시에 처리할 최대 영상 수
+            fix_sentences: True면 문장 단위로 자막 경계를 보정합니다
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = {
+                pool.submit(self._extract_one, url, fix_sentences): url
+                for url in urls
+            }
+            for future in as_completed(futures):
+                url = futures[future]
+                key = self._extract_video_id(url) or url
+                try:
+                    yield key, future.result(), None
+                except Exception as e:
+                    logger.error(f"[{key}] {e}")
+                    yield key, None, e
+
+    def _fetch_raw(self, video_id: str, youtube_url: str) -> Optional[Tuple[List[Dict], Dict]]:
+        """원본 자막 큐와 트랙 정보를 가져옵니다. 캐시가 있으면 먼저 확인합니다."""
+        if self.cache and not self.refresh_cache:
+            cached = self.cache.get(video_id)
+            if cached is NO_TRANSCRIPT:
+                logger.info("  캐시: 자막 없음으로 기록된 영상 (--refresh-cache로 재시도)")
+                return None
+            if cached:
+                subtitles, track = cached
+                logger.info(f"  캐시 사용: {track['source']} {track['language']} ({len(subtitles)}개)")
+                return cached
+
+        if self.hedge_delay is not None:
+            fetched = self._fetch_hedged(video_id, youtube_url)
+        else:
+            # 방법 1: youtube-transcript-api
+            fetched = self._try_youtube_transcript_api(video_id)
+
+            # 방법 2: yt-dlp CLI
+            if not fetched:
+                missing = fetched is NO_TRACK
+                fetched = self._try_ytdlp_cli(youtube_url)
+                # 한쪽이라도 자막 없음을 확인했으면 자막 없음 (다른 쪽은 일시적 실패)
+                if fetched is None and missing:
+                    fetched = NO_TRACK
+
+        if self.cache:
+            try:
+                if fetched:
+                    self.cache.put(video_id, *fetched)
+                elif fetched is NO_TRACK:
+                    # 자막이 없다고 확인된 경우만 (네트워크 오류/429/타임아웃/도구 없음은 다음에 다시 시도)
+                    self.cache.put_missing(video_id)
+            except OSError as e:
+                logger.warning(f"  자막 캐시 저장 실패: {e}")
+
+        return fetched
+
+    def _fetch_hedged(self, video_id: str, youtube_url: str) -> Optional[Tuple[List[Dict], Dict]]:
+        """youtube-transcript-api를 먼저 시작하고, hedge_delay 초 안에 성공하지 못하면
+        yt-dlp를 동시에 시작해 먼저 성공한 결과를 반환합니다.
+
+        youtube-transcript-api가 그 전에 실패하면 바로 yt-dlp를 시작합니다 (순차 모드와 같음).
+        yt-dlp가 지면 프로세스를 종료합니다. youtube-transcript-api는 중단할 방법이 없으므로
+        데몬 스레드로 돌려 결과를 버립니다.
+        둘 다 실패했을 때 끝난 쪽 중 하나라도 자막 없음을 확인했으면 NO_TRACK을 반환합니다.
+        """
+        results = queue.Queue()
+        cancel = threading.Event()
+
+        def run(name, fn, *args):
+            try:
+                fetched = fn(*args)
+            except Exception as e:
+                logger.warning(f"{name} 실패: {e}")
+                fetched = None
+            results.put((name, fetched))
+
+        threading.Thread(target=run, daemon=True, args=(
+            'youtube-transcript-api', self._try_youtube_transcript_api, video_id)).start()
+        pending = 1
+        missing = False
+
+        try:
+            try:
+                name, fetched = results.get(timeout=self.hedge_delay)
+                pending -= 1
+                if fetched:
+                    return fetched
+                missing = fetched is NO_TRACK
+            except queue.Empty:
+                logger.info(f"  {self.hedge_delay:g}초 안에 응답 없음 → yt-dlp 동시 시작")
+
+            threading.Thread(target=run, daemon=True, args=(
+                'yt-dlp', self._try_ytdlp_cli, youtube_url, cancel)).start()
+            pending += 1
+
+            while pending:
+                name, fetched = results.get()
+                pending -= 1
+                if fetched:
+                    logger.info(f"  헤지: {name} 결과 사용")
+                    return fetched
+                missing = missing or fetched is NO_TRACK
+            return NO_TRACK if missing else None
+        finally:
+            # 진 쪽 yt-dlp 프로세스 종료
+            cancel.set()
+
+    def _extract_one(self, youtube_url: str, fix_sentences: bool = True) -> List[Dict]:
+        """영상 하나의 자막을 추출해 반환합니다. 인스턴스 상태를 변경하지 않습니다.
+
+        Raises:
+            ValueError: URL이나 비디오 ID가 유효하지 않은 경우
+            RuntimeError: 모든 자막 추출 방법이 실패한 경우
+        """
+        if not self._validate_youtube_url(youtube_url):
+            raise ValueError("유효하지 않은 유튜브 URL입니다.")
 
         video_id = self._extract_video_id(youtube_url)
         if not video_id:
-            logger.error("비디오 ID를 추출할 수 없습니다.")
-            return []
+            raise ValueError("비디오 ID를 추출할 수 없습니다.")
 
         logger.info(f"비디오 ID: {video_id}")
 
-        # 방법 1: youtube-transcript-api
-        result = self._try_youtube_transcript_api(video_id)
-
-        # 방법 2: yt-dlp CLI
-        if not result:
-            result = self._try_ytdlp_cli(youtube_url)
+        fetched = self._fetch_raw(video_id, youtube_url)
 
-        if not result:
-            logger.error(
+        if not fetched:
+            raise RuntimeError(
                 "모든 자막 추출 방법이 실패했습니다.\n"
                 "  확인사항:\n"
                 "  1. pip install youtube-transcript-api 실행\n"
                 "  2. 해당 영상에 자막이 있는지 YouTube에서 직접 확인\n"
                 "  3. --cookies-from-browser chrome 옵션 사용"
             )
-            return []
 
+        result, track = fetched
+        generated = track.get('generated')
+        if generated is None:
+            # 트랙 종류를 모르면 (yt-dlp 자동+수동 요청 등) 단어별 타임스탬프로 판단
+            generated = self._has_word_timings(result)
+        return self.postprocess(result, generated, fix_sentences)
+
+    def postprocess(self, cues: List[Dict], generated: Optional[bool] = None,
+                    fix_sentences: bool = True) -> List[Dict]:
+        """원본 자막 큐를 정리합니다: 중복 병합 → 겹침 제거 → 문장 보정.
+
+        Args:
+            cues: 원본 자막 큐 (word_starts가 있어도 됨)
+            generated: 자동 생성 자막 여부. True일 때만 겹침(rolling) 제거를 합니다
+                (None = 알 수 없음, 수동 자막처럼 건드리지 않음)
+            fix_sentences: True면 문장 단위로 자막 경계를 보정합니다
+        """
         # 중복 병합
-        original = len(result)
-        self.subtitles_data = self._merge_duplicate_subtitles(result)
-        if original != len(self.subtitles_data):
-            logger.info(f"중복 병합: {original} → {len(self.subtitles_data)}개")
+        original = len(cues)
+        subtitles = self._merge_duplicate_subtitles(cues)
+        if original != len(subtitles):
+            logger.info(f"중복 병합: {original} → {len(subtitles)}개")
+
+        # 자동 생성 자막의 겹치는(rolling) 텍스트 제거 (수동/알 수 없는 자막은 건드리지 않음)
+        if generated is True:
+            before = len(subtitles)
+            subtitles = self._dedupe_rolling_captions(subtitles)
+            if before != len(subtitles):
+                logger.info(f"겹침 제거: {before} → {len(subtitles)}개")
 
         # 문장 단위 보정
         if fix_sentences:
-            before = len(self.subtitles_data)
-            self.subtitles_data = self._fix_sentence_boundaries(self.subtitles_data)
-            if before != len(self.subtitles_data):
-                logger.info(f"문장 보정: {before} → {len(self.subtitles_data)}개")
+            before = len(subtitles)
+            subtitles = self._fix_sentence_boundaries(subtitles)
+            if before != len(subtitles):
+                logger.info(f"문장 보정: {before} → {len(subtitles)}개")
 
-        logger.info(f"최종 자막: {len(self.subtitles_data)}개")
-        return self.subtitles_data
+        # 단어별 타임스탬프는 내부 처리용 → 출력에서 제거
+        for sub in subtitles:
+            sub.pop('word_starts', None)
+
+        logger.info(f"최종 자막: {len(subtitles)}개")
+        return subtitles
 
     def save_to_json(self, output_path: str) -> bool:
         """추출된 자막을 JSON 파일로 저장합니다."""
@@ -693,16 +930,39 @@ def main():
     parser.add_argument('--cookies-from-browser', default=None)
     parser.add_argument('--cookies', default=None)
     parser.add_argument('-v', '--verbose', action='store_true')
+    parser.add_argument('--log-file', default=None,
+                        help='로그를 이 파일에도 기록합니다')
     parser.add_argument('--no-sentence-fix', action='store_true',
                         help='문장 단위 자막 보정을 건너뜁니다')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='원본 자막 디스크 캐시를 사용하지 않습니다')
+    parser.add_argument('--refresh-cache', action='store_true',
+                        help='캐시를 무시하고 자막을 새로 받아 캐시를 갱신합니다')
+    parser.add_argument('--ytdlp-sequential', action='store_true',
+                        help='yt-dlp를 조합별로 최대 4번 순차 호출합니다 (기존 방식)')
+    parser.add_argument('--hedge-delay', type=float, default=None, metavar='SECONDS',
+                        help='youtube-transcript-api가 이 시간 안에 끝나지 않으면 yt-dlp를 동시에 '
+                             '시작합니다 (0: 처음부터 동시에)')
 
     args = parser.parse_args()
+
+    from movietalk import configure_logging
+    configure_logging(log_file=args.log_file)
     if args.verbose:
         logger.setLevel(logging.DEBUG)
 
+    cache = None
+    if not args.no_cache:
+        cache = TranscriptCache()
+        cache.prune()
+
     extractor = SubtitleExtractor(
         cookies_from_browser=args.cookies_from_browser,
-        cookies_file=args.cookies
+        cookies_file=args.cookies,
+        cache=cache,
+        refresh_cache=args.refresh_cache,
+        ytdlp_single_pass=not args.ytdlp_sequential,
+        hedge_delay=args.hedge_delay,
     )
     subtitles = extractor.extract(args.url, fix_sentences=not args.no_sentence_fix)
 
@@ -23,7 +23,6 @@ PROJECT_DIR = Path(__file__).parent
 VIDEOS_DIR = PROJECT_DIR / "public" / "videos"
 
 sys.path.insert(0, str(PROJECT_DIR))
-from extract_subtitles import SubtitleExtractor
 
 
 def extract_video_id(url: str) -> str:
@@ -61,9 +60,18 @@ def main():
                         help='파일 저장 없이 stdout으로 JSON 출력')
     parser.add_argument('--cookies-from-browser', default=None,
                         help='브라우저 쿠키 사용 (예: chrome)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='원본 자막 디스크 캐시를 사용하지 않습니다')
+    parser.add_argument('--refresh-cache', action='store_true',
+                        help='캐시를 무시하고 자막을 새로 받아 캐시를 갱신합니다')
 
     args = parser.parse_args()
 
+    from movietalk import configure_logging
+    from extract_subtitles import SubtitleExtractor
+    from transcript_cache import TranscriptCache
+    configure_logging()
+
     video_id = extract_video_id(args.url)
     if not video_id:
         print(f"오류: 유효하지 않은 YouTube URL입니다: {args.url}", file=sys.stderr)
@@ -71,7 +79,11 @@ def main():
 
     youtube_url = f"https://www.youtube.com/watch?v={video_id}"
 
-    extractor = SubtitleExtractor(cookies_from_browser=args.cookies_from_browser)
+    extractor = SubtitleExtractor(
+        cookies_from_browser=args.cookies_from_browser,
+        cache=None if args.no_cache else TranscriptCache(),
+        refresh_cache=args.refresh_cache,
+    )
     subtitles = extractor.extract(youtube_url, fix_sentences=not args.raw)
 
     if not subtitles:
@@ -10,11 +10,29 @@ API 키 없이 claude CLI(Claude Code)를 활용하여
     # 특정 영상의 발음 데이터 생성
     python gen_pronunciation.py VIDEO_ID
 
-    # 발음 데이터 없는 모든 영상 처리
+    # 발음 데이터 없는 모든 영상 처리 (모든 영상의 자막을 하나의 작업 큐로, 같은 문장은 한 번만)
     python gen_pronunciation.py --all
 
-    # 배치 크기 조절 (기본 24)
-    python gen_pronunciation.py VIDEO_ID --batch-size 12
+    # 배치 크기 조절 (토큰 예산 시작값 / 배치당 최대 자막 수)
+    python gen_pronunciation.py VIDEO_ID --token-budget 2000 --batch-size 20
+
+    # 배치를 claude 프로세스 4개로 동시 처리
+    python gen_pronunciation.py VIDEO_ID --jobs 4
+
+    # claude를 배치마다 새로 띄우지 않고 상주 워커(stream-json)로 처리
+    python gen_pronunciation.py VIDEO_ID --persistent --jobs 2
+
+    # 발음이 없거나 텍스트가 바뀐 자막만 다시 생성 (자막 합치기/나누기 후)
+    python gen_pronunciation.py VIDEO_ID --incremental
+
+    # 쉬운 자막은 빠른 모델, 어려운 자막은 기본 모델로 (난이도 라우팅)
+    python gen_pronunciation.py VIDEO_ID --route
+
+중간에 멈춘 실행(Ctrl+C, 오류 등)은 같은 명령을 다시 실행하면 이어서 진행합니다.
+검증을 통과한 배치 결과는 .cache/journal/{VIDEO_ID}.jsonl에 바로 기록됩니다.
+
+배치는 자막 개수가 아니라 글자 수로 추정한 토큰 예산으로 묶으며, 실행 중 배치별 소요 시간과
+실패(시간 초과 등)를 보고 예산을 조정합니다 (pronunciation_batcher 참고).
 """
 
 import json
@@ -22,11 +40,19 @@ import argparse
 import re
 import subprocess
 import sys
+import threading
+import time
+from collections import Counter
 from pathlib import Path
 
+from video_store import (INDEX_FILE, load_index, mark_has_pronunciation,
+                         pronunciation_progress, video_path, write_json_atomic)
+
 PROJECT_DIR = Path(__file__).parent
-VIDEOS_DIR = PROJECT_DIR / "public" / "videos"
-INDEX_FILE = VIDEOS_DIR / "index.json"
+CLAUDE_TIMEOUT = 120  # claude 호출 하나의 시간 제한 (초)
+# --progressive: 첫 배치를 작게 시작해 영상 앞부분을 빨리 공개하고, 이 간격(초)마다 중간 결과를 저장
+PROGRESSIVE_START_BUDGET = 600
+PROGRESSIVE_FLUSH_INTERVAL = 5.0
 
 PROMPT_TEMPLATE = """다음 영어 자막 각각에 대해 한글 발음 데이터를 생성해주세요.
 
@@ -72,12 +98,62 @@ PROMPT_TEMPLATE = """다음 영어 자막 각각에 대해 한글 발음 데이
 ]"""
 
 
-def run_claude(prompt: str) -> str:
-    """claude CLI를 호출하여 응답을 받습니다."""
+# 번역 메모리(translation_memory)에서 비슷한 기존 자막을 찾은 배치에만 붙이는 안내
+REFERENCE_NOTE = ('REF 줄은 바로 위 INDEX와 비슷한 기존 자막의 결과입니다. 겹치는 부분은 발음/번역을 '
+                  '맞추고, notes가 REF의 NOTES와 같으면 "notes": "REF"로만 쓰세요.')
+
+# 상주 워커 모드에서 시스템 프롬프트로 넘길 규칙 (입력은 메시지마다 따로 보냄)
+WORKER_INPUT_NOTE = '각 메시지로 주어지는 INDEX=N TEXT="..." 줄들 (메시지마다 이 규칙과 출력 형식을 그대로 적용)'
+
+# start_workers()로 켠 상주 워커 풀 (없으면 배치마다 claude -p 실행)
+_workers = None
+# 기본이 아닌 모델(--route의 fast 모델)용 상주 워커 풀. 그 모델을 처음 쓸 때 같은 크기로 띄움
+_model_workers = {}
+_model_workers_lock = threading.Lock()
+
+
+def start_workers(size: int = 1) -> None:
+    """claude 상주 워커(claude_worker.ClaudeWorkerPool)를 띄워 이후 run_claude가 사용하게 합니다."""
+    global _workers
+    from claude_worker import ClaudeWorkerPool
+    _workers = ClaudeWorkerPool(size, PROMPT_TEMPLATE.format(subtitle_text=WORKER_INPUT_NOTE),
+                                timeout=CLAUDE_TIMEOUT)
+
+
+def stop_workers() -> None:
+    global _workers
+    if _workers is not None:
+        _workers.close()
+        _workers = None
+    for pool in _model_workers.values():
+        pool.close()
+    _model_workers.clear()
+
+
+def _worker_pool(model: str = None):
+    """모델에 맞는 상주 워커 풀 (model이 None이면 기본 풀)"""
+    if model is None:
+        return _workers
+    from claude_worker import ClaudeWorkerPool
+    with _model_workers_lock:
+        if model not in _model_workers:
+            _model_workers[model] = ClaudeWorkerPool(
+                len(_workers.workers), PROMPT_TEMPLATE.format(subtitle_text=WORKER_INPUT_NOTE),
+                timeout=CLAUDE_TIMEOUT, model=model)
+        return _model_workers[model]
+
+
+def run_claude(prompt: str, model: str = None) -> str:
+    """claude CLI를 호출하여 응답을 받습니다. 상주 워커가 있으면 워커에 메시지로 보냅니다.
+
+    model을 넘기면 --model로 지정합니다 (없으면 CLI 기본 모델).
+    """
+    if _workers is not None:
+        return _worker_pool(model).run(prompt)
     try:
         result = subprocess.run(
-            ['claude', '-p', prompt, '--output-format', 'json'],
-            capture_output=True, text=True, timeout=120
+            ['claude', '-p', prompt, '--output-format', 'json'] + (['--model', model] if model else []),
+            capture_output=True, text=True, timeout=CLAUDE_TIMEOUT
         )
         if result.returncode != 0:
             print(f"    ✗ claude 실행 실패: {result.stderr[:200]}")
@@ -86,7 +162,7 @@ def run_claude(prompt: str) -> str:
         response = json.loads(result.stdout)
         return response.get('result', '')
     except subprocess.TimeoutExpired:
-        print("    ✗ claude 응답 시간 초과 (120초)")
+        print(f"    ✗ claude 응답 시간 초과 ({CLAUDE_TIMEOUT}초)")
         return None
     except (json.JSONDecodeError, KeyError) as e:
         print(f"    ✗ claude 응답 파싱 실패: {e}")
@@ -96,34 +172,145 @@ def run_claude(prompt: str) -> str:
         sys.exit(1)
 
 
+def run_prompts(prompts: list, jobs: int = 1):
+    """프롬프트 목록을 claude로 실행해 (번호, 응답)을 완료되는 순서대로 yield합니다.
+
+    jobs가 1이면 순서대로 하나씩, 2 이상이면 claude 프로세스를 최대 jobs개까지 동시에 띄웁니다.
+    """
+    if jobs <= 1:
+        for i, prompt in enumerate(prompts):
+            yield i, run_claude(prompt)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(run_claude, prompt): i for i, prompt in enumerate(prompts)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _timed_claude(prompt: str, model: str = None) -> tuple:
+    t0 = time.perf_counter()
+    response = run_claude(prompt, model)
+    return response, time.perf_counter() - t0
+
+
+def run_batches(pending: list, batcher, jobs: int = 1, model: str = None):
+    """자막을 batcher가 정한 크기로 묶어 claude로 실행하고 (배치, 응답, 소요 시간)을 끝나는 순서대로 yield합니다.
+
+    다음 배치는 앞 배치의 결과를 받은 뒤에 꺼내므로, 호출한 쪽이 batcher.record()로 알려 준
+    소요 시간/실패가 바로 다음 배치 크기에 반영됩니다. claude 프로세스는 최대 jobs개까지 동시에 띄웁니다.
+    model을 넘기면 모든 배치를 그 모델로 보냅니다.
+    """
+    from collections import deque
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    queue = deque(pending)
+    jobs = max(1, jobs)
+    running = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while queue or running:
+            while queue and len(running) < jobs:
+                batch = batcher.take(queue)
+                running[pool.submit(_timed_claude, build_prompt(batch), model)] = batch
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch = running.pop(future)
+                response, elapsed = future.result()
+                yield batch, response, elapsed
+
+
+def plan_tiers(pending: list, budget: float, max_cues: int, route_models: bool = False,
+               route_threshold: float = None) -> tuple:
+    """자막을 실행할 모델 단계로 나눕니다.
+
+    route_models면 난이도(model_router.route)로 fast/strong 단계로 나누고, 아니면 기본 모델 한 단계
+    (단계 이름 None)입니다. 단계마다 처리 속도가 다르므로 AdaptiveBatcher를 따로 둡니다.
+    Returns: ({단계: 자막 목록}, {단계: AdaptiveBatcher}, model_router.TierStats 또는 None)
+    """
+    from pronunciation_batcher import AdaptiveBatcher
+
+    routed, stats = {None: pending}, None
+    if route_models:
+        from model_router import DEFAULT_THRESHOLD, TierStats, route
+        routed = route(pending, DEFAULT_THRESHOLD if route_threshold is None else route_threshold)
+        stats = TierStats()
+    batchers = {tier: AdaptiveBatcher(budget=budget, max_cues=max_cues, timeout=CLAUDE_TIMEOUT)
+                for tier in routed}
+    return routed, batchers, stats
+
+
+def run_tiers(routed: dict, batchers: dict, jobs: int = 1, escalated: list = None):
+    """단계별 자막을 순서대로 run_batches로 실행해 (단계, 배치, 응답, 소요 시간)을 yield합니다.
+
+    앞 단계를 처리하는 동안 호출한 쪽이 escalated에 넣은 자막(fast 모델 결과가 검증을 통과하지
+    못한 자막)은 마지막 단계(strong)에 자막 순서대로 합류합니다.
+    """
+    tiers = list(routed)
+    for tier in tiers:
+        cues = routed[tier]
+        if tier == tiers[-1] and escalated:
+            cues = sorted(cues + escalated, key=lambda s: s['index'])
+        if not cues:
+            continue
+        model = None
+        if tier is not None:
+            from model_router import CLI_MODELS
+            model = CLI_MODELS[tier]
+            print(f"  🧭 {tier} 모델({model or 'claude 기본'}): {len(cues)}개 자막")
+        for batch, response, elapsed in run_batches(cues, batchers[tier], jobs, model):
+            yield tier, batch, response, elapsed
+
+
+def build_prompt(subtitles: list) -> str:
+    """자막 목록을 INDEX=N TEXT="..." 형식으로 넣은 프롬프트를 만듭니다.
+
+    자막에 reference(번역 메모리의 비슷한 자막)가 있으면 그 INDEX 아래에 REF 줄을 넣습니다.
+    상주 워커 모드에서는 규칙이 이미 시스템 프롬프트에 있으므로 INDEX 줄만 반환합니다.
+    """
+    lines = []
+    for s in subtitles:
+        lines.append(f'INDEX={s["index"]} TEXT="{s["text"]}"')
+        ref = s.get('reference')
+        if ref:
+            lines.append(f'  REF TEXT="{ref["text"]}" PRONUNCIATION="{ref["pronunciation"]}" '
+                         f'TRANSLATION="{ref["translation"]}" '
+                         f'NOTES={json.dumps(ref["notes"], ensure_ascii=False)}')
+    if len(lines) > len(subtitles):
+        lines.insert(0, REFERENCE_NOTE)
+    subtitle_text = '\n'.join(lines)
+    if _workers is not None:
+        return subtitle_text
+    return PROMPT_TEMPLATE.format(subtitle_text=subtitle_text)
+
+
 def parse_json_response(text: str) -> list:
-    """응답에서 JSON 배열을 추출합니다."""
-    if not text:
-        return []
+    """응답에서 JSON 배열 항목을 추출합니다.
 
-    # ```json ... ``` 블록 추출
-    code_match = re.search(r'```(?:json)?\s*([\s\S]*?)```', text)
-    if code_match:
-        text = code_match.group(1).strip()
+    항목 단위로 읽으므로(json_stream) 형식이 잘못된 항목이나 중간에 끊긴 뒷부분만 버리고
+    올바른 항목은 모두 남깁니다.
+    """
+    from json_stream import parse_json_items
+    return parse_json_items(text)
 
-    # JSON 배열 추출
-    json_match = re.search(r'\[[\s\S]*\]', text)
-    if json_match:
-        try:
-            return json.loads(json_match.group())
-        except json.JSONDecodeError:
-            pass
 
-    return []
+def resolve_reference_notes(items: list, batch: list) -> list:
+    """"notes": "REF"로 답한 항목에 참고 자막의 notes를 채웁니다 (참고가 없으면 빈 목록)."""
+    refs = {s['index']: s['reference'] for s in batch if s.get('reference')}
+    for item in items:
+        if isinstance(item.get('notes'), str):
+            ref = refs.get(item.get('index'))
+            item['notes'] = list(ref['notes']) if ref else []
+    return items
 
 
-def validate_batch(batch_result: list, expected_indices: list) -> tuple:
+def validate_batch(batch_result: list, expected_indices: list, verbose: bool = True) -> tuple:
     """배치 결과의 정렬과 품질을 검증합니다.
     Returns: (validated, fallback) - 검증 통과 목록, 영어 포함 fallback 목록"""
     if not batch_result:
         return [], []
 
-    result_map = {item['index']: item for item in batch_result}
+    result_map = {item.get('index'): item for item in batch_result}
     validated = []
     fallback = []
 
@@ -131,144 +318,376 @@ def validate_batch(batch_result: list, expected_indices: list) -> tuple:
         if idx in result_map:
             item = result_map[idx]
             if not item.get('pronunciation'):
-                print(f"      ⚠ [{idx}] 발음 없음, 건너뜀")
+                if verbose:
+                    print(f"      ⚠ [{idx}] 발음 없음, 건너뜀")
                 continue
             # 영어 문자가 pronunciation에 있는지 확인
             if re.search(r'[a-zA-Z]', item.get('pronunciation', '')):
-                print(f"      ⚠ [{idx}] 발음에 영어 포함")
+                if verbose:
+                    print(f"      ⚠ [{idx}] 발음에 영어 포함")
                 fallback.append(item)
                 continue
             validated.append(item)
         else:
-            print(f"      ⚠ [{idx}] 결과 누락")
+            if verbose:
+                print(f"      ⚠ [{idx}] 결과 누락")
 
     return validated, fallback
 
 
-def generate_for_video(video_id: str, batch_size: int = 24, retry: bool = True):
-    """특정 영상의 발음 데이터를 생성합니다."""
-    filepath = VIDEOS_DIR / f"{video_id}.json"
-    if not filepath.exists():
-        print(f"✗ {video_id}.json 파일이 없습니다.")
-        return False
+# 재시도에서 이만큼 이하로 남은 자막은 반으로 나누지 않고 하나씩 보냄
+SINGLE_RETRY_SIZE = 3
+
+
+def retry_failed(cues: list, jobs: int = 1, budget: float = None, max_cues: int = 40,
+                 on_validated=None) -> tuple:
+    """실패한 자막을 이분법으로 재시도합니다.
+
+    실패한 자막을 모아 (토큰 예산 단위로) 한 배치로 다시 보내고, 그 배치에서 또 실패한 자막은
+    반으로 나눠 다음 라운드에 보냅니다 (SINGLE_RETRY_SIZE개 이하로 남으면 하나씩).
+    자막 하나짜리 배치까지 실패해야 포기하므로, 대부분 성공하는 경우 자막마다 claude를
+    호출하는 것보다 호출 수가 훨씬 적습니다.
+    on_validated(검증 통과 목록)는 배치마다 호출됩니다 (작업 기록용).
+
+    Returns: (validated {index: 결과}, fallback {index: 영어 포함 결과}, claude 호출 수)
+    """
+    from pronunciation_batcher import DEFAULT_BUDGET, pack_batches
+
+    validated, fallback = {}, {}
+    calls = 0
+    groups = pack_batches(cues, budget or DEFAULT_BUDGET, max_cues)
+    while groups:
+        next_groups = []
+        for n, response in run_prompts([build_prompt(g) for g in groups], jobs):
+            group = groups[n]
+            calls += 1
+            ok, fb = validate_batch(resolve_reference_notes(parse_json_response(response), group),
+                                    [s['index'] for s in group], verbose=False)
+            for item in ok:
+                validated[item['index']] = item
+            for item in fb:
+                fallback[item['index']] = item
+            if ok and on_validated:
+                on_validated(ok)
+
+            remaining = [s for s in group if s['index'] not in validated]
+            if not remaining or len(group) == 1:
+                continue
+            if len(remaining) <= SINGLE_RETRY_SIZE:
+                next_groups.extend([s] for s in remaining)
+            else:
+                half = (len(remaining) + 1) // 2
+                next_groups.extend((remaining[:half], remaining[half:]))
+        groups = next_groups
+    return validated, fallback, calls
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        subtitles = json.load(f)
 
-    # 이미 발음 데이터가 있는지 확인
-    if subtitles and 'pronunciation' in subtitles[0]:
-        print(f"  ℹ 이미 발음 데이터가 있습니다 ({len(subtitles)}개)")
-        response = input("  덮어쓰시겠습니까? (y/N): ").strip().lower()
-        if response != 'y':
-            return False
-
-    total = len(subtitles)
-    total_batches = (total + batch_size - 1) // batch_size
-    all_results = {}
-    fallback_results = {}
-    failed_indices = []
-
-    print(f"  🔊 발음 데이터 생성 시작 ({total}개 자막, {total_batches}개 배치)")
-
-    for batch_num in range(total_batches):
-        start = batch_num * batch_size
-        end = min(start + batch_size, total)
-        batch = subtitles[start:end]
-        expected_indices = [s['index'] for s in batch]
-
-        print(f"  📦 배치 {batch_num + 1}/{total_batches} ({start + 1}-{end})...")
-
-        # 프롬프트 생성: 각 자막을 INDEX=N TEXT="..." 형식으로
-        subtitle_lines = []
-        for s in batch:
-            subtitle_lines.append(f'INDEX={s["index"]} TEXT="{s["text"]}"')
-        subtitle_text = '\n'.join(subtitle_lines)
-
-        prompt = PROMPT_TEMPLATE.format(subtitle_text=subtitle_text)
-        response = run_claude(prompt)
-        batch_result = parse_json_response(response)
-        validated, fallback = validate_batch(batch_result, expected_indices)
-
-        for item in validated:
-            all_results[item['index']] = item
-        for item in fallback:
-            fallback_results[item['index']] = item
-
-        success = len(validated)
-        fail = len(expected_indices) - success
-        if fail > 0:
-            failed_indices.extend([i for i in expected_indices if i not in all_results])
-        print(f"    ✓ {success}/{len(expected_indices)} 완료" + (f" ({fail}개 실패)" if fail else ""))
-
-    # 실패한 항목 재시도 (개별 처리)
-    if failed_indices and retry:
-        print(f"\n  🔄 실패한 {len(failed_indices)}개 항목 재시도...")
-        for idx in failed_indices:
-            sub = next(s for s in subtitles if s['index'] == idx)
-            prompt = PROMPT_TEMPLATE.format(
-                subtitle_text=f'INDEX={sub["index"]} TEXT="{sub["text"]}"'
-            )
-            response = run_claude(prompt)
-            result = parse_json_response(response)
-            if result:
-                validated, fb = validate_batch(result, [idx])
-                if validated:
-                    all_results[idx] = validated[0]
-                    print(f"    ✓ [{idx}] 재시도 성공")
-                    continue
-                if fb:
-                    fallback_results[idx] = fb[0]
-            print(f"    ✗ [{idx}] 재시도 실패")
-
-    # 재시도 후에도 실패한 항목은 fallback(영어 포함) 결과로 채움
-    for idx, item in fallback_results.items():
-        if idx not in all_results:
-            all_results[idx] = item
-            print(f"    ⚠ [{idx}] 발음에 영어 포함된 채로 저장")
-
-    # 결과 병합
+def apply_results(subtitles: list, results: dict) -> int:
+    """결과({index: 항목})를 자막에 합치고 생성 시점의 텍스트 해시(textHash)를 기록합니다.
+
+    합친 자막 수를 반환합니다. textHash가 없는 이전 발음 데이터는 건드리지 않습니다 (stamp_untracked 참고).
+    """
+    from pronunciation_cache import text_hash
+
     merged_count = 0
     for s in subtitles:
         idx = s['index']
-        if idx in all_results:
-            r = all_results[idx]
+        if idx in results:
+            r = results[idx]
             s['pronunciation'] = r['pronunciation']
             s['translation'] = r['translation']
             s['notes'] = r.get('notes', [])
+            s['textHash'] = text_hash(s['text'])
             merged_count += 1
+    return merged_count
 
-    if merged_count == 0:
-        print(f"\n  ✗ 발음 데이터를 생성하지 못했습니다.")
-        return False
 
-    # 자막 시간 겹침 수정
+def stamp_untracked(video_id: str) -> int:
+    """textHash가 없는 발음 데이터에 현재 텍스트 해시를 기록합니다 (--stamp-untracked, 한 번만 실행).
+
+    textHash 기능 이전에 만든 발음을 현재 텍스트 기준으로 만든 것으로 간주하므로, 자막을 합치거나
+    나눈 뒤 발음을 다시 만들지 않은 영상에는 실행하지 마세요. 기록한 자막 수를 반환합니다.
+    """
+    from pronunciation_cache import CUE_UNTRACKED, cue_state, text_hash
+
+    filepath = video_path(video_id)
+    subtitles = json.loads(filepath.read_text(encoding='utf-8'))
+    stamped = 0
+    for s in subtitles:
+        if cue_state(s) == CUE_UNTRACKED:
+            s['textHash'] = text_hash(s['text'])
+            stamped += 1
+    if stamped:
+        write_json_atomic(filepath, subtitles)
+    return stamped
+
+
+def save_subtitles(filepath: Path, subtitles: list) -> int:
+    """자막 시간 겹침을 고쳐 저장합니다. 고친 겹침 수를 반환합니다."""
     overlap_fixed = 0
     for i in range(len(subtitles) - 1):
         if subtitles[i]['end'] > subtitles[i + 1]['start']:
             subtitles[i]['end'] = subtitles[i + 1]['start']
             overlap_fixed += 1
 
-    # 저장
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(subtitles, f, ensure_ascii=False, indent=2)
+    write_json_atomic(filepath, subtitles)
+    return overlap_fixed
 
-    # index.json 업데이트
-    has_pronunciation = merged_count == total
-    index = json.loads(INDEX_FILE.read_text(encoding='utf-8')) if INDEX_FILE.exists() else []
-    for v in index:
-        if v['id'] == video_id:
-            v['hasPronunciation'] = has_pronunciation
-    with open(INDEX_FILE, 'w', encoding='utf-8') as f:
-        json.dump(index, f, ensure_ascii=False, indent=2)
 
-    print(f"\n  ✅ 완료! {merged_count}/{total}개 발음 생성")
-    if overlap_fixed:
-        print(f"  🔧 자막 시간 겹침 {overlap_fixed}건 수정")
-    if merged_count < total:
-        missing = [s['index'] for s in subtitles if 'pronunciation' not in s]
-        print(f"  ⚠ 누락된 인덱스: {missing}")
+def generate_for_video(video_id: str, batch_size: int = 40, retry: bool = True, jobs: int = 1,
+                       use_cache: bool = True, incremental: bool = False, resume: bool = True,
+                       token_budget: int = None, use_rules: bool = True, use_memory: bool = True,
+                       memory_reuse: float = None, progressive: bool = False,
+                       route_models: bool = False, route_threshold: float = None):
+    """특정 영상의 발음 데이터를 생성합니다 (generate_for_videos를 영상 하나로 호출).
 
-    return True
+    incremental이면 발음이 없거나 텍스트가 바뀐(textHash 불일치) 자막만 다시 생성하고,
+    아니면 모든 자막을 생성합니다 (이미 발음이 있으면 덮어쓸지 묻습니다).
+    나머지 옵션은 generate_for_videos와 같습니다.
+    """
+    from pronunciation_cache import CUE_MISSING, CUE_STALE, cue_state
+
+    filepath = video_path(video_id)
+    if not filepath.exists():
+        print(f"✗ {video_id}.json 파일이 없습니다.")
+        return False
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        subtitles = json.load(f)
+
+    # 자막별 상태 확인
+    states = {s['index']: cue_state(s) for s in subtitles}
+    counts = Counter(states.values())
+    n_stale, n_missing = counts[CUE_STALE], counts[CUE_MISSING]
+    n_done = len(subtitles) - n_stale - n_missing
+
+    if incremental:
+        targets = [s for s in subtitles if states[s['index']] in (CUE_STALE, CUE_MISSING)]
+        print(f"  ℹ 생성됨 {n_done}개, 텍스트 변경 {n_stale}개, 없음 {n_missing}개")
+        if not targets:
+            print("  ✓ 모든 자막의 발음 데이터가 최신입니다.")
+            return True
+    else:
+        targets = subtitles
+        if n_done:
+            print(f"  ℹ 이미 발음 데이터가 있습니다 ({n_done}/{len(subtitles)}개)")
+            if n_stale or n_missing:
+                print(f"  ℹ 바뀌거나 없는 {n_stale + n_missing}개만 만들려면 --incremental")
+            response = input("  덮어쓰시겠습니까? (y/N): ").strip().lower()
+            if response != 'y':
+                return False
+
+    saved = generate_for_videos(
+        {video_id: (subtitles, targets)}, batch_size, retry=retry, jobs=jobs, use_cache=use_cache,
+        resume=resume, token_budget=token_budget, use_rules=use_rules, use_memory=use_memory,
+        memory_reuse=memory_reuse, progressive=progressive, route_models=route_models,
+        route_threshold=route_threshold)
+    return saved == 1
+
+
+def generate_for_corpus(video_ids: list, batch_size: int = 40, retry: bool = True, jobs: int = 1,
+                        use_cache: bool = True, resume: bool = True, token_budget: int = None,
+                        use_rules: bool = True, use_memory: bool = True,
+                        memory_reuse: float = None, progressive: bool = False,
+                        route_models: bool = False, route_threshold: float = None) -> int:
+    """여러 영상에서 발음이 없거나 텍스트가 바뀐 자막을 모아 하나의 작업 큐로 생성합니다 (--all).
+
+    옵션은 generate_for_videos와 같습니다. Returns: 저장한 영상 수
+    """
+    from pronunciation_cache import CUE_MISSING, CUE_STALE, cue_state
+
+    targets_by_video = {}
+    for video_id in video_ids:
+        filepath = video_path(video_id)
+        if not filepath.exists():
+            print(f"  ✗ {video_id}.json 파일이 없습니다.")
+            continue
+        with open(filepath, 'r', encoding='utf-8') as f:
+            subtitles = json.load(f)
+        targets = [s for s in subtitles if cue_state(s) in (CUE_STALE, CUE_MISSING)]
+        if targets:
+            targets_by_video[video_id] = (subtitles, targets)
+
+    if not targets_by_video:
+        print("✓ 모든 영상의 발음 데이터가 최신입니다.")
+        return 0
+    return generate_for_videos(targets_by_video, batch_size, retry=retry, jobs=jobs, use_cache=use_cache,
+                               resume=resume, token_budget=token_budget, use_rules=use_rules,
+                               use_memory=use_memory, memory_reuse=memory_reuse, progressive=progressive,
+                               route_models=route_models, route_threshold=route_threshold)
+
+
+def generate_for_videos(targets_by_video: dict, batch_size: int = 40, retry: bool = True, jobs: int = 1,
+                        use_cache: bool = True, resume: bool = True, token_budget: int = None,
+                        use_rules: bool = True, use_memory: bool = True,
+                        memory_reuse: float = None, progressive: bool = False,
+                        route_models: bool = False, route_threshold: float = None) -> int:
+    """영상별 대상 자막({video_id: (자막 목록, 대상 자막 목록)})의 발음 데이터를 하나의 작업 큐로 생성합니다.
+
+    작업 기록, 캐시, 규칙 발음, 번역 메모리로 채우고 남은 자막 중 같은 문장은 한 번만 보냅니다
+    (pronunciation_pipeline 참고). 영상의 마지막 자막이 채워지면 바로 그 영상 파일을 저장하고
+    index.json을 갱신합니다.
+    배치는 token_budget(추정 토큰, 기본 pronunciation_batcher.DEFAULT_BUDGET)에서 시작해
+    소요 시간/실패에 따라 조정되는 예산으로 묶고, 배치당 자막은 최대 batch_size개입니다.
+    jobs가 2 이상이면 배치를 claude 프로세스 최대 jobs개로 동시에 보냅니다.
+    use_cache면 발음 캐시(pronunciation_cache)에 있는 문장은 claude에 보내지 않습니다.
+    검증을 통과한 결과는 배치마다 작업 기록(pronunciation_journal)에 남기며, resume이면
+    이전 실행이 남긴 기록의 자막은 다시 보내지 않습니다.
+    use_rules면 모든 단어가 규칙 사전에 있는 짧은 정형 문장(rule_pronunciation)은 바로 채웁니다.
+    use_memory면 다른 영상에서 이미 만든 비슷한 문장(translation_memory)을 찾아, 유사도가
+    memory_reuse 이상이면 그대로 쓰고 그보다 낮지만 비슷하면 프롬프트에 참고로 넣습니다.
+    progressive면 작은 배치(PROGRESSIVE_START_BUDGET)로 시작해 영상 앞부분부터 채우고,
+    첫 배치 직후와 PROGRESSIVE_FLUSH_INTERVAL초마다 아직 안 끝난 영상의 검증된 결과를 영상 파일과
+    index.json의 pronunciationProgress에 저장하므로 생성이 끝나기 전에 앞부분부터 학습할 수 있습니다.
+    route_models면 난이도 점수(model_router)가 route_threshold 이하인 문장은 빠른 모델로 먼저 보내고,
+    검증을 통과하지 못한 문장은 어려운 문장과 함께 기본 모델로 다시 보냅니다.
+    기본 모델에서도 실패한 문장은 retry면 이분법으로 재시도합니다.
+
+    Returns: 저장한 영상 수
+    """
+    from model_router import TIER_FAST
+    from pronunciation_batcher import DEFAULT_BUDGET, batch_tokens
+    from pronunciation_cache import prompt_version
+    from pronunciation_journal import PronunciationJournal
+    from pronunciation_pipeline import PronunciationPlan
+
+    version = prompt_version(PROMPT_TEMPLATE)
+    cache = None
+    if use_cache:
+        from pronunciation_cache import PronunciationCache
+        cache = PronunciationCache()
+
+    plan = PronunciationPlan(version, cache=cache, use_memory=use_memory)
+    for video_id, (subtitles, targets) in targets_by_video.items():
+        plan.add_video(video_id, subtitles, targets, PronunciationJournal(video_id, version), resume=resume)
+    plan.resolve_local(use_rules, memory_reuse, budget=token_budget or DEFAULT_BUDGET, max_cues=batch_size,
+                       on_report=lambda video_id, icon, line: print(f"  {icon} {video_id}: {line}"))
+    work = plan.plan_work()
+
+    n_targets = sum(len(targets) for _, targets in targets_by_video.values())
+    c = plan.counts
+    print(f"🎬 {len(targets_by_video)}개 영상, 대상 자막 {n_targets}개 "
+          f"(작업 기록 {c['resumed']}개, 캐시 {c['cached']}개, 규칙 {c['ruled']}개, "
+          f"번역 메모리 {c['reused']}개, 같은 문장 복사 {c['copied']}개) → 중복 제거 후 {len(work)}개 문장")
+
+    saved = []
+
+    def finish(video_id: str) -> None:
+        """영상을 계획에서 빼고 저장합니다 (끝내 실패한 자막은 영어 포함 fallback으로 채움)."""
+        video = plan.pop(video_id)
+        results = video.final_results()
+        merged = apply_results(video.subtitles, results)
+        if merged == 0:
+            video.journal.close()
+            print(f"  ✗ {video_id}: 발음 데이터를 생성하지 못했습니다.")
+            return
+        overlap_fixed = save_subtitles(video_path(video_id), video.subtitles)
+        video.journal.discard()
+        complete = mark_has_pronunciation(video_id, video.subtitles)
+        saved.append(video_id)
+        print(f"  ✅ {video_id}: {merged}/{len(video.targets)}개 저장"
+              + ("" if complete else " (발음 없는 자막 남음)")
+              + f" — 영상 {len(saved)}/{len(targets_by_video)}")
+        english = sorted(idx for idx in video.fallback if idx not in video.results)
+        if english:
+            print(f"    ⚠ 발음에 영어 포함된 채로 저장: {english}")
+        if overlap_fixed:
+            print(f"    🔧 자막 시간 겹침 {overlap_fixed}건 수정")
+        missing = [s['index'] for s in video.targets if s['index'] not in results]
+        if missing:
+            print(f"    ⚠ 누락된 인덱스: {missing}")
+
+    last_flush = None
+    flushed = {}
+
+    def flush(force: bool = False) -> None:
+        """아직 끝나지 않은 영상 중 새 결과가 있는 영상의 중간 결과를 저장합니다 (--progressive)."""
+        nonlocal last_flush
+        if not progressive or (not force and last_flush is not None
+                               and time.monotonic() - last_flush < PROGRESSIVE_FLUSH_INTERVAL):
+            return
+        for video_id, video in plan.videos.items():
+            if flushed.get(video_id, 0) == len(video.results):
+                continue
+            apply_results(video.subtitles, video.results)
+            save_subtitles(video_path(video_id), video.subtitles)
+            mark_has_pronunciation(video_id, video.subtitles)
+            flushed[video_id] = len(video.results)
+            progress = pronunciation_progress(video.subtitles)
+            print(f"    💾 {video_id} 중간 저장: {progress['done']}/{progress['total']}개, "
+                  f"처음 {progress['readyUntil']:.0f}초까지 학습 가능")
+        last_flush = time.monotonic()
+
+    def assign(items: list) -> None:
+        for video_id in plan.assign(items):
+            finish(video_id)
+
+    # 작업 기록/캐시/규칙/번역 메모리만으로 끝난 영상은 저장하고, 나머지는 채운 만큼 바로 공개
+    for video_id in plan.finished():
+        finish(video_id)
+    flush(force=True)
+
+    start_budget = token_budget or (PROGRESSIVE_START_BUDGET if progressive else DEFAULT_BUDGET)
+    routed, batchers, tier_stats = plan_tiers(work, start_budget, batch_size, route_models, route_threshold)
+    if work:
+        print(f"  🔊 발음 데이터 생성 시작 ({len(work)}개 문장, 약 {batch_tokens(work):,} 토큰, "
+              f"배치 예산 {start_budget:.0f} 토큰" + (f", 동시 {jobs}개" if jobs > 1 else "") + ")")
+
+    failed = set()
+    batch_num = 0
+    escalated = []
+    for tier, batch, response, elapsed in run_tiers(routed, batchers, jobs, escalated):
+        batch_num += 1
+        expected = [w['index'] for w in batch]
+        batch_result = resolve_reference_notes(parse_json_response(response), batch)
+        validated, fallback = validate_batch(batch_result, expected, verbose=False)
+        # 응답을 못 받았거나(시간 초과 등) 파싱할 수 없으면 다음 배치를 줄임
+        batchers[tier].record(batch, elapsed, ok=bool(batch_result))
+        done = {item['index'] for item in validated}
+        if tier_stats:
+            tier_stats.record(tier, batch, len(validated), elapsed)
+        if tier == TIER_FAST:
+            # 빠른 모델 결과 표시 (작업 기록에도 남겨, 이어서 실행해도 캐시에 넣지 않음)
+            for item in validated:
+                item['tier'] = tier
+            # 빠른 모델이 실패한 문장은 기본 모델 단계로 승격
+            missed = [w for w in batch if w['index'] not in done]
+            escalated.extend(missed)
+            tier_stats.escalated += len(missed)
+        else:
+            failed.update(i for i in expected if i not in done)
+        print(f"  📦 배치 {batch_num} ({len(batch)}개, ~{batch_tokens(batch)} 토큰, {elapsed:.1f}s): "
+              f"{len(validated)}/{len(batch)} 완료")
+        assign(validated)
+        plan.assign(fallback, fallback=True)
+        # 영상 첫 부분은 첫 배치가 끝나는 즉시 공개
+        flush(force=batch_num == 1)
+
+    for tier, batcher in batchers.items():
+        if batcher.batches:
+            print(f"  📊 {tier + ': ' if tier else ''}{batcher.report()}")
+    if tier_stats:
+        for line in tier_stats.report().splitlines():
+            print(f"  🧭 {line}")
+
+    # 실패한 문장 재시도 (모아서 보내고 실패하면 반씩 나눔)
+    if failed and retry:
+        retry_work = [w for w in work if w['index'] in failed]
+        print(f"\n  🔄 실패한 {len(retry_work)}개 문장 재시도...")
+        retried, fb, calls = retry_failed(retry_work, jobs, list(batchers.values())[-1].budget, batch_size,
+                                          on_validated=assign)
+        plan.assign([item for i, item in fb.items() if i not in retried], fallback=True)
+        print(f"    ✓ {len(retried)}/{len(retry_work)} 재시도 성공 "
+              f"(claude 호출 {calls}회, 문장별 재시도라면 {len(retry_work)}회)")
+
+    # 일부 자막이 끝내 실패한 영상도 받은 만큼 저장
+    for video_id in list(plan.videos):
+        finish(video_id)
+
+    if cache:
+        print(f"  💾 {cache.report()}")
+        cache.close()
+    return len(saved)
 
 
 def main():
@@ -279,18 +698,71 @@ def main():
 예시:
   python gen_pronunciation.py mQ2e7Gzafuw          # 특정 영상
   python gen_pronunciation.py --all                 # 발음 없는 모든 영상
-  python gen_pronunciation.py VIDEO_ID --batch-size 12  # 배치 크기 조절
+  python gen_pronunciation.py VIDEO_ID --token-budget 2000  # 배치 토큰 예산 시작값
   python gen_pronunciation.py VIDEO_ID --no-retry       # 재시도 없이 실행
+  python gen_pronunciation.py VIDEO_ID --jobs 4         # claude 4개 동시 실행
+  python gen_pronunciation.py VIDEO_ID --persistent     # claude 상주 워커 사용
+  python gen_pronunciation.py VIDEO_ID --incremental    # 바뀐/없는 자막만 생성
+  python gen_pronunciation.py VIDEO_ID --no-resume      # 이전 실행 기록 무시
+  python gen_pronunciation.py VIDEO_ID --progressive    # 앞부분부터 생성하며 중간 저장
+  python gen_pronunciation.py VIDEO_ID --route          # 쉬운 자막은 빠른 모델로
+  python gen_pronunciation.py --all --stamp-untracked   # 이전 발음 데이터에 textHash 기록 (한 번만)
+
+중간에 멈춘 실행은 같은 명령을 다시 실행하면 이어서 진행합니다 (--all 포함).
         '''
     )
 
     parser.add_argument('video_id', nargs='?', help='영상 ID')
     parser.add_argument('--all', action='store_true', help='발음 데이터 없는 모든 영상 처리')
-    parser.add_argument('--batch-size', type=int, default=24, help='배치 크기 (기본: 24)')
+    parser.add_argument('--batch-size', type=int, default=40, help='배치당 최대 자막 수 (기본: 40)')
+    parser.add_argument('--token-budget', type=int, default=None,
+                        help='배치 토큰 예산 시작값 (기본: 3600, 실행 중 소요 시간/실패에 따라 조정)')
     parser.add_argument('--no-retry', action='store_true', help='실패 항목 재시도 안 함')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='동시에 실행할 claude 프로세스 수 (기본: 1, 순차)')
+    parser.add_argument('--persistent', action='store_true',
+                        help='claude를 배치마다 띄우지 않고 --jobs개의 상주 워커(stream-json)로 처리합니다')
+    parser.add_argument('--incremental', action='store_true',
+                        help='발음이 없거나 텍스트가 바뀐 자막만 다시 생성합니다')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='발음 캐시를 사용하지 않습니다 (모든 문장을 claude에 보냄)')
+    parser.add_argument('--no-rules', action='store_true',
+                        help='규칙 사전으로 채울 수 있는 짧은 문장도 모두 claude에 보냅니다')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='번역 메모리(다른 자막의 비슷한 문장)를 쓰지 않습니다')
+    parser.add_argument('--memory-reuse', type=float, default=None, metavar='SIMILARITY',
+                        help='번역 메모리 결과를 그대로 쓸 최소 유사도 '
+                             '(0~1, 기본: 1.0 = 대소문자/문장부호만 다른 문장)')
+    parser.add_argument('--progressive', action='store_true',
+                        help='영상 앞부분부터 작은 배치로 생성하고 중간 결과를 주기적으로 저장합니다 '
+                             '(끝나기 전에 앞부분부터 학습 가능)')
+    parser.add_argument('--route', action='store_true',
+                        help='난이도가 낮은 자막은 빠른 모델(haiku)로 보내고, 어려운 자막과 빠른 모델이 '
+                             '검증에 실패한 자막은 기본 모델로 보냅니다')
+    parser.add_argument('--route-threshold', type=float, default=None, metavar='SCORE',
+                        help='--route에서 빠른 모델로 보낼 최대 난이도 점수 (기본: 1.2)')
+    parser.add_argument('--no-resume', action='store_true',
+                        help='중단된 이전 실행의 기록을 지우고 처음부터 생성합니다')
+    parser.add_argument('--stamp-untracked', action='store_true',
+                        help='발음은 있지만 textHash가 없는 이전 자막에 현재 텍스트 해시를 기록하고 끝냅니다 '
+                             '(생성하지 않음, 기능 도입 후 한 번만)')
 
     args = parser.parse_args()
 
+    if args.stamp_untracked:
+        if args.all:
+            video_ids = [v['id'] for v in load_index() if video_path(v['id']).exists()]
+        elif args.video_id:
+            video_ids = [args.video_id]
+        else:
+            parser.print_help()
+            return
+        for video_id in video_ids:
+            stamped = stamp_untracked(video_id)
+            if stamped:
+                print(f"  🏷 {video_id}: textHash {stamped}개 기록")
+        return
+
     # claude CLI 확인
     try:
         subprocess.run(['claude', '--version'], capture_output=True, timeout=5)
@@ -299,26 +771,44 @@ def main():
         print("  Claude Code 설치: https://docs.anthropic.com/en/docs/claude-code")
         sys.exit(1)
 
-    if args.all:
-        if not INDEX_FILE.exists():
-            print("✗ index.json이 없습니다.")
-            sys.exit(1)
-        index = json.loads(INDEX_FILE.read_text(encoding='utf-8'))
-        targets = [v for v in index if not v.get('hasPronunciation')]
-        if not targets:
-            print("✓ 모든 영상에 발음 데이터가 있습니다.")
-            return
-        print(f"🎬 발음 데이터 생성 대상: {len(targets)}개 영상\n")
-        for v in targets:
-            print(f"━━━ {v['title']} ({v['id']}) ━━━")
-            generate_for_video(v['id'], args.batch_size, retry=not args.no_retry)
-            print()
-    elif args.video_id:
-        print(f"🎬 발음 데이터 생성: {args.video_id}")
-        generate_for_video(args.video_id, args.batch_size, retry=not args.no_retry)
-    else:
-        parser.print_help()
+    if args.persistent:
+        start_workers(args.jobs)
+
+    # 검증된 배치 결과는 작업 기록에 남아 있으므로 같은 명령으로 이어서 실행할 수 있음
+    try:
+        if args.all:
+            if not INDEX_FILE.exists():
+                print("✗ index.json이 없습니다.")
+                sys.exit(1)
+            index = load_index()
+            # --incremental이면 모든 영상을 보고 바뀐 자막이 있는 영상만 처리
+            targets = index if args.incremental else [v for v in index if not v.get('hasPronunciation')]
+            if not targets:
+                print("✓ 모든 영상에 발음 데이터가 있습니다.")
+                return
+            # 모든 영상의 자막을 하나의 작업 큐로 (같은 문장은 한 번만, 끝난 영상부터 저장)
+            generate_for_corpus([v['id'] for v in targets], args.batch_size, retry=not args.no_retry,
+                                jobs=args.jobs, use_cache=not args.no_cache,
+                                resume=not args.no_resume, token_budget=args.token_budget,
+                                use_rules=not args.no_rules, use_memory=not args.no_memory,
+                                memory_reuse=args.memory_reuse, progressive=args.progressive,
+                                route_models=args.route, route_threshold=args.route_threshold)
+        elif args.video_id:
+            print(f"🎬 발음 데이터 생성: {args.video_id}")
+            generate_for_video(args.video_id, args.batch_size, retry=not args.no_retry, jobs=args.jobs,
+                               use_cache=not args.no_cache, incremental=args.incremental,
+                               resume=not args.no_resume, token_budget=args.token_budget,
+                               use_rules=not args.no_rules, use_memory=not args.no_memory,
+                               memory_reuse=args.memory_reuse, progressive=args.progressive,
+                               route_models=args.route, route_threshold=args.route_threshold)
+        else:
+            parser.print_help()
 
+    except KeyboardInterrupt:
+        print("\n⏸ 중단됨 — 같은 명령을 다시 실행하면 완료된 배치는 건너뛰고 이어서 진행합니다.")
+        sys.exit(130)
+    finally:
+        stop_workers()
 
 if __name__ == '__main__':
     main()
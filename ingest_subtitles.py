@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk - 로컬 자막 파일 일괄 등록 (오프라인)
+
+이미 가지고 있는 VTT/SRT 파일(yt-dlp 보관본 등)을 네트워크 없이 public/videos에 등록합니다.
+파일 파싱 → 중복 병합 → 겹침 제거 → 문장 보정을 프로세스 풀에서 영상별로 병렬 처리하고,
+{video_id}.json을 쓴 뒤 index.json을 한 번에 갱신합니다.
+
+파일명은 yt-dlp 형식({video_id}.{언어}.vtt 또는 {video_id}.srt)이어야 합니다.
+한 영상에 여러 언어 파일이 있으면 extract_subtitles와 같은 우선순위(수동 영어 > 수동 한국어 >
+자동 영어 > ...)로 하나를 고릅니다. 같은 폴더의 {video_id}.info.json(yt-dlp --write-info-json)이
+있으면 제목/채널/길이를 가져옵니다.
+
+사용법:
+    python ingest_subtitles.py ~/archive/subs
+    python ingest_subtitles.py ~/archive/subs --jobs 8 --overwrite
+    python ingest_subtitles.py ~/archive/subs --no-sentence-fix
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+
+from video_store import VIDEOS_DIR, load_index, save_video_data, update_index
+
+PROJECT_DIR = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_DIR))
+
+SUBTITLE_SUFFIXES = ('.vtt', '.srt')
+VIDEO_ID_RE = re.compile(r'^[a-zA-Z0-9_-]{11}$')
+
+
+def find_subtitle_files(root: Path) -> dict:
+    """폴더 아래의 자막 파일을 video_id별로 모읍니다. {video_id: [경로, ...]}"""
+    groups = defaultdict(list)
+    for path in sorted(root.rglob('*')):
+        if path.suffix.lower() in SUBTITLE_SUFFIXES and path.is_file():
+            groups[path.name.split('.')[0]].append(str(path))
+    return dict(groups)
+
+
+def read_info_json(paths: list) -> dict:
+    """자막 파일 옆의 {video_id}.info.json에서 메타데이터를 읽습니다. 없으면 빈 dict."""
+    first = Path(paths[0])
+    info_path = first.parent / f"{first.name.split('.')[0]}.info.json"
+    try:
+        info = json.loads(info_path.read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return {
+        'title': info.get('title'),
+        'channel': info.get('channel') or info.get('uploader'),
+        'duration': int(info.get('duration') or 0),
+    }
+
+
+def _init_worker(verbose: bool):
+    if not verbose:
+        logging.disable(logging.INFO)
+
+
+def process_video(video_id: str, paths: list, fix_sentences: bool = True) -> dict:
+    """영상 하나의 자막 파일을 처리해 {video_id}.json으로 저장합니다 (프로세스 풀 작업 단위).
+
+    Returns: index.json 항목을 만들 정보 (subtitleCount, duration, 선택한 파일)
+    """
+    from extract_subtitles import SubtitleExtractor, _SubtitleTrack
+
+    extractor = SubtitleExtractor()
+
+    # 파일별로 파싱 — 단어별 타임스탬프가 있으면 자동 생성 자막, 없으면 수동 자막으로 간주
+    parsed = {}
+    tracks = []
+    for path in paths:
+        cues = extractor._parse_subtitle_file(path)
+        if not cues:
+            continue
+        parsed[path] = cues
+        tracks.append(_SubtitleTrack(
+            language_code=extractor._subtitle_file_language(path),
+            is_generated=extractor._has_word_timings(cues),
+            path=path,
+        ))
+    if not tracks:
+        raise ValueError("자막 내용이 없습니다")
+
+    selected = extractor._select_track(tracks)
+    subtitles = extractor.postprocess(parsed[selected.path], selected.is_generated, fix_sentences)
+    if not subtitles:
+        raise ValueError("처리 후 남은 자막이 없습니다")
+
+    save_video_data(video_id, subtitles)
+    return {
+        'subtitleCount': len(subtitles),
+        'duration': int(subtitles[-1]['end']),
+        'source': os.path.basename(selected.path),
+    }
+
+
+def update_index(results: dict, metadata: dict) -> int:
+    """처리 결과로 index.json을 갱신합니다. 갱신 후 전체 영상 수를 반환합니다."""
+    today = str(date.today())
+
+    def update(index):
+        by_id = {v['id']: v for v in index}
+        for video_id, result in results.items():
+            meta = metadata.get(video_id, {})
+            entry = by_id.get(video_id)
+            if entry is None:
+                entry = {'id': video_id, 'title': video_id, 'channel': ''}
+                index.append(entry)
+            entry.update({
+                'title': meta.get('title') or entry.get('title') or video_id,
+                'channel': meta.get('channel') or entry.get('channel', ''),
+                'subtitleCount': result['subtitleCount'],
+                'duration': meta.get('duration') or result['duration'],
+                'hasPronunciation': False,
+                'addedAt': today,
+            })
+
+    return len(update_index(update))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='MovieTalk - 로컬 VTT/SRT 파일을 네트워크 없이 일괄 등록',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''
+예시:
+  python ingest_subtitles.py ~/archive/subs
+  python ingest_subtitles.py ~/archive/subs --jobs 8 --overwrite
+        '''
+    )
+    parser.add_argument('directory', help='자막 파일 폴더 (하위 폴더 포함)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='동시에 처리할 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--overwrite', action='store_true',
+                        help='이미 등록된 영상도 덮어씁니다 (발음 데이터는 사라짐)')
+    parser.add_argument('--no-sentence-fix', action='store_true',
+                        help='문장 단위 자막 보정을 건너뜁니다')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='작업 프로세스의 처리 로그도 출력합니다')
+    args = parser.parse_args()
+
+    from movietalk import configure_logging
+    configure_logging()
+
+    root = Path(args.directory).expanduser()
+    if not root.is_dir():
+        print(f"✗ 폴더가 없습니다: {root}")
+        sys.exit(1)
+
+    groups = find_subtitle_files(root)
+    invalid = sorted(vid for vid in groups if not VIDEO_ID_RE.match(vid))
+    for vid in invalid:
+        print(f"   ⚠ YouTube 비디오 ID가 아닌 파일명이라 건너뜀: {groups.pop(vid)[0]}")
+
+    if not args.overwrite:
+        registered = {v['id'] for v in load_index()} | {p.stem for p in VIDEOS_DIR.glob('*.json')}
+        skipped = sorted(vid for vid in groups if vid in registered)
+        for vid in skipped:
+            del groups[vid]
+        if skipped:
+            print(f"   ℹ 이미 등록된 영상 {len(skipped)}개 건너뜀 (--overwrite로 덮어쓰기)")
+
+    if not groups:
+        print("✓ 등록할 자막 파일이 없습니다.")
+        return
+
+    jobs = max(1, min(args.jobs, len(groups)))
+    print(f"\n📥 {len(groups)}개 영상 등록 (프로세스 {jobs}개)")
+
+    results, failed = {}, {}
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(args.verbose,)) as pool:
+        futures = {
+            pool.submit(process_video, vid, paths, not args.no_sentence_fix): vid
+            for vid, paths in groups.items()
+        }
+        for future in as_completed(futures):
+            vid = futures[future]
+            try:
+                results[vid] = future.result()
+                print(f"   ✓ {vid}: {results[vid]['subtitleCount']}개 자막 ({results[vid]['source']})")
+            except Exception as e:
+                failed[vid] = e
+                print(f"   ✗ {vid}: {e}")
+
+    if results:
+        metadata = {vid: read_info_json(groups[vid]) for vid in results}
+        total = update_index(results, metadata)
+        print(f"\n   ✓ index.json 업데이트 ({total}개 영상)")
+
+    print(f"\n✅ 완료: 성공 {len(results)}개, 실패 {len(failed)}개")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
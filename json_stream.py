@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk LLM 응답용 점진적 JSON 배열 파서
+
+LLM이 돌려주는 `[ {...}, {...}, ... ]` 형태의 응답을 조각(스트리밍 델타)으로 받아,
+객체 하나가 닫히는 즉시 json.loads로 검사해 돌려줍니다.
+
+- 배열 앞의 설명 문장이나 ```json 코드 블록 표시는 건너뜁니다
+  ('[' 다음이 '{'나 ']'가 아니면 배열 시작으로 보지 않음).
+- 형식이 잘못된 항목 하나는 그 항목만 버리고(errors 증가) 다음 항목을 계속 읽습니다.
+- 응답이 중간에 끊겨도(max_tokens, 시간 초과) 그때까지 닫힌 항목은 모두 남습니다.
+
+사용 예:
+    stream = JSONItemStream()
+    for delta in deltas:
+        for item in stream.feed(delta):
+            ...
+    items = parse_json_items(full_text)
+"""
+
+import json
+import re
+from typing import Dict, List
+
+# 항목 안에서 깊이/문자열 상태를 바꾸는 문자
+_ITEM_SPECIAL = re.compile(r'[\[\]{}"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+_SEEK, _OPEN, _ARRAY, _ITEM, _DONE = range(5)
+
+
+class JSONItemStream:
+    """JSON 배열을 조각으로 받아 닫힌 객체 항목을 바로 돌려주는 파서"""
+
+    def __init__(self):
+        self.items: List[Dict] = []
+        self.errors = 0
+        self._state = _SEEK
+        self._buf: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def done(self) -> bool:
+        """배열의 닫는 ']'까지 읽었는지 (False면 응답이 끊긴 것)"""
+        return self._state == _DONE
+
+    def feed(self, chunk: str) -> List[Dict]:
+        """조각 하나를 읽고 이번에 새로 닫힌 항목 목록을 반환합니다."""
+        new = []
+        pos, n = 0, len(chunk)
+        while pos < n and self._state != _DONE:
+            if self._state == _ITEM:
+                pos = self._scan_item(chunk, pos, new)
+                continue
+
+            ch = chunk[pos]
+            pos += 1
+            if self._state == _SEEK:
+                if ch == '[':
+                    self._state = _OPEN
+            elif self._state == _OPEN:
+                if ch.isspace():
+                    continue
+                if ch == '{':
+                    self._start_item()
+                elif ch == ']':
+                    self._state = _DONE
+                else:
+                    # "[참고]" 같은 설명 속 괄호 — 다시 배열 시작을 찾음
+                    self._state = _OPEN if ch == '[' else _SEEK
+            elif self._state == _ARRAY:
+                # 항목 사이의 쉼표/공백은 건너뜀
+                if ch == '{':
+                    self._start_item()
+                elif ch == ']':
+                    self._state = _DONE
+        return new
+
+    def _start_item(self) -> None:
+        self._state = _ITEM
+        self._buf = ['{']
+        self._depth = 1
+        self._in_string = False
+        self._escape = False
+
+    def _scan_item(self, chunk: str, pos: int, new: List[Dict]) -> int:
+        """항목 안을 특수 문자 단위로 건너뛰며 읽습니다. 다음 읽을 위치를 반환합니다."""
+        n = len(chunk)
+        while pos < n:
+            if self._escape:
+                self._escape = False
+                self._buf.append(chunk[pos])
+                pos += 1
+                continue
+            match = (_STRING_SPECIAL if self._in_string else _ITEM_SPECIAL).search(chunk, pos)
+            if match is None:
+                self._buf.append(chunk[pos:])
+                return n
+            end = match.end()
+            self._buf.append(chunk[pos:end])
+            pos = end
+            ch = match.group()
+            if self._in_string:
+                if ch == '\\':
+                    self._escape = True
+                else:
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in '{[':
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._close_item(new)
+                    return pos
+        return pos
+
+    def _close_item(self, new: List[Dict]) -> None:
+        self._state = _ARRAY
+        try:
+            item = json.loads(''.join(self._buf))
+        except json.JSONDecodeError:
+            item = None
+        self._buf = []
+        if isinstance(item, dict):
+            self.items.append(item)
+            new.append(item)
+        else:
+            self.errors += 1
+
+
+def parse_json_items(text: str) -> List[Dict]:
+    """응답 전체 텍스트에서 JSON 배열의 올바른 객체 항목을 모두 꺼냅니다."""
+    if not text:
+        return []
+    return JSONItemStream().feed(text)
@@ -11,7 +11,7 @@
 합친 후:
 - text: 앞 + " " + 뒤
 - start: 앞의 start, end: 뒤의 end
-- pronunciation/translation/notes: 삭제 (재생성 필요)
+- pronunciation/translation/notes/textHash: 삭제 (재생성 필요 → gen_pronunciation.py --incremental)
 - index: 0부터 순차 재부여
 """
 
@@ -21,7 +21,7 @@ import os
 import re
 import copy
 
-VIDEOS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public", "videos")
+from video_store import load_index, video_path, write_json_atomic
 
 
 def word_count(text):
@@ -114,7 +114,7 @@ def merge_subtitles(subtitles, video_id=""):
                 # 타임프레임 확장
                 current["end"] = next_sub["end"]
                 # 발음/번역/노트 제거 (재생성 필요)
-                for key in ["pronunciation", "translation", "notes"]:
+                for key in ["pronunciation", "translation", "notes", "textHash"]:
                     if key in current:
                         del current[key]
 
@@ -134,7 +134,7 @@ def merge_subtitles(subtitles, video_id=""):
 
 def process_video(video_id, dry_run=True):
     """비디오 하나 처리"""
-    filepath = os.path.join(VIDEOS_DIR, f"{video_id}.json")
+    filepath = video_path(video_id)
     if not os.path.exists(filepath):
         print(f"  ❌ 파일 없음: {filepath}")
         return None
@@ -159,8 +159,7 @@ def process_video(video_id, dry_run=True):
             print(f"       [{idx[0]}]+[{idx[1]}] \"{into}...\" ← \"{frm}\"")
 
     if not dry_run and reduced > 0:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(merged, f, ensure_ascii=False, indent=2)
+        write_json_atomic(filepath, merged)
         print(f"     ✅ 저장 완료")
 
     return {
@@ -187,9 +186,7 @@ def main():
         print("⚡ APPLY 모드 (실제 파일 수정)")
 
     # index.json 로드
-    index_path = os.path.join(VIDEOS_DIR, "index.json")
-    with open(index_path, "r", encoding="utf-8") as f:
-        videos = json.load(f)
+    videos = load_index()
 
     results = []
     for video in videos:
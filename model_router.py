@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 난이도별 모델 라우팅
+
+모든 배치를 같은 모델로 보내면 "Thank you so much." 같은 쉬운 자막도 가장 느리고 비싼 모델을
+기다립니다. 이 모듈은 자막마다 난이도 점수를 매겨 쉬운 자막은 빠른 모델(fast),
+어려운 자막은 기본 모델(strong)로 보냅니다.
+
+- 난이도 점수 (difficulty):
+    길이: 단어 10개당 1점
+    연음/축약 패턴: gonna/want to 같은 축약, d/t+you 구개음화, 모음+t+모음 플랩 하나당 0.3점
+    드문 단어: 규칙 발음 사전(rule_pronunciation.WORDS)에 없는 4글자 이상 단어 하나당 0.25점
+  threshold(기본 1.2, 코퍼스 자막의 약 40%가 fast) 이하면 fast입니다.
+- 승격: fast 모델의 결과가 validate_batch를 통과하지 못한 자막(누락, 발음에 영어 포함)은
+  strong 모델로 다시 보냅니다. strong에서도 실패하면 기존 이분법 재시도로 넘어갑니다.
+- 발음 캐시(pronunciation_cache)는 모델을 구분하지 않으므로 fast 모델 결과는 캐시에 넣지 않습니다.
+- TierStats: 모델 단계별 배치 수, 소요 시간, 검증 통과율, 승격 수를 모아 보고합니다.
+
+사용 예:
+    routed = route(pending)            # {'fast': [...], 'strong': [...]}
+    stats = TierStats()
+    stats.record(TIER_FAST, batch, accepted=len(validated), elapsed=3.2)
+    print(stats.report())
+"""
+
+import re
+from typing import Dict, List
+
+from anthropic_backend import DEFAULT_MODEL, FAST_MODEL
+from pronunciation_cache import normalize_text
+
+TIER_FAST = 'fast'
+TIER_STRONG = 'strong'
+TIERS = (TIER_FAST, TIER_STRONG)   # 실행 순서 (fast에서 승격된 자막이 strong 배치에 합류)
+
+# claude CLI --model 별칭 (None이면 CLI 기본 모델)
+CLI_MODELS = {TIER_FAST: 'haiku', TIER_STRONG: None}
+# Anthropic API 모델 ID
+API_MODELS = {TIER_FAST: FAST_MODEL, TIER_STRONG: DEFAULT_MODEL}
+
+DEFAULT_THRESHOLD = 1.2
+
+WORDS_PER_POINT = 10
+CONNECTED_WEIGHT = 0.3
+RARE_WEIGHT = 0.25
+RARE_MIN_LENGTH = 4
+
+_WORD = re.compile(r"[a-z]+(?:'[a-z]+)?")
+_CONNECTED = (
+    # 축약 (gonna, want to → 워나 ...)
+    re.compile(r"\b(?:gonna|wanna|gotta|kinda|sorta|lemme|gimme|dunno|y'all|ain't"
+               r"|(?:going|want|got|have|has|ought|used|supposed) to)\b"),
+    # 구개음화 (did you → 디쥬, what you → 와추)
+    re.compile(r"[dt] (?:you|your|yet)\b"),
+    # 플랩 (water → 워러, got it → 가릿)
+    re.compile(r"[aeiou]tt?(?: ?[aeiou]|er\b|le\b)"),
+)
+
+
+def difficulty(text: str) -> float:
+    """자막 하나의 난이도 점수 (길이 + 연음/축약 패턴 + 드문 단어)"""
+    from rule_pronunciation import WORDS
+
+    low = normalize_text(text).lower()
+    words = _WORD.findall(low)
+    connected = sum(len(p.findall(low)) for p in _CONNECTED)
+    rare = sum(1 for w in words if len(w) >= RARE_MIN_LENGTH and w not in WORDS)
+    return len(words) / WORDS_PER_POINT + CONNECTED_WEIGHT * connected + RARE_WEIGHT * rare
+
+
+def route(cues: List[Dict], threshold: float = DEFAULT_THRESHOLD) -> Dict[str, List[Dict]]:
+    """자막을 난이도로 나눕니다. 각 단계 안에서는 자막 순서를 유지합니다."""
+    routed = {tier: [] for tier in TIERS}
+    for s in cues:
+        routed[TIER_FAST if difficulty(s['text']) <= threshold else TIER_STRONG].append(s)
+    return routed
+
+
+class TierStats:
+    """모델 단계별 지연 시간/검증 통과율 집계"""
+
+    def __init__(self):
+        self.stats = {tier: {'batches': 0, 'cues': 0, 'accepted': 0, 'seconds': 0.0} for tier in TIERS}
+        self.escalated = 0
+
+    def record(self, tier: str, batch: List[Dict], accepted: int, elapsed: float = 0.0) -> None:
+        s = self.stats[tier]
+        s['batches'] += 1
+        s['cues'] += len(batch)
+        s['accepted'] += accepted
+        s['seconds'] += elapsed
+
+    def add_latency(self, tier: str, seconds: float) -> None:
+        """배치와 따로 잰 응답 시간을 더합니다 (API 경로: 요청마다 잰 시간)."""
+        self.stats[tier]['seconds'] += seconds
+
+    def report(self) -> str:
+        """단계별 요약 (여러 줄)"""
+        lines = []
+        for tier in TIERS:
+            s = self.stats[tier]
+            if not s['batches']:
+                continue
+            lines.append(f"{tier}: 배치 {s['batches']}개, 자막 {s['cues']}개, "
+                         f"통과 {s['accepted'] / s['cues']:.0%}, 배치당 {s['seconds'] / s['batches']:.1f}초, "
+                         f"자막당 {s['seconds'] / s['cues']:.2f}초")
+        if self.escalated:
+            lines.append(f"fast → strong 승격 {self.escalated}개")
+        return '\n'.join(lines)
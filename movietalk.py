@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 통합 명령
+
+각 스크립트를 하위 명령으로 실행합니다. 하위 명령의 모듈은 실행할 때만 import하므로
+`movietalk.py --help`는 yt-dlp/anthropic 등 무거운 모듈을 전혀 불러오지 않습니다.
+로깅은 여기(또는 각 스크립트의 main)에서만 설정합니다.
+
+사용법:
+    python movietalk.py add "https://www.youtube.com/watch?v=VIDEO_ID"
+    python movietalk.py extract URL -o subtitles.json
+    python movietalk.py fetch-en VIDEO_ID --stdout
+    python movietalk.py pronounce VIDEO_ID
+    python movietalk.py merge --apply
+    python movietalk.py ingest ~/archive/subs --jobs 8
+    python movietalk.py add --help           # 하위 명령 도움말
+"""
+
+import argparse
+import importlib
+import logging
+import sys
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# 하위 명령 → (모듈, 설명)
+COMMANDS = {
+    'add': ('add_video', '새 영상 추가 (메타데이터, 자막, 발음 데이터)'),
+    'extract': ('extract_subtitles', '유튜브 자막을 JSON으로 추출'),
+    'fetch-en': ('fetch_english_subs', '영어 자막만 추출'),
+    'pronounce': ('gen_pronunciation', 'Claude Code로 발음 데이터 생성'),
+    'merge': ('merge_subtitles', '짧은 자막 조각 합치기'),
+    'ingest': ('ingest_subtitles', '로컬 VTT/SRT 파일 일괄 등록 (오프라인)'),
+}
+
+
+def configure_logging(verbose: bool = False, log_file: str = None) -> None:
+    """루트 로거 설정 (stderr, 선택적으로 파일).
+
+    이미 설정돼 있으면 기본 설정은 그대로 두지만, verbose나 log_file을 넘기면 기존 설정을 바꿉니다
+    (movietalk가 하위 명령 전에 기본 설정을 해 두므로 하위 명령의 --log-file이 무시되지 않도록).
+    """
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file, encoding='utf-8'))
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO,
+        format=LOG_FORMAT,
+        handlers=handlers,
+        force=bool(verbose or log_file),
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='movietalk',
+        description='MovieTalk - 영상 추가 및 자막/발음 데이터 관리',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='하위 명령:\n' + '\n'.join(
+            f'  {name:<10} {desc}' for name, (_, desc) in COMMANDS.items()
+        ) + '\n\n각 명령의 옵션: movietalk <명령> --help',
+    )
+    parser.add_argument('command', choices=COMMANDS, metavar='<명령>')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    module_name, _ = COMMANDS[args.command]
+    configure_logging()
+    module = importlib.import_module(module_name)
+
+    # 하위 명령의 main은 sys.argv를 읽으므로 prog와 인자를 바꿔 넘김
+    sys.argv = [f'movietalk {args.command}'] + args.args
+    return module.main()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 발음 생성 배치 묶기
+
+자막 개수가 아니라 토큰 예산으로 배치를 묶습니다. 긴 독백 자막이 몰린 배치는 작게,
+짧은 자막은 많이 묶어서 배치마다 드는 고정 비용(claude 실행, 요청 왕복)을 줄입니다.
+
+- estimate_cue_tokens(): 자막 하나의 입력(프롬프트 한 줄) + 출력(발음/번역/노트 JSON) 토큰 추정.
+  글자 수 기반이므로 대략적인 값입니다.
+- pack_batches(): 고정 예산으로 미리 묶기 (add_video의 API 경로처럼 한꺼번에 보내는 경우).
+- AdaptiveBatcher: 실행 중 배치별 소요 시간과 실패를 보고 예산을 조정합니다.
+  처리 속도(토큰/초)의 이동 평균으로 "시간 제한의 target_fraction 안에 끝나는 크기"를 목표로
+  키우거나 줄이고, 실패(시간 초과, 응답 파싱 실패)하면 바로 절반으로 줄입니다.
+
+사용 예:
+    batcher = AdaptiveBatcher(budget=3600, max_cues=40, timeout=120)
+    batch = batcher.take(queue)          # queue: 남은 자막 deque
+    ...
+    batcher.record(batch, elapsed, ok)
+"""
+
+from collections import deque
+from typing import Dict, List, Optional
+
+CUE_OVERHEAD_TOKENS = 80    # 자막 하나당 JSON 키, index, notes 등 고정 출력
+TOKENS_PER_CHAR = 1.5       # 영어 원문 1글자당 입력 + 한글 발음/번역 출력 토큰
+
+DEFAULT_BUDGET = 3600       # 평균 길이 자막 24개 정도
+MIN_BUDGET = 150
+MAX_BUDGET = 12000
+
+
+def estimate_cue_tokens(text: str) -> int:
+    """자막 하나를 보내고 결과를 받는 데 드는 토큰 수 추정"""
+    return CUE_OVERHEAD_TOKENS + int(len(text) * TOKENS_PER_CHAR)
+
+
+def batch_tokens(batch: List[Dict]) -> int:
+    return sum(estimate_cue_tokens(s['text']) for s in batch)
+
+
+def _take(queue: deque, budget: float, max_cues: int) -> List[Dict]:
+    """queue 앞에서부터 예산/개수 한도까지 꺼냅니다. 예산보다 큰 자막이라도 최소 하나는 꺼냄."""
+    batch = []
+    used = 0
+    while queue and len(batch) < max_cues:
+        cost = estimate_cue_tokens(queue[0]['text'])
+        if batch and used + cost > budget:
+            break
+        batch.append(queue.popleft())
+        used += cost
+    return batch
+
+
+def pack_batches(cues: List[Dict], budget: float = DEFAULT_BUDGET, max_cues: int = 40) -> List[List[Dict]]:
+    """자막 목록을 순서대로 토큰 예산 단위 배치로 나눕니다."""
+    queue = deque(cues)
+    batches = []
+    while queue:
+        batches.append(_take(queue, budget, max_cues))
+    return batches
+
+
+class AdaptiveBatcher:
+    """관측한 소요 시간/실패로 배치 토큰 예산을 조정하는 배치 생성기 (한 스레드에서 사용)"""
+
+    def __init__(self, budget: float = DEFAULT_BUDGET, max_cues: int = 40, timeout: float = 120.0,
+                 target_fraction: float = 0.5, min_budget: float = MIN_BUDGET,
+                 max_budget: float = MAX_BUDGET):
+        self.budget = float(budget)
+        self.max_cues = max_cues
+        self.target_seconds = timeout * target_fraction
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.rate: Optional[float] = None   # 토큰/초 이동 평균
+        self.batches = 0
+        self.failures = 0
+        self.cues_done = 0
+        self.seconds = 0.0
+
+    def take(self, queue: deque) -> List[Dict]:
+        """남은 자막 queue에서 현재 예산만큼 다음 배치를 꺼냅니다."""
+        return _take(queue, self.budget, self.max_cues)
+
+    def record(self, batch: List[Dict], elapsed: float, ok: bool) -> None:
+        """끝난 배치의 결과를 반영합니다. ok는 응답을 받아 파싱까지 됐는지 여부."""
+        self.batches += 1
+        self.seconds += elapsed
+        if not ok:
+            # 시간 초과/실패: 곱셈 감소로 바로 줄임
+            self.failures += 1
+            self.budget = max(self.min_budget, self.budget / 2)
+            return
+
+        self.cues_done += len(batch)
+        rate = batch_tokens(batch) / max(elapsed, 0.1)
+        self.rate = rate if self.rate is None else 0.7 * self.rate + 0.3 * rate
+        # 목표 시간 안에 끝날 크기로, 한 번에 1.5배 넘게는 키우지 않음
+        target = self.rate * self.target_seconds
+        self.budget = min(self.max_budget, self.budget * 1.5, max(self.min_budget, target))
+
+    def report(self) -> str:
+        """실행 요약 한 줄"""
+        throughput = self.cues_done / self.seconds if self.seconds else 0.0
+        return (f"배치 {self.batches}개 (실패 {self.failures}), 최종 예산 {self.budget:.0f} 토큰, "
+                f"{throughput:.2f} 자막/초")
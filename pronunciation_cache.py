@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 발음/번역 캐시
+
+같은 문장(인사말, 패턴 연습 영상, merge_subtitles로 다시 합친 자막 등)을 LLM에 반복해서
+보내지 않도록 발음/번역/발음 포인트를 로컬 SQLite 파일에 저장합니다.
+
+- key는 (프롬프트 버전, 정규화한 자막 텍스트)의 SHA-256 해시입니다.
+  프롬프트 버전은 프롬프트 템플릿의 해시이므로 프롬프트를 고치면 자동으로 새 항목을 씁니다.
+- 항목 수가 max_entries를 넘으면 가장 오래 쓰이지 않은 항목부터 지웁니다.
+- hits / misses로 이번 실행의 적중률을 보고합니다.
+
+자막 파일 쪽에서는 발음을 만든 시점의 텍스트 해시(textHash)를 자막마다 저장해 두고,
+cue_state()로 자막별 상태(생성됨 / 텍스트가 바뀜 / 없음)를 판단합니다.
+textHash가 없는 이전 데이터는 자동으로 기록하지 않고 gen_pronunciation.py --stamp-untracked로 한 번 기록합니다.
+
+사용법:
+    python pronunciation_cache.py --stats      # 캐시 크기 / 누적 적중 수
+    python pronunciation_cache.py --clear      # 캐시 비우기
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PROJECT_DIR = Path(__file__).parent
+DEFAULT_CACHE_PATH = Path(os.environ.get('MOVIETALK_CACHE_DIR', PROJECT_DIR / '.cache')) / 'pronunciation.sqlite3'
+
+DEFAULT_MAX_ENTRIES = 200_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    prompt_version TEXT NOT NULL,
+    text TEXT NOT NULL,
+    pronunciation TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    notes TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    used_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS entries_used_at ON entries(used_at);
+"""
+
+
+def prompt_version(template: str) -> str:
+    """프롬프트 템플릿으로 버전 문자열을 만듭니다 (템플릿이 바뀌면 값도 바뀜)."""
+    return hashlib.sha256(template.encode('utf-8')).hexdigest()[:12]
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화: 유니코드 NFC, 공백 정리, 곧은 따옴표로 통일."""
+    text = unicodedata.normalize('NFC', text)
+    text = text.replace('’', "'").replace('‘', "'").replace('“', '"').replace('”', '"')
+    return ' '.join(text.split())
+
+
+# cue_state() 반환값
+CUE_GENERATED = 'generated'   # 발음이 있고 현재 텍스트로 만든 것
+CUE_STALE = 'stale'           # 발음을 만든 뒤 텍스트가 바뀜 (합치기/나누기 등)
+CUE_MISSING = 'missing'       # 발음 없음
+CUE_UNTRACKED = 'untracked'   # 발음은 있지만 textHash가 없음 (이 기능 이전에 생성된 데이터)
+
+# 자막 편집기(vite.config.js 합치기/나누기)가 발음을 어림잡아 나눈/이어붙인 자막에 쓰는 textHash.
+# 어떤 텍스트 해시와도 같지 않으므로 cue_state()가 항상 CUE_STALE로 봅니다.
+EDITED_TEXT_HASH = 'edited'
+
+
+def text_hash(text: str) -> str:
+    """자막 텍스트 해시 (발음을 만든 시점의 텍스트를 기록하는 용도)"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()[:16]
+
+
+def cue_state(sub: Dict) -> str:
+    """자막 하나의 발음 데이터 상태"""
+    if not sub.get('pronunciation'):
+        return CUE_MISSING
+    stored = sub.get('textHash')
+    if stored is None:
+        return CUE_UNTRACKED
+    return CUE_GENERATED if stored == text_hash(sub['text']) else CUE_STALE
+
+
+class PronunciationCache:
+    """(프롬프트 버전, 자막 텍스트) → {pronunciation, translation, notes} SQLite 캐시"""
+
+    def __init__(self, path=None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    @staticmethod
+    def make_key(text: str, version: str) -> str:
+        raw = f"{version}\0{normalize_text(text)}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get_many(self, texts: Iterable[str], version: str) -> Dict[str, Dict]:
+        """텍스트 목록 중 캐시에 있는 것을 {텍스트: {pronunciation, translation, notes}}로 반환합니다.
+
+        적중/실패 수는 중복을 포함한 조회 횟수로 셉니다.
+        """
+        texts = list(texts)
+        keys = {t: self.make_key(t, version) for t in texts}
+        found = {}
+        unique_keys = list(set(keys.values()))
+        # SQLite 변수 개수 제한(기본 999) 안에서 나눠 조회
+        for i in range(0, len(unique_keys), 500):
+            chunk = unique_keys[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT key, pronunciation, translation, notes FROM entries "
+                f"WHERE key IN ({','.join('?' * len(chunk))})", chunk,
+            )
+            for key, pronunciation, translation, notes in rows:
+                found[key] = {'pronunciation': pronunciation, 'translation': translation,
+                              'notes': json.loads(notes)}
+
+        result = {t: found[k] for t, k in keys.items() if k in found}
+        hit_count = sum(1 for t in texts if t in result)
+        self.hits += hit_count
+        self.misses += len(texts) - hit_count
+
+        if found:
+            now = time.time()
+            with self.conn:
+                self.conn.executemany(
+                    "UPDATE entries SET used_at = ?, hits = hits + 1 WHERE key = ?",
+                    [(now, k) for k in found],
+                )
+        return result
+
+    def put_many(self, items: Iterable[Tuple[str, Dict]], version: str) -> int:
+        """(자막 텍스트, 결과) 목록을 저장합니다. 결과에는 pronunciation, translation(, notes)이 있어야 합니다.
+
+        Returns: 저장한 항목 수
+        """
+        now = time.time()
+        rows = [
+            (self.make_key(text, version), version, normalize_text(text), r['pronunciation'],
+             r.get('translation', ''), json.dumps(r.get('notes', []), ensure_ascii=False), now, now)
+            for text, r in items if r.get('pronunciation')
+        ]
+        if not rows:
+            return 0
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO entries "
+                "(key, prompt_version, text, pronunciation, translation, notes, created_at, used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows,
+            )
+        self.evict()
+        return len(rows)
+
+    def evict(self) -> int:
+        """max_entries를 넘는 만큼 가장 오래 쓰이지 않은 항목을 지웁니다. 지운 수를 반환합니다."""
+        count = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        excess = count - self.max_entries
+        if excess <= 0:
+            return 0
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY used_at LIMIT ?)", (excess,),
+            )
+        return excess
+
+    def hit_rate(self) -> Optional[float]:
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    def report(self) -> str:
+        """이번 실행의 적중률 한 줄 요약"""
+        rate = self.hit_rate()
+        if rate is None:
+            return "발음 캐시: 조회 없음"
+        return f"발음 캐시: {self.hits}/{self.hits + self.misses} 적중 ({rate:.0%})"
+
+    def stats(self) -> Dict:
+        entries, hits = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM entries").fetchone()
+        versions = self.conn.execute(
+            "SELECT prompt_version, COUNT(*) FROM entries GROUP BY prompt_version").fetchall()
+        return {'entries': entries, 'total_hits': hits, 'versions': dict(versions),
+                'size_bytes': self.path.stat().st_size if self.path.exists() else 0}
+
+    def clear(self) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM entries")
+        self.conn.execute("VACUUM")
+
+
+def lookup_subtitles(cache: PronunciationCache, subtitles: List[Dict], version: str) -> Dict[int, Dict]:
+    """자막 목록에서 캐시에 있는 항목을 {자막 index: 결과}로 반환합니다."""
+    found = cache.get_many([s['text'] for s in subtitles], version)
+    return {s['index']: found[s['text']] for s in subtitles if s['text'] in found}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MovieTalk 발음/번역 캐시 관리')
+    parser.add_argument('--stats', action='store_true', help='캐시 크기와 누적 적중 수 출력')
+    parser.add_argument('--clear', action='store_true', help='캐시 비우기')
+    args = parser.parse_args()
+
+    with PronunciationCache() as cache:
+        if args.clear:
+            cache.clear()
+            print(f"✓ 발음 캐시를 비웠습니다: {cache.path}")
+        else:
+            s = cache.stats()
+            print(f"📦 {cache.path}")
+            print(f"   항목 {s['entries']:,}개 / 최대 {cache.max_entries:,}개, "
+                  f"{s['size_bytes'] / 1e6:.1f} MB, 누적 적중 {s['total_hits']:,}회")
+            for version, n in s['versions'].items():
+                print(f"   프롬프트 {version}: {n:,}개")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 발음 생성 작업 기록 (중단 후 이어하기)
+
+gen_pronunciation은 모든 배치가 끝난 뒤에 영상 파일을 한 번에 저장하므로, 중간에 멈추면
+(Ctrl+C, 시간 초과, 오류) 그때까지 받은 결과가 사라집니다. 이를 막기 위해 검증을 통과한
+배치 결과를 영상별 JSONL 파일에 한 줄씩 덧붙여 두고, 다시 실행하면 기록된 자막은 건너뜁니다.
+
+구조:
+    {cache_dir}/journal/{video_id}.jsonl
+
+- 한 줄이 자막 하나의 결과입니다: {"v", "index", "textHash", "pronunciation", "translation", "notes"}
+  빠른 모델(--route의 fast 단계) 결과는 "tier"도 남겨, 이어서 실행할 때도 발음 캐시에 넣지 않게 합니다.
+- 배치마다 flush + fsync하므로 프로세스가 죽어도 그 전 배치까지는 남습니다.
+  마지막 줄이 쓰다 만 상태로 남으면 읽을 때 무시합니다.
+- 프롬프트 버전(v)이나 자막 텍스트 해시(textHash)가 지금과 다르면 그 기록은 쓰지 않습니다.
+- 영상 파일을 저장하면 기록을 지웁니다.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable
+
+PROJECT_DIR = Path(__file__).parent
+DEFAULT_JOURNAL_DIR = Path(os.environ.get('MOVIETALK_CACHE_DIR', PROJECT_DIR / '.cache')) / 'journal'
+
+
+class PronunciationJournal:
+    """영상 하나의 발음 생성 결과를 덧붙여 기록하는 파일"""
+
+    def __init__(self, video_id: str, version: str, journal_dir=None):
+        self.path = Path(journal_dir or DEFAULT_JOURNAL_DIR) / f"{video_id}.jsonl"
+        self.version = version
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def load(self, subtitles: Iterable[Dict]) -> Dict[int, Dict]:
+        """기록된 결과 중 지금 자막 텍스트와 맞는 것을 {index: 결과}로 반환합니다."""
+        from pronunciation_cache import text_hash
+
+        if not self.path.exists():
+            return {}
+        hashes = {s['index']: text_hash(s['text']) for s in subtitles}
+        results = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 쓰다 만 줄
+                idx = record.get('index')
+                if record.get('v') == self.version and record.get('textHash') == hashes.get(idx):
+                    results[idx] = {
+                        'index': idx,
+                        'pronunciation': record['pronunciation'],
+                        'translation': record.get('translation', ''),
+                        'notes': record.get('notes', []),
+                    }
+                    if record.get('tier'):
+                        results[idx]['tier'] = record['tier']
+        return results
+
+    def append(self, items: Iterable[Dict], texts: Dict[int, str]) -> None:
+        """검증을 통과한 결과를 기록하고 디스크에 내려씁니다. texts는 {index: 자막 텍스트}.
+
+        결과에 tier(만든 모델 단계)가 있으면 함께 기록합니다.
+        """
+        from pronunciation_cache import text_hash
+
+        lines = []
+        for item in items:
+            record = {
+                'v': self.version,
+                'index': item['index'],
+                'textHash': text_hash(texts[item['index']]),
+                'pronunciation': item['pronunciation'],
+                'translation': item.get('translation', ''),
+                'notes': item.get('notes', []),
+            }
+            if item.get('tier'):
+                record['tier'] = item['tier']
+            lines.append(json.dumps(record, ensure_ascii=False) + '\n')
+        if not lines:
+            return
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(''.join(lines))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """영상 파일에 결과를 저장한 뒤 기록을 지웁니다."""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
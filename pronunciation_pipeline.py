@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 발음 생성 계획 (로컬에서 채우기 → 작업 묶기 → 결과 나눠 주기)
+
+gen_pronunciation(영상 하나, --all)과 add_video(API)가 함께 쓰는 계층입니다.
+모델 호출(claude CLI / Anthropic API), 배치 구성, 파일 저장은 호출한 쪽이 맡습니다.
+
+1. add_video(): 영상의 대상 자막을 등록하고, 작업 기록(pronunciation_journal)이 있으면 이어서 채웁니다.
+2. resolve_local(): 발음 캐시 → 규칙 발음(rule_pronunciation) → 번역 메모리(translation_memory) 순으로 채우고,
+   번역 메모리의 비슷한 자막은 프롬프트 참고(reference)로 남겨 둡니다.
+3. plan_work(): 남은 자막 중 같은 문장(use_memory면 대소문자/문장부호 차이도 무시)은 작업 하나로 묶습니다.
+   이미 결과가 있는 자막과 같은 문장이면 그 결과를 복사합니다.
+   남은 자막이 적은 영상부터, 영상 안에서는 자막 순서로 넣어 짧은 영상과 영상 앞부분이 먼저 끝나게 합니다.
+4. assign(): 작업 결과를 같은 문장을 가진 모든 자막에 채우고, 작업 기록과 발음 캐시에 남깁니다.
+   fallback(발음에 영어 포함)과 빠른 모델 결과(tier가 fast)는 캐시에 넣지 않습니다.
+
+사용 예:
+    plan = PronunciationPlan(version, cache=cache)
+    plan.add_video(video_id, subtitles, targets, journal)
+    plan.resolve_local()
+    work = plan.plan_work()            # [{'index': 작업 번호, 'text', 'reference'?}, ...]
+    ...
+    for video_id in plan.assign(validated):
+        video = plan.pop(video_id)     # 다 채워진 영상 → 저장
+"""
+
+from collections import Counter, defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from model_router import TIER_FAST
+from pronunciation_batcher import DEFAULT_BUDGET
+from pronunciation_cache import normalize_text
+from translation_memory import match_key
+
+
+class PlannedVideo:
+    """계획에 든 영상 하나의 상태"""
+
+    def __init__(self, subtitles: List[Dict], targets: List[Dict], journal=None):
+        self.subtitles = subtitles
+        self.targets = targets
+        self.texts = {s['index']: s['text'] for s in subtitles}
+        self.journal = journal
+        self.results: Dict[int, Dict] = {}      # 자막 index → 결과
+        self.fallback: Dict[int, Dict] = {}     # 자막 index → 발음에 영어가 섞인 결과 (끝내 실패하면 이걸로 채움)
+        self.references: Dict[int, Dict] = {}   # 자막 index → 번역 메모리의 비슷한 자막
+        self.remaining = set()                  # 작업 결과를 기다리는 자막 index
+        self.resumed = 0
+
+    def pending(self) -> List[Dict]:
+        """아직 결과가 없는 대상 자막"""
+        return [s for s in self.targets if s['index'] not in self.results]
+
+    def final_results(self) -> Dict[int, Dict]:
+        """결과에 fallback을 더한 것 (결과가 없는 자막만 fallback으로 채움)"""
+        results = dict(self.fallback)
+        results.update(self.results)
+        return results
+
+
+class PronunciationPlan:
+    """여러 영상의 발음 생성 대상을 로컬에서 채우고, 남은 문장을 작업으로 묶어 결과를 나눠 주는 계획"""
+
+    def __init__(self, version: str, cache=None, use_memory: bool = True):
+        self.version = version
+        self.cache = cache
+        self.use_memory = use_memory
+        self.videos: Dict[str, PlannedVideo] = {}
+        self.work: List[Dict] = []
+        self.work_text: Dict[int, str] = {}
+        self.owners: Dict[int, List[Tuple[str, int]]] = {}   # 작업 번호 → [(video_id, 자막 index), ...]
+        self.counts = Counter()   # resumed, cached, ruled, reused, copied
+
+    def key(self, text: str) -> str:
+        """같은 문장으로 묶는 기준"""
+        return match_key(text) if self.use_memory else normalize_text(text)
+
+    def add_video(self, video_id: str, subtitles: List[Dict], targets: List[Dict],
+                  journal=None, resume: bool = True) -> int:
+        """영상의 대상 자막을 등록합니다. resume이면 작업 기록의 결과부터 채우고, 채운 수를 반환합니다."""
+        video = PlannedVideo(subtitles, targets, journal)
+        if journal is not None:
+            if resume:
+                target_indices = {s['index'] for s in targets}
+                video.results = {idx: r for idx, r in journal.load(targets).items() if idx in target_indices}
+            else:
+                journal.discard()
+        video.resumed = len(video.results)
+        self.counts['resumed'] += video.resumed
+        self.videos[video_id] = video
+        return video.resumed
+
+    def resolve_local(self, use_rules: bool = True, memory_reuse: float = None, exclude: Iterable[str] = (),
+                      budget: float = DEFAULT_BUDGET, max_cues: int = 40,
+                      on_report: Optional[Callable[[str, str, str], None]] = None) -> None:
+        """발음 캐시 → 규칙 발음 → 번역 메모리 순으로 채웁니다 (모델을 부르지 않음).
+
+        번역 메모리는 계획에 든 영상과 exclude의 예전 자막을 빼고 만듭니다.
+        budget/max_cues는 규칙 발음 보고(줄어드는 배치 수 추정)에 씁니다.
+        on_report(video_id, 아이콘, 메시지)로 영상별 규칙/번역 메모리 적용 결과를 알립니다.
+        """
+        if self.cache:
+            found = self.cache.get_many([s['text'] for v in self.videos.values() for s in v.pending()],
+                                        self.version)
+            for v in self.videos.values():
+                for s in v.pending():
+                    if s['text'] in found:
+                        v.results[s['index']] = dict(found[s['text']], index=s['index'])
+                        self.counts['cached'] += 1
+
+        if use_rules:
+            from rule_pronunciation import fill_known, report
+            for video_id, v in self.videos.items():
+                pending = v.pending()
+                filled = fill_known(pending)
+                if filled and on_report:
+                    on_report(video_id, '📐', report(pending, filled, budget, max_cues))
+                v.results.update(filled)
+                self.counts['ruled'] += len(filled)
+
+        if self.use_memory and any(v.pending() for v in self.videos.values()):
+            from translation_memory import DEFAULT_REUSE, TranslationMemory, lookup
+            from translation_memory import report as memory_report
+            memory = TranslationMemory.load(exclude=set(self.videos) | set(exclude))
+            for video_id, v in self.videos.items():
+                pending = v.pending()
+                if not pending:
+                    continue
+                reused, v.references = lookup(memory, pending, reuse=memory_reuse or DEFAULT_REUSE)
+                if (reused or v.references) and on_report:
+                    on_report(video_id, '🧠', memory_report(memory, pending, reused, v.references))
+                v.results.update(reused)
+                self.counts['reused'] += len(reused)
+
+    def plan_work(self) -> List[Dict]:
+        """남은 자막을 작업 목록으로 묶습니다 (작업 번호는 1부터).
+
+        작업 항목은 {'index': 작업 번호, 'text', 'reference'?}로 build_prompt에 그대로 넣을 수 있습니다.
+        """
+        resolved = {}
+        for v in self.videos.values():
+            for s in v.targets:
+                if s['index'] in v.results:
+                    resolved.setdefault(self.key(s['text']), v.results[s['index']])
+
+        self.work, self.owners = [], {}
+        by_key = {}
+        for video_id in sorted(self.videos, key=lambda vid: len(self.videos[vid].pending())):
+            v = self.videos[video_id]
+            v.remaining = set()
+            for s in v.pending():
+                key = self.key(s['text'])
+                if key in resolved:
+                    v.results[s['index']] = dict(resolved[key], index=s['index'])
+                    self.counts['copied'] += 1
+                    continue
+                v.remaining.add(s['index'])
+                if key not in by_key:
+                    by_key[key] = len(self.work) + 1
+                    item = {'index': by_key[key], 'text': s['text']}
+                    if s['index'] in v.references:
+                        item['reference'] = v.references[s['index']]
+                    self.work.append(item)
+                    self.owners[by_key[key]] = []
+                self.owners[by_key[key]].append((video_id, s['index']))
+        self.work_text = {w['index']: w['text'] for w in self.work}
+        return self.work
+
+    def assign(self, items: List[Dict], fallback: bool = False) -> List[str]:
+        """작업 결과를 같은 문장을 가진 모든 자막에 채웁니다. 이번에 다 채워진 영상 id 목록을 반환합니다.
+
+        검증을 통과한 결과는 영상별 작업 기록에 남기고 발음 캐시에 넣습니다.
+        fallback(발음에 영어 포함)은 다른 결과가 끝내 없을 때만 쓰며 기록하지 않습니다.
+        """
+        per_video = defaultdict(list)
+        for item in items:
+            for video_id, idx in self.owners[item['index']]:
+                v = self.videos.get(video_id)
+                if v is None:
+                    continue
+                result = dict(item, index=idx)
+                if fallback:
+                    v.fallback[idx] = result
+                    continue
+                v.results[idx] = result
+                v.remaining.discard(idx)
+                per_video[video_id].append(result)
+
+        finished = []
+        for video_id, results in per_video.items():
+            v = self.videos[video_id]
+            if v.journal is not None:
+                v.journal.append(results, v.texts)
+            if not v.remaining:
+                finished.append(video_id)
+        if self.cache and not fallback:
+            self.cache.put_many([(self.work_text[item['index']], item) for item in items
+                                 if item.get('tier') != TIER_FAST], self.version)
+        return finished
+
+    def finished(self) -> List[str]:
+        """작업 결과를 기다리는 자막이 없는 영상 id (plan_work 이후)"""
+        return [video_id for video_id, v in self.videos.items() if not v.remaining]
+
+    def pop(self, video_id: str) -> PlannedVideo:
+        """영상을 계획에서 빼서 반환합니다 (이후 그 영상의 결과는 assign이 무시)."""
+        return self.videos.pop(video_id)
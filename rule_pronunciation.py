@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 규칙 기반 발음 생성 (LLM 호출 전 단계)
+
+"Thank you.", "Let's go." 같은 짧은 정형 문장은 프롬프트에 적어 둔 규칙
+(t→ㄹ 플랩, gonna/wanna 축약, d+y→쥬, 연음)만으로 발음이 정해집니다.
+이런 자막은 LLM에 보내지 않고 여기서 바로 채웁니다.
+
+- 단어 발음 사전(WORDS)과 축약 구문(CONTRACTIONS)으로 단어를 한글로 바꾸고,
+  이웃한 단어 사이에 연음 규칙을 적용합니다.
+    축약: going to→거나, want to→워나, got to→가라 ...
+    구개음화: d+you→쥬, t+you→추 (did you→디쥬, what you→와추)
+    플랩: 모음+t 다음 모음 → ㄹ (got it→가릿, what is→와리즈)
+    연음: 자음 끝 + 모음 시작 → 받침을 다음 음절로 (look at→루캣, check it out→체키라웃)
+- 번역은 규칙으로 만들 수 없으므로 자주 나오는 정형 문장(PHRASES)과 감탄사(INTERJECTIONS)만
+  채웁니다. 모든 단어가 사전에 있고 문장 번역도 있을 때만 결과를 만들고, 아니면 None을 돌려줘
+  LLM에 보냅니다.
+- ♪, [Music], (laughs) 같은 소리 표시만 있는 자막도 여기서 채웁니다.
+- 발음 포인트(notes)는 축약/구개음화/플랩 규칙이 적용된 곳에서 최대 2개 만듭니다.
+
+사용 예:
+    result = transliterate("Look at this.")
+    # {'pronunciation': '루캣 디스.', 'translation': '이것 좀 봐.', 'notes': []}
+    results = fill_known(subtitles)   # {자막 index: 결과}
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from pronunciation_cache import normalize_text
+
+# 단어 → 한글 발음 (빠른 구어체 기준, 소문자, 곧은 따옴표)
+WORDS = {
+    # 대명사 / 한정사
+    'i': '아이', "i'm": '아임', "i'll": '아일', "i've": '아이브', "i'd": '아이드',
+    'you': '유', "you're": '유어', "you'll": '율', "you've": '유브', "you'd": '유드',
+    'your': '유어', 'yours': '유어즈', 'yourself': '유어셀프',
+    'he': '히', "he's": '히즈', 'him': '힘', 'his': '히즈',
+    'she': '쉬', "she's": '쉬즈', 'her': '허',
+    'it': '잇', "it's": '잇츠', 'its': '잇츠', 'itself': '잇셀프',
+    'we': '위', "we're": '위어', "we'll": '윌', "we've": '위브', 'us': '어스', 'our': '아워',
+    'they': '데이', "they're": '데어', 'them': '뎀', 'their': '데어',
+    'me': '미', 'my': '마이', 'myself': '마이셀프', 'mine': '마인',
+    'this': '디스', 'that': '댓', "that's": '댓츠', 'these': '디즈', 'those': '도즈',
+    'the': '더', 'a': '어', 'an': '언',
+    'some': '썸', 'any': '애니', 'all': '올', 'every': '에브리', 'no': '노', 'each': '이치',
+    'something': '썸띵', 'anything': '애니띵', 'everything': '에브리띵', 'nothing': '나띵',
+    'someone': '썸원', 'anyone': '애니원', 'everyone': '에브리원', 'everybody': '에브리바디',
+    'somebody': '썸바디', 'nobody': '노바디',
+    # 의문사
+    'what': '왓', "what's": '와츠', 'who': '후', "who's": '후즈', 'where': '웨어',
+    "where's": '웨어즈', 'when': '웬', 'why': '와이', 'how': '하우', "how's": '하우즈',
+    'which': '위치',
+    # be / 조동사
+    'is': '이즈', "isn't": '이즌', 'are': '아', "aren't": '안트', 'am': '앰',
+    'was': '워즈', "wasn't": '워즌', 'were': '워', "weren't": '워은트', 'be': '비', 'been': '빈',
+    'do': '두', "don't": '돈트', 'does': '더즈', "doesn't": '더즌', 'did': '디드', "didn't": '디든',
+    'have': '해브', 'has': '해즈', 'had': '해드', "haven't": '해븐', "hasn't": '해즌',
+    'can': '캔', "can't": '캔트', 'could': '쿠드', "couldn't": '쿠든',
+    'will': '윌', "won't": '원트', 'would': '우드', "wouldn't": '우든',
+    'should': '슈드', "shouldn't": '슈든', 'must': '머스트', 'might': '마잇', 'may': '메이',
+    # 자주 쓰는 동사
+    'go': '고', 'going': '고잉', 'goes': '고즈', 'gone': '건', 'went': '웬트',
+    'come': '컴', 'coming': '커밍', 'came': '케임',
+    'get': '겟', 'got': '갓', 'getting': '게링', 'gotta': '가라', 'gonna': '거나', 'wanna': '워나',
+    'make': '메이크', 'made': '메이드', 'take': '테이크', 'took': '툭', 'give': '기브', 'gave': '게이브',
+    'know': '노', 'knew': '뉴', 'think': '띵크', 'thought': '쏘트', 'see': '씨', 'saw': '쏘',
+    'look': '룩', 'looking': '루킹', 'looks': '룩스', 'watch': '와치', 'listen': '리슨',
+    'say': '세이', 'said': '세드', 'tell': '텔', 'told': '톨드', 'talk': '토크', 'ask': '애스크',
+    'want': '원트', 'need': '니드', 'like': '라이크', 'love': '러브', 'hate': '헤잇',
+    'let': '렛', "let's": '렛츠', 'help': '헬프', 'try': '트라이', 'wait': '웨잇', 'stop': '스탑',
+    'keep': '킵', 'put': '풋', 'feel': '필', 'find': '파인드', 'mean': '민', 'believe': '빌리브',
+    'happen': '해픈', 'happened': '해픈드', 'work': '워크', 'play': '플레이', 'eat': '잇',
+    'call': '콜', 'move': '무브', 'turn': '턴', 'hold': '홀드', 'stay': '스테이', 'run': '런',
+    'sit': '씻', 'stand': '스탠드', 'leave': '리브', 'check': '체크', 'show': '쇼', 'start': '스타트',
+    'shut': '셧', 'kidding': '키딩', 'forget': '퍼겟', 'remember': '리멤버', 'worry': '워리',
+    'care': '케어', 'guess': '게스', 'hope': '호프', 'sorry': '쏘리', 'thank': '땡크', 'thanks': '땡스',
+    'please': '플리즈', 'excuse': '익스큐즈', 'welcome': '웰컴', 'understand': '언더스탠드',
+    'agree': '어그리', 'mind': '마인드', 'matter': '매러', 'bet': '벳', 'promise': '프라미스',
+    'kill': '킬', 'die': '다이', 'live': '리브', 'buy': '바이', 'pay': '페이', 'open': '오픈',
+    'close': '클로즈', 'bring': '브링', 'miss': '미스', 'win': '윈', 'lose': '루즈',
+    # 부사 / 형용사
+    'not': '낫', 'so': '쏘', 'very': '베리', 'really': '리얼리', 'too': '투', 'just': '저스트',
+    'now': '나우', 'here': '히어', 'there': '데어', "there's": '데어즈', 'again': '어겐',
+    'already': '올레디', 'always': '올웨이즈', 'never': '네버', 'maybe': '메이비', 'still': '스틸',
+    'up': '업', 'down': '다운', 'out': '아웃', 'back': '백', 'away': '어웨이', 'over': '오버',
+    'right': '라잇', 'well': '웰', 'good': '굿', 'great': '그레잇', 'nice': '나이스', 'fine': '파인',
+    'bad': '배드', 'cool': '쿨', 'awesome': '오썸', 'amazing': '어메이징', 'perfect': '퍼펙트',
+    'beautiful': '뷰리풀', 'sure': '슈어', 'true': '트루', 'wrong': '렁', 'ready': '레디',
+    'okay': '오케이', 'ok': '오케이', 'alright': '올라잇', 'exactly': '이그잭틀리',
+    'absolutely': '앱설룻리', 'definitely': '데피닛리', 'totally': '토를리', 'seriously': '시리어슬리',
+    'course': '코스', 'much': '머치', 'more': '모어', 'little': '리를', 'lot': '랏', 'big': '빅',
+    'late': '레잇', 'fast': '패스트', 'slow': '슬로우', 'easy': '이지', 'hard': '하드', 'funny': '퍼니',
+    'happy': '해피', 'crazy': '크레이지', 'better': '베러', 'best': '베스트', 'last': '래스트',
+    'first': '퍼스트', 'next': '넥스트', 'same': '쎄임', 'other': '아더', 'new': '뉴', 'old': '올드',
+    'together': '투게더', 'home': '홈', 'today': '투데이', 'tonight': '투나잇', 'tomorrow': '투마로우',
+    'yesterday': '예스터데이', 'morning': '모닝', 'night': '나잇', 'day': '데이', 'time': '타임',
+    'ever': '에버', 'even': '이븐', 'only': '온리', 'also': '올쏘', 'almost': '올모스트',
+    # 전치사 / 접속사
+    'to': '투', 'of': '어브', 'in': '인', 'on': '온', 'at': '앳', 'for': '포', 'with': '위드',
+    'from': '프럼', 'about': '어바웃', 'by': '바이', 'into': '인투',
+    'and': '앤', 'or': '오어', 'but': '벗', 'if': '이프', 'because': '비코즈', 'than': '댄',
+    'then': '덴', 'as': '애즈', 'after': '애프터', 'before': '비포',
+    # 명사 (일상)
+    'man': '맨', 'guy': '가이', 'guys': '가이즈', 'girl': '걸', 'boy': '보이', 'baby': '베이비',
+    'mom': '맘', 'dad': '대드', 'friend': '프렌드', 'people': '피플', 'god': '갓', 'thing': '띵',
+    'things': '띵스', 'way': '웨이', 'idea': '아이디어', 'problem': '프라블럼', 'question': '퀘스천',
+    'minute': '미닛', 'second': '세컨드', 'moment': '모먼트', 'place': '플레이스', 'life': '라이프',
+    'world': '월드', 'name': '네임', 'job': '잡', 'deal': '딜', 'luck': '럭', 'fun': '펀',
+    'one': '원', 'two': '투', 'three': '쓰리', 'lunch': '런치', 'dinner': '디너', 'food': '푸드',
+    'water': '워러', 'car': '카', 'door': '도어', 'phone': '폰', 'money': '머니',
+    # 감탄사 / 응답
+    'yes': '예스', 'yeah': '예', 'yep': '옙', 'nope': '놉', 'hi': '하이', 'hey': '헤이',
+    'hello': '헬로', 'bye': '바이', 'goodbye': '굿바이', 'oh': '오', 'ah': '아', 'uh': '어', 'um': '엄',
+    'hmm': '흠', 'wow': '와우', 'whoa': '워', 'huh': '허', 'ha': '하', 'haha': '하하',
+    'hahaha': '하하하', 'oops': '웁스', 'ugh': '어그', 'yay': '예이', 'mm': '음',
+}
+
+# 여러 단어를 한 덩어리로 읽는 축약 구문 → (한글 발음, 발음 포인트 설명 또는 None)
+CONTRACTIONS = {
+    ('going', 'to'): ('거나', 'going to→gonna 축약'),
+    ('want', 'to'): ('워나', 'want to→wanna 축약'),
+    ('got', 'to'): ('가라', 'got to→gotta 축약, t→ㄹ 플랩'),
+    ('have', 'to'): ('해프터', 'have to의 v가 f로 바뀌고 to 약화'),
+    ('has', 'to'): ('해스터', 'has to의 s 무성음화, to 약화'),
+    ('kind', 'of'): ('카인더', 'kind of→kinda 축약'),
+    ('sort', 'of'): ('쏘러', 'sort of→sorta 축약, t→ㄹ 플랩'),
+    ('out', 'of'): ('아우러', 'out of의 t→ㄹ 플랩, of 약화'),
+    ('a', 'lot', 'of'): ('얼라러', 'a lot of의 t→ㄹ 플랩, of 약화'),
+    ('let', 'me'): ('레미', 'let me→lemme 축약'),
+    ('give', 'me'): ('기미', 'give me→gimme 축약'),
+    ("don't", 'know'): ('도노', "don't know→dunno 축약"),
+    ('thank', 'you'): ('땡큐', None),
+}
+_MAX_CONTRACTION = max(len(k) for k in CONTRACTIONS)
+
+# 정형 문장 (문장부호를 뺀 소문자) → 번역
+PHRASES = {
+    'thank you': '고마워요', 'thank you so much': '정말 고마워요', 'thank you very much': '정말 감사합니다',
+    'thanks': '고마워', 'thanks a lot': '정말 고마워', 'no thanks': '괜찮아요',
+    "you're welcome": '천만에요', 'hello': '안녕하세요', 'hi': '안녕', 'hey': '저기', 'hey guys': '안녕 여러분',
+    'hello everyone': '안녕하세요 여러분', 'hi everyone': '안녕하세요 여러분', 'good morning': '좋은 아침이에요',
+    'good night': '잘 자요', 'bye': '안녕', 'goodbye': '안녕히 가세요', 'see you': '또 봐요',
+    'see you later': '나중에 봐요', 'see you tomorrow': '내일 봐요', 'welcome back': '다시 오신 걸 환영해요',
+    "let's go": '가자', "let's do it": '해 보자', "let's see": '어디 보자', 'let me see': '어디 보자',
+    'here we go': '자, 간다', 'come on': '어서', 'come here': '이리 와', 'go away': '저리 가',
+    'look at this': '이것 좀 봐', 'look at that': '저것 좀 봐', 'look': '봐', 'listen': '들어 봐',
+    'wait': '잠깐', 'wait a minute': '잠깐만', 'wait a second': '잠깐만', 'hold on': '잠깐만',
+    'stop': '멈춰', 'stop it': '그만해', 'shut up': '닥쳐', 'get out': '나가', 'sit down': '앉아',
+    'think about it': '생각해 봐', 'check it out': '확인해 봐', 'watch this': '이거 봐', 'trust me': '날 믿어',
+    "i'm sorry": '미안해요', 'sorry': '미안해요', 'excuse me': '실례합니다', 'my bad': '내 잘못이야',
+    "i don't know": '모르겠어요', 'i know': '알아요', 'i see': '그렇군요', 'i got it': '알겠어',
+    'got it': '알겠어', 'i understand': '이해해요', 'i agree': '동의해요', 'i think so': '그런 것 같아요',
+    "i don't think so": '그렇지 않은 것 같아요', 'i love you': '사랑해', 'i miss you': '보고 싶어',
+    'i hope so': '그러길 바라요', 'i guess': '그런가 봐요', 'i promise': '약속할게', 'i mean it': '진심이야',
+    'yes': '네', 'yeah': '응', 'yep': '응', 'no': '아니', 'nope': '아니', 'okay': '알겠어', 'ok': '알겠어',
+    'alright': '좋아', 'all right': '좋아', 'sure': '물론이죠', 'of course': '물론이죠', 'exactly': '바로 그거야',
+    'absolutely': '물론이죠', 'definitely': '당연하지', 'really': '정말?', 'seriously': '진짜?', 'right': '맞아',
+    "that's right": '맞아요', 'me too': '나도', 'not really': '별로', 'not yet': '아직', 'why not': '왜 안 돼?',
+    'what': '뭐?', "what's up": '무슨 일이야?', 'what happened': '무슨 일이야?', 'what is it': '뭔데?',
+    "what's this": '이게 뭐야?', "what's that": '저게 뭐야?', 'what do you mean': '무슨 뜻이야?',
+    'who are you': '누구세요?', 'where are you': '어디야?', 'how are you': '잘 지내요?', 'how about you': '당신은요?',
+    'are you okay': '괜찮아요?', 'are you sure': '확실해요?', 'are you ready': '준비됐어요?',
+    'are you kidding me': '장난해?', 'you know': '있잖아', 'you know what': '그거 알아?',
+    'good': '좋아', 'good job': '잘했어', 'nice': '좋아', 'great': '좋아요', 'cool': '좋아', 'awesome': '멋져',
+    'perfect': '완벽해', 'amazing': '굉장해', 'wow': '와', 'oh my god': '세상에', 'oh god': '맙소사',
+    'no way': '말도 안 돼', 'never mind': '신경 쓰지 마', "don't worry": '걱정 마', 'take care': '잘 지내',
+    'good luck': '행운을 빌어', 'have fun': '즐거운 시간 보내', 'be careful': '조심해', 'help': '도와줘',
+    'help me': '도와줘', 'please': '제발', 'it is what it is': '어쩔 수 없지', "that's it": '그게 다야',
+    "that's all": '그게 다예요', "it's okay": '괜찮아요', "it's fine": '괜찮아요', "i'm fine": '괜찮아요',
+    "i'm okay": '괜찮아요', "i'm ready": '준비됐어요', "i'm here": '나 여기 있어', "i'm coming": '지금 가요',
+    "you're right": '네 말이 맞아', 'well done': '잘했어', 'let me know': '알려 줘', 'me neither': '나도 아니야',
+    'so good': '너무 좋아', 'so cool': '너무 멋져', 'same here': '나도 그래', 'say it again': '다시 말해 봐',
+}
+
+# 감탄사만으로 된 줄의 번역 (단어별로 이어 붙임)
+INTERJECTIONS = {
+    'oh': '오', 'ah': '아', 'uh': '어', 'um': '음', 'hmm': '흠', 'mm': '음', 'huh': '응?', 'wow': '와',
+    'whoa': '워', 'ha': '하', 'haha': '하하', 'hahaha': '하하하', 'oops': '이런', 'ugh': '으',
+    'yay': '야호', 'yeah': '응', 'hey': '야',
+}
+
+# 소리 표시 (괄호 안 소문자) → 번역
+SOUND_TAGS = {
+    'music': '(음악)', 'applause': '(박수)', 'laughter': '(웃음)', 'laughs': '(웃음)', 'laughing': '(웃음)',
+    'cheering': '(환호)', 'silence': '(정적)', 'sighs': '(한숨)', 'inaudible': '(잘 들리지 않음)',
+}
+
+_TOKEN = re.compile(r"^([^A-Za-z']*)([A-Za-z][A-Za-z']*)?([^A-Za-z]*)$")
+_SOUND = re.compile(r'^[\s♪♫]*(?:[\[(]\s*([A-Za-z ]+?)\s*[\])][\s♪♫]*)*$')
+_SOUND_TAG = re.compile(r'[\[(]\s*([A-Za-z ]+?)\s*[\])]')
+
+# 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+_CHO = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_JONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+         'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+_JUNG_EU = 18                      # ㅡ
+_PURE_VOWELS = {0, 1, 4, 5, 8, 13, 20}   # ㅏㅐㅓㅔㅗㅜㅣ (반모음 ㅑ/ㅝ 등 앞에서는 연음하지 않음)
+_JUNG_U, _CHO_IEUNG = 13, 11
+
+
+def _decompose(syllable: str) -> Optional[tuple]:
+    code = ord(syllable) - 0xAC00
+    if not 0 <= code < 11172:
+        return None
+    return code // 588, (code % 588) // 28, code % 28
+
+
+def _compose(cho: int, jung: int, jong: int = 0) -> str:
+    return chr(0xAC00 + (cho * 21 + jung) * 28 + jong)
+
+
+def _split_final(hangul: str) -> Optional[tuple]:
+    """끝소리가 자음이면 (자음을 뺀 앞부분, 자음 초성 번호)를 반환합니다.
+
+    받침(ㅇ, 겹받침 제외)이나 '크/트/스'처럼 ㅡ를 붙여 쓴 마지막 음절을 자음으로 봅니다.
+    """
+    parts = _decompose(hangul[-1])
+    if parts is None:
+        return None
+    cho, jung, jong = parts
+    if jong:
+        consonant = _JONG[jong]
+        if consonant not in _CHO or consonant == 'ㅇ':
+            return None
+        return hangul[:-1] + _compose(cho, jung), _CHO.index(consonant)
+    if jung == _JUNG_EU and cho != _CHO_IEUNG and len(hangul) > 1:
+        return hangul[:-1], cho
+    return None
+
+
+def _link(onset: int, hangul: str) -> Optional[str]:
+    """다음 단어가 ㅇ+단모음으로 시작하면 첫 음절의 초성을 onset으로 바꿉니다."""
+    parts = _decompose(hangul[0])
+    if parts is None or parts[0] != _CHO_IEUNG or parts[1] not in _PURE_VOWELS:
+        return None
+    return _compose(onset, parts[1], parts[2]) + hangul[1:]
+
+
+class _Unit:
+    """한 덩어리로 읽는 단어(또는 축약 구문)"""
+
+    def __init__(self, words: List[str], hangul: str, prefix: str, suffix: str, note: Optional[str]):
+        self.words = words
+        self.hangul = hangul
+        self.base = hangul        # 연음 적용 전 사전 발음 (발음 포인트용)
+        self.prefix = prefix      # 단어 앞 문장부호
+        self.suffix = suffix      # 단어 뒤 문장부호
+        self.note = note
+        self.joined = False       # 앞 단위에 붙여 씀 (연음)
+
+
+def _connect(a: _Unit, b: _Unit) -> Optional[tuple]:
+    """a와 b 사이의 연음 규칙을 적용합니다. (a 발음, b 발음, 발음 포인트)를 반환합니다.
+
+    a가 앞 단위와 이미 연음됐으면 a.hangul은 앞 단어의 받침을 받은 형태이므로,
+    발음 포인트의 actual은 두 단어의 사전 발음(base)으로 따로 만듭니다.
+    """
+    last, first = a.words[-1], b.words[0]
+    split = _split_final(a.hangul)
+    if split is None:
+        return None
+    stem, consonant = split
+    # 받침으로 쓴 k/p/t는 모음 앞에서 제 소리로 (룩+앳→루캣, 스탑+잇→스타핏)
+    consonant = {('ㄱ', 'k'): 'ㅋ', ('ㅂ', 'p'): 'ㅍ', ('ㅅ', 't'): 'ㅌ'}.get((_CHO[consonant], last[-1]), _CHO[consonant])
+    consonant = _CHO.index(consonant)
+
+    # 구개음화: d/t + you → 쥬/추
+    if first in ('you', 'your', "you're") and last[-1] in 'dt' and _CHO[consonant] in 'ㄷㅌㅅ':
+        palatal = '쥬' if last[-1] == 'd' else '추'
+        b_hangul = palatal + b.hangul[1:]
+        sound = "d+y 구개음화로 '쥬' 발음" if palatal == '쥬' else "t+y 구개음화로 '추' 발음"
+        return stem, b_hangul, (f"{last} {first}", _own(a, b, stem) + b_hangul, sound)
+
+    # 플랩: 모음 + t 다음에 모음으로 시작하는 단어 → ㄹ
+    if last[-1] == 't' and len(last) > 1 and last[-2] in 'aeiou':
+        linked = _link(_CHO.index('ㄹ'), b.hangul)
+        if linked:
+            return stem, linked, (f"{last} {first}", _own(a, b, stem) + linked, 't+모음 연음, t→ㄹ 플랩')
+        return None
+
+    # 연음: 자음 끝 + 모음 시작
+    linked = _link(consonant, b.hangul)
+    if linked:
+        return stem, linked, None
+    return None
+
+
+def _own(a: _Unit, b: _Unit, stem: str) -> str:
+    """발음 포인트용 a의 발음: 앞 단위와의 연음을 뺀 사전 발음에서 받침만 b로 넘긴 형태"""
+    if a.hangul == a.base:
+        return stem
+    split = _split_final(a.base)
+    return split[0] if split else a.base
+
+
+def _units(text: str) -> Optional[List[_Unit]]:
+    tokens = []
+    for raw in text.replace('’', "'").split():
+        match = _TOKEN.match(raw)
+        if match is None or any(c.isdigit() for c in raw):
+            return None
+        prefix, word, suffix = match.groups()
+        tokens.append((prefix, (word or '').lower(), suffix))
+
+    units = []
+    i = 0
+    while i < len(tokens):
+        prefix, word, suffix = tokens[i]
+        if not word:
+            units.append(_Unit([], '', prefix + suffix, '', None))
+            i += 1
+            continue
+        # 가장 긴 축약 구문부터 (중간 단어에 문장부호가 없을 때만)
+        for size in range(min(_MAX_CONTRACTION, len(tokens) - i), 1, -1):
+            span = tokens[i:i + size]
+            key = tuple(t[1] for t in span)
+            if key in CONTRACTIONS and not any(t[2] for t in span[:-1]) and not any(t[0] for t in span[1:]):
+                hangul, note = CONTRACTIONS[key]
+                units.append(_Unit(list(key), hangul, prefix, span[-1][2], note))
+                i += size
+                break
+        else:
+            hangul = WORDS.get(word)
+            if hangul is None:
+                return None
+            units.append(_Unit([word], hangul, prefix, suffix, None))
+            i += 1
+    return units
+
+
+def _sound_only(text: str) -> Optional[Dict]:
+    """♪, [Music], (laughs) 같은 소리 표시만 있는 자막의 결과"""
+    if not _SOUND.match(text):
+        return None
+    tags = [t.lower() for t in _SOUND_TAG.findall(text)]
+    if any(t not in SOUND_TAGS for t in tags):
+        return None
+    marks = ' '.join(SOUND_TAGS[t] for t in tags) if tags else '♪'
+    return {'pronunciation': marks, 'translation': marks, 'notes': []}
+
+
+def _translate(words: List[str]) -> Optional[str]:
+    key = ' '.join(words)
+    if key in PHRASES:
+        return PHRASES[key]
+    if words and all(w in INTERJECTIONS for w in words):
+        return ' '.join(INTERJECTIONS[w] for w in words)
+    return None
+
+
+def transliterate(text: str) -> Optional[Dict]:
+    """자막 한 줄을 규칙으로 채운 결과 {pronunciation, translation, notes}를 반환합니다.
+
+    모르는 단어가 있거나 번역할 수 없는 문장이면 None (LLM에 보냄).
+    """
+    text = normalize_text(text)
+    if not text:
+        return None
+    sound = _sound_only(text)
+    if sound:
+        return sound
+
+    units = _units(text)
+    if not units:
+        return None
+    translation = _translate([w for u in units for w in u.words])
+    if translation is None:
+        return None
+
+    notes = [{'word': ' '.join(u.words), 'actual': u.hangul, 'meaning': u.note} for u in units if u.note]
+    for a, b in zip(units, units[1:]):
+        if not a.words or not b.words or a.suffix or b.prefix:
+            continue
+        connected = _connect(a, b)
+        if connected:
+            a.hangul, b.hangul, note = connected
+            b.joined = True
+            if note:
+                notes.append({'word': note[0], 'actual': note[1], 'meaning': note[2]})
+
+    parts = []
+    for u in units:
+        piece = u.prefix + u.hangul + u.suffix
+        if u.joined and parts:
+            parts[-1] += piece
+        else:
+            parts.append(piece)
+    pronunciation = ' '.join(p for p in parts if p)
+    # 문장 끝 부호는 번역에도 붙임 ("Sorry?" → "미안해요?")
+    end = text[-1] if text[-1] in '.?!' and translation[-1] not in '.?!' else ''
+    return {'pronunciation': pronunciation, 'translation': translation + end, 'notes': notes[:2]}
+
+
+def fill_known(subtitles: List[Dict]) -> Dict[int, Dict]:
+    """규칙으로 채울 수 있는 자막을 {자막 index: 결과}로 반환합니다."""
+    results = {}
+    for s in subtitles:
+        result = transliterate(s['text'])
+        if result:
+            results[s['index']] = dict(result, index=s['index'])
+    return results
+
+
+def report(pending: List[Dict], filled: Dict[int, Dict], budget: float, max_cues: int) -> str:
+    """규칙으로 채운 비율과 줄어든 LLM 배치 수를 한 줄로 요약합니다."""
+    from pronunciation_batcher import pack_batches
+
+    rest = [s for s in pending if s['index'] not in filled]
+    saved = len(pack_batches(pending, budget, max_cues)) - len(pack_batches(rest, budget, max_cues))
+    ratio = len(filled) / len(pending) if pending else 0.0
+    return f"규칙 발음 {len(filled)}/{len(pending)}개 ({ratio:.0%}), LLM 호출 {saved}회 절약"
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+claude 호출 방식 벤치마크: 배치마다 claude -p 실행 vs 상주 워커(stream-json)
+
+scripts/fake_claude_cli.py를 `claude`로 쓰는 임시 PATH를 만들고, 같은 자막 배치를
+두 방식으로 처리해 걸린 시간, 띄운 프로세스 수, 결과가 같은지 비교합니다.
+지연은 fake_claude_cli의 환경 변수(FAKE_CLAUDE_STARTUP 등)로 바꿀 수 있습니다.
+
+사용법:
+    python scripts/bench_claude_worker.py
+    python scripts/bench_claude_worker.py --cues 600 --jobs 2
+    FAKE_CLAUDE_STARTUP=3 python scripts/bench_claude_worker.py
+"""
+
+import argparse
+import os
+import stat
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR.parent))
+import gen_pronunciation  # noqa: E402
+from pronunciation_batcher import pack_batches  # noqa: E402
+
+WORDS = "so what I want to do today is show you how to practice speaking by yourself".split()
+
+
+def install_fake_claude(directory: str) -> None:
+    shim = Path(directory) / 'claude'
+    shim.write_text(f'#!/bin/sh\nexec "{sys.executable}" "{SCRIPTS_DIR / "fake_claude_cli.py"}" "$@"\n')
+    shim.chmod(shim.stat().st_mode | stat.S_IXUSR)
+    os.environ['PATH'] = directory + os.pathsep + os.environ['PATH']
+
+
+def run(batches: list, jobs: int) -> tuple:
+    t0 = time.perf_counter()
+    results = {}
+    for n, response in gen_pronunciation.run_prompts(
+            [gen_pronunciation.build_prompt(b) for b in batches], jobs):
+        for item in gen_pronunciation.parse_json_response(response):
+            results[item['index']] = item
+    return results, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='claude -p 반복 실행 vs 상주 워커 비교 (가짜 CLI)')
+    parser.add_argument('--cues', type=int, default=300, help='자막 수 (기본: 300)')
+    parser.add_argument('--budget', type=int, default=1200, help='배치 토큰 예산 (기본: 1200)')
+    parser.add_argument('--jobs', type=int, default=1, help='동시 프로세스/워커 수')
+    args = parser.parse_args()
+
+    cues = [{'index': i + 1, 'text': ' '.join(WORDS[:3 + i % 10])} for i in range(args.cues)]
+    batches = pack_batches(cues, args.budget)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        install_fake_claude(tmp)
+
+        process_results, process_time = run(batches, args.jobs)
+
+        gen_pronunciation.start_workers(args.jobs)
+        try:
+            worker_results, worker_time = run(batches, args.jobs)
+            started = gen_pronunciation._workers.processes_started
+        finally:
+            gen_pronunciation.stop_workers()
+
+    same = process_results == worker_results and len(worker_results) == len(cues)
+    print(f"자막 {len(cues)}개, 배치 {len(batches)}개, 동시 {args.jobs}개\n")
+    print(f"  claude -p 반복   {process_time:7.2f}s   프로세스 {len(batches)}개")
+    print(f"  상주 워커        {worker_time:7.2f}s   프로세스 {started}개")
+    print(f"\n  {process_time / worker_time:.1f}배 빠름, 결과 {'동일' if same else '다름!'}")
+    sys.exit(0 if same else 1)
+
+
+if __name__ == '__main__':
+    main()
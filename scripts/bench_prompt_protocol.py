@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+add_video API 경로 프롬프트 형식 비교: 이전 JSON 왕복 형식 vs INDEX=N TEXT 최소 출력 형식
+
+public/videos의 실제 자막(발음 데이터가 있는 자막)을 add_video와 같은 토큰 예산으로 배치로 묶고,
+배치마다 두 형식의 입력 프롬프트와 모델이 써야 하는 출력(이미 생성된 발음/번역/노트를 그대로 사용)의
+토큰 수를 셉니다. 지연 시간은 "입력 처리 + 출력 생성" 속도를 가정해 추정합니다.
+
+토큰 수는 영어 단어/숫자 묶음/한글 글자/기호를 각각 하나로 세는 근사치입니다 (실제 토크나이저 아님).
+
+사용법:
+    python scripts/bench_prompt_protocol.py
+    python scripts/bench_prompt_protocol.py --output-tps 80 --input-tps 4000
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+from add_video import API_BATCH_MAX_CUES, API_BATCH_TOKENS  # noqa: E402
+from gen_pronunciation import PROMPT_TEMPLATE, build_prompt  # noqa: E402
+from pronunciation_batcher import pack_batches  # noqa: E402
+from video_store import VIDEOS_DIR  # noqa: E402
+
+# 이전 add_video.API_PROMPT_TEMPLATE (자막 JSON을 그대로 넣고 시간/원문까지 되돌려 받음)
+LEGACY_PROMPT_TEMPLATE = """다음 영어 자막들의 실제 발음을 한글로 표기해주세요.
+
+규칙:
+- 교과서 발음이 아닌 원어민의 실제 빠른 발음을 한글로 표기
+- going to → 거나(gonna), want to → 워나(wanna), got to → 가라(gotta)
+- 모음 사이의 t → ㄹ (water → 워러)
+- d+y → 쥬, t+y → 추
+- 자음+모음 연결 (연음)
+- 약한 음절은 축약
+- notes에는 2~4개의 발음 포인트를 포함
+
+입력:
+{batch_json}
+
+출력 형식 (JSON 배열만, 마크다운 없이):
+[
+  {{
+    "index": 숫자,
+    "start": 숫자,
+    "end": 숫자,
+    "text": "영어 원문",
+    "pronunciation": "한글 발음",
+    "translation": "한국어 번역",
+    "notes": [
+      {{"word": "영어", "actual": "한글발음", "meaning": "설명"}}
+    ]
+  }}
+]"""
+
+_TOKEN_RE = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]")
+
+
+def count_tokens(text: str) -> int:
+    return len(_TOKEN_RE.findall(text))
+
+
+def change(before: float, after: float) -> str:
+    ratio = 1 - after / before
+    return f"{ratio:.0%} 감소" if ratio >= 0 else f"{-ratio:.0%} 증가"
+
+
+def load_corpus() -> list:
+    cues = []
+    for path in sorted(VIDEOS_DIR.glob('*.json')):
+        if path.name == 'index.json':
+            continue
+        for s in json.loads(path.read_text(encoding='utf-8')):
+            if s.get('pronunciation'):
+                cues.append(s)
+    return cues
+
+
+def main():
+    parser = argparse.ArgumentParser(description='add_video API 프롬프트 형식별 토큰/지연 비교')
+    parser.add_argument('--output-tps', type=float, default=60.0, help='가정한 출력 생성 속도 (토큰/초)')
+    parser.add_argument('--input-tps', type=float, default=3000.0, help='가정한 입력 처리 속도 (토큰/초)')
+    args = parser.parse_args()
+
+    cues = load_corpus()
+    batches = pack_batches(cues, API_BATCH_TOKENS, API_BATCH_MAX_CUES)
+    # 배치마다 붙는 규칙/출력 형식 부분 (자막 입력을 뺀 프롬프트)
+    overhead = {'legacy': count_tokens(LEGACY_PROMPT_TEMPLATE.format(batch_json='')),
+                'compact': count_tokens(PROMPT_TEMPLATE.format(subtitle_text=''))}
+    totals = {'legacy': [0, 0], 'compact': [0, 0]}
+    for batch in batches:
+        inputs = [{k: s[k] for k in ('index', 'start', 'end', 'text')} for s in batch]
+        generated = [{'pronunciation': s['pronunciation'], 'translation': s.get('translation', ''),
+                      'notes': s.get('notes', [])} for s in batch]
+
+        legacy_in = LEGACY_PROMPT_TEMPLATE.format(batch_json=json.dumps(inputs, ensure_ascii=False, indent=2))
+        legacy_out = json.dumps([dict(i, **g) for i, g in zip(inputs, generated)], ensure_ascii=False, indent=2)
+        compact_in = build_prompt(batch)
+        compact_out = json.dumps([dict({'index': i['index']}, **g) for i, g in zip(inputs, generated)],
+                                 ensure_ascii=False, indent=2)
+
+        for name, (p, o) in {'legacy': (legacy_in, legacy_out), 'compact': (compact_in, compact_out)}.items():
+            totals[name][0] += count_tokens(p)
+            totals[name][1] += count_tokens(o)
+
+    def latency(name):
+        i, o = totals[name]
+        return i / args.input_tps + o / args.output_tps
+
+    print(f"자막 {len(cues)}개, 배치 {len(batches)}개 (예산 {API_BATCH_TOKENS} 토큰, 최대 {API_BATCH_MAX_CUES}개)\n")
+    print(f"{'형식':<10} {'입력 토큰':>10} {'(자막 부분)':>11} {'출력 토큰':>10} {'추정 시간':>10}")
+    for name, label in (('legacy', '이전 JSON'), ('compact', 'INDEX')):
+        i, o = totals[name]
+        payload = i - overhead[name] * len(batches)
+        print(f"{label:<10} {i:>10,} {payload:>11,} {o:>10,} {latency(name):>9.0f}s")
+    li, lo = totals['legacy']
+    ci, co = totals['compact']
+    lp = li - overhead['legacy'] * len(batches)
+    cp = ci - overhead['compact'] * len(batches)
+    print(f"\n규칙 부분: 배치당 {overhead['legacy']} → {overhead['compact']} 토큰")
+    print(f"입력 {change(li, ci)} (자막 부분 {change(lp, cp)}), 출력 {change(lo, co)}, "
+          f"추정 생성 시간 {change(latency('legacy'), latency('compact'))} "
+          f"(출력 {args.output_tps:.0f} 토큰/초, 입력 {args.input_tps:.0f} 토큰/초 가정)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+실패 재시도 비교: 자막별 재시도(이전 방식) vs 이분법 재시도(gen_pronunciation.retry_failed)
+
+gen_pronunciation.run_claude를 장애를 주입한 가짜로 바꾼 뒤, 같은 자막으로 본 배치를 돌려
+실패한 자막을 모으고, 두 방식으로 재시도했을 때의 claude 호출 수와 복구한 자막 수를 비교합니다.
+
+가짜 claude의 장애:
+- --batch-fail: 호출 전체 실패 확률 (시간 초과, 파싱 불가 응답)
+- --drop: 여러 자막 배치에서 자막 하나가 결과에서 빠질 확률
+- --poison: 항상 영어가 섞인 발음이 나오는 자막 비율 (끝까지 실패)
+
+사용법:
+    python scripts/bench_retry_bisection.py
+    python scripts/bench_retry_bisection.py --cues 2000 --batch-fail 0.2 --drop 0.1
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import gen_pronunciation  # noqa: E402
+from pronunciation_batcher import pack_batches  # noqa: E402
+
+
+class FaultyClaude:
+    """프롬프트 속 INDEX=N 자막마다 가짜 결과를 만들되 설정한 확률로 실패하는 run_claude 대체"""
+
+    def __init__(self, batch_fail: float, drop: float, poison: set, seed: int):
+        self.batch_fail = batch_fail
+        self.drop = drop
+        self.poison = poison
+        self.random = random.Random(seed)
+        self.calls = 0
+
+    def __call__(self, prompt: str):
+        self.calls += 1
+        indices = [int(i) for i in gen_pronunciation.re.findall(r'INDEX=(\d+) TEXT=', prompt)]
+        if self.random.random() < self.batch_fail:
+            return None
+        out = []
+        for idx in indices:
+            if len(indices) > 1 and self.random.random() < self.drop:
+                continue
+            pronunciation = f'eng{idx}' if idx in self.poison else f'발음{idx}'
+            out.append({'index': idx, 'pronunciation': pronunciation, 'translation': '번역', 'notes': []})
+        return json.dumps(out, ensure_ascii=False)
+
+
+def run_scenario(cues: list, batch_fail: float, drop: float, poison_rate: float, seed: int) -> dict:
+    rng = random.Random(seed)
+    poison = {s['index'] for s in cues if rng.random() < poison_rate}
+
+    # 본 배치 → 실패한 자막 수집
+    fake = FaultyClaude(batch_fail, drop, poison, seed)
+    gen_pronunciation.run_claude = fake
+    done = set()
+    for batch in pack_batches(cues):
+        ok, _ = gen_pronunciation.validate_batch(
+            gen_pronunciation.parse_json_response(fake(gen_pronunciation.build_prompt(batch))),
+            [s['index'] for s in batch])
+        done.update(item['index'] for item in ok)
+    failed = [s for s in cues if s['index'] not in done]
+
+    # 이전 방식: 자막마다 호출 하나
+    fake = FaultyClaude(batch_fail, drop, poison, seed + 1)
+    gen_pronunciation.run_claude = fake
+    per_cue = 0
+    for s in failed:
+        ok, _ = gen_pronunciation.validate_batch(
+            gen_pronunciation.parse_json_response(fake(gen_pronunciation.build_prompt([s]))),
+            [s['index']])
+        per_cue += bool(ok)
+    per_cue_calls = fake.calls
+
+    # 이분법
+    fake = FaultyClaude(batch_fail, drop, poison, seed + 1)
+    gen_pronunciation.run_claude = fake
+    validated, _, calls = gen_pronunciation.retry_failed(failed)
+
+    return {'failed': len(failed), 'per_cue_calls': per_cue_calls, 'per_cue_ok': per_cue,
+            'bisect_calls': calls, 'bisect_ok': len(validated)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='자막별 재시도 vs 이분법 재시도 호출 수 비교')
+    parser.add_argument('--cues', type=int, default=1000, help='자막 수 (기본: 1000)')
+    parser.add_argument('--batch-fail', type=float, help='호출 전체 실패 확률')
+    parser.add_argument('--drop', type=float, help='배치 안 자막 누락 확률')
+    parser.add_argument('--poison', type=float, help='항상 실패하는 자막 비율')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    words = "so what I want to do today is show you how to practice speaking by yourself".split()
+    rng = random.Random(args.seed)
+    cues = [{'index': i + 1, 'text': ' '.join(rng.choices(words, k=rng.randint(3, 14)))}
+            for i in range(args.cues)]
+
+    if args.batch_fail is not None or args.drop is not None or args.poison is not None:
+        scenarios = [(args.batch_fail or 0.0, args.drop or 0.0, args.poison or 0.0)]
+    else:
+        scenarios = [(0.05, 0.02, 0.0), (0.1, 0.05, 0.005), (0.2, 0.1, 0.01), (0.3, 0.2, 0.02)]
+
+    # validate_batch의 자막별 경고 출력은 버림
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = [(sc, run_scenario(cues, *sc, args.seed)) for sc in scenarios]
+
+    print(f"자막 {len(cues)}개\n")
+    print(f"{'배치실패':>8} {'누락':>6} {'불량':>6} │ {'실패':>5} │ {'자막별 호출':>10} {'복구':>5} │ "
+          f"{'이분법 호출':>10} {'복구':>5} │ {'절감':>6}")
+    for (bf, dr, po), r in rows:
+        saved = 1 - r['bisect_calls'] / r['per_cue_calls'] if r['per_cue_calls'] else 0.0
+        print(f"{bf:>8.2f} {dr:>6.2f} {po:>6.3f} │ {r['failed']:>5} │ {r['per_cue_calls']:>10} "
+              f"{r['per_cue_ok']:>5} │ {r['bisect_calls']:>10} {r['bisect_ok']:>5} │ {saved:>6.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+문장 분할 엔진 검증 + 벤치마크
+
+1. public/videos의 모든 영상 자막에 대해 기존 구현(fix_sentence_boundaries_legacy, 이 파일)과
+   sentence_segmenter.segment_sentences의 결과가 같은지 확인합니다.
+   (저장된 자막 그대로 + 앞뒤 자막을 임의로 이어 붙여 문장 경계를 흩뜨린 버전)
+2. 전체 자막을 반복해 약 100만 단어를 만들고 초당 처리 단어 수를 잽니다.
+
+사용법:
+    python scripts/bench_sentence_segmenter.py
+    python scripts/bench_sentence_segmenter.py --words 3000000
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+from sentence_segmenter import segment_sentences  # noqa: E402
+from word_timeline import WordTimeline  # noqa: E402  (scripts/word_timeline.py)
+
+VIDEOS_DIR = PROJECT_DIR / "public" / "videos"
+
+logger = logging.getLogger(__name__)
+
+
+def fix_sentence_boundaries_legacy(subtitles: List[Dict]) -> List[Dict]:
+    """자막을 문장 단위로 재분할합니다. (extract_subtitles에 있던 단어별 기존 구현)
+
+    sentence_segmenter와 결과가 같은지 확인하는 기준 구현입니다.
+
+    YouTube 자막은 시간 기반으로 잘려 문장 중간에서 끊기는 경우가 많습니다.
+    이 함수는 문장 부호(. ! ?)를 기준으로 자막을 재분할하여
+    문장 경계와 자막 경계가 일치하도록 보정합니다.
+
+    - 구두점 비율 30% 미만이면 보정을 건너뜁니다 (자동 생성 자막 등).
+    - 1~2단어 조각은 인접 자막에 합칩니다.
+    - 20단어 초과 문장은 쉼표/접속사에서 분리합니다.
+    """
+    if not subtitles or len(subtitles) < 2:
+        return subtitles
+
+    # 구두점이 있는 자막 비율 확인 — 너무 낮으면 보정 불가
+    punctuated = sum(
+        1 for s in subtitles
+        if re.search(r'[.!?]["\'\u201d\u2019)]*$', s['text'].strip())
+    )
+    ratio = punctuated / len(subtitles)
+    if ratio < 0.3:
+        logger.info(f"  문장 부호 비율 {ratio:.0%} — 문장 보정 건너뜀")
+        return subtitles
+
+    # 1. 워드 레벨 타임라인 구축 (단어별 타임스탬프가 있으면 사용, 없으면 균등 분배)
+    timeline = WordTimeline.from_subtitles(subtitles)
+    n_words = len(timeline)
+
+    if not n_words:
+        return subtitles
+
+    # 2. 문장 경계 탐지
+    ABBREVS = {
+        'Mr.', 'Mrs.', 'Ms.', 'Dr.', 'St.', 'Jr.', 'Sr.', 'Prof.',
+        'vs.', 'etc.', 'i.e.', 'e.g.', 'U.S.', 'U.K.', 'a.m.', 'p.m.',
+        'Mt.', 'Ft.', 'Lt.', 'Gen.', 'Gov.', 'Sgt.', 'Inc.', 'Ltd.',
+        'Corp.', 'Co.', 'Dept.', 'Univ.', 'Ave.', 'Blvd.', 'No.',
+    }
+
+    boundaries = []  # 문장이 끝나는 워드 인덱스
+    for i in range(n_words):
+        word = timeline.word(i)
+        # 문장 종결 부호 확인 (.!?), 닫는 따옴표/괄호 포함
+        stripped = word.rstrip('"\'\u201d\u2019)')
+        if not re.search(r'[.!?]$', stripped):
+            continue
+
+        # 약어 제외
+        if stripped in ABBREVS or word in ABBREVS:
+            continue
+
+        # 이니셜 (A. B. 등) 제외
+        if re.match(r'^[A-Z]\.$', stripped):
+            continue
+
+        # 소수점 제외 (3.5, $10.99 등)
+        if re.match(r'^[\$€£¥]?\d+\.\d*$', stripped):
+            continue
+
+        # 줄임표(...) — 다음 단어가 대문자면 문장 끝으로 처리
+        if stripped.endswith('...'):
+            if i + 1 < n_words:
+                nxt = timeline.word(i + 1).lstrip('"\u201c\u2018(')
+                if nxt and nxt[0].isupper():
+                    boundaries.append(i)
+            continue
+
+        # !나 ?는 거의 항상 문장 끝
+        if stripped[-1] in '!?':
+            boundaries.append(i)
+            continue
+
+        # . 의 경우: 다음 단어가 대문자면 문장 끝
+        if i + 1 < n_words:
+            nxt = timeline.word(i + 1).lstrip('"\u201c\u2018(')
+            if nxt and nxt[0].isupper():
+                boundaries.append(i)
+        else:
+            # 마지막 단어
+            boundaries.append(i)
+
+    if not boundaries:
+        return subtitles
+
+    # 마지막 단어가 경계에 없으면 추가
+    if boundaries[-1] != n_words - 1:
+        boundaries.append(n_words - 1)
+
+    # 3. 문장 생성
+    sentences = []
+    start_idx = 0
+    for end_idx in boundaries:
+        if end_idx < start_idx:
+            continue
+        sentences.append({
+            'text': ' '.join(timeline.words(start_idx, end_idx + 1)),
+            'start': timeline.starts[start_idx],
+            'end': timeline.ends[end_idx],
+        })
+        start_idx = end_idx + 1
+
+    if not sentences:
+        return subtitles
+
+    # 4. 너무 짧은 문장(1~2단어)은 인접 문장에 합치기
+    merged = []
+    for sent in sentences:
+        wc = len(sent['text'].split())
+        if wc <= 2 and merged:
+            prev = merged[-1]
+            prev['text'] = prev['text'] + ' ' + sent['text']
+            prev['end'] = sent['end']
+        else:
+            merged.append(dict(sent))
+
+    # 첫 항목이 여전히 1~2단어면 다음에 합치기
+    if len(merged) >= 2 and len(merged[0]['text'].split()) <= 2:
+        merged[1]['text'] = merged[0]['text'] + ' ' + merged[1]['text']
+        merged[1]['start'] = merged[0]['start']
+        merged.pop(0)
+
+    sentences = merged
+
+    # 5. 너무 긴 문장(20단어 초과)은 절 단위로 분리
+    MAX_WORDS = 20
+    final = []
+    for sent in sentences:
+        words = sent['text'].split()
+        if len(words) <= MAX_WORDS:
+            final.append(sent)
+            continue
+
+        # 쉼표, 접속사 위치 탐색
+        split_candidates = []
+        for j, w in enumerate(words):
+            if j < 3 or j > len(words) - 3:
+                continue
+            if w.endswith(','):
+                split_candidates.append(j + 1)
+            elif w.lower() in ('and', 'but', 'or', 'so', 'because', 'when',
+                               'while', 'if', 'though', 'although', 'since',
+                               'where', 'which', 'before', 'after'):
+                split_candidates.append(j)
+
+        if not split_candidates:
+            final.append(sent)
+            continue
+
+        # 중간 지점에 가장 가까운 분할점 선택
+        mid = len(words) // 2
+        best_pos = min(split_candidates, key=lambda p: abs(p - mid))
+
+        # 시간 분배 (워드 비율)
+        total_dur = sent['end'] - sent['start']
+        split_ratio = best_pos / len(words)
+        mid_time = sent['start'] + total_dur * split_ratio
+
+        final.append({
+            'text': ' '.join(words[:best_pos]),
+            'start': sent['start'],
+            'end': round(mid_time, 2),
+        })
+        final.append({
+            'text': ' '.join(words[best_pos:]),
+            'start': round(mid_time, 2),
+            'end': sent['end'],
+        })
+
+    # 6. 인덱스 재부여 및 시간 반올림
+    result = []
+    for i, s in enumerate(final):
+        result.append({
+            'index': i,
+            'start': round(s['start'], 2),
+            'end': round(s['end'], 2),
+            'text': s['text'],
+        })
+
+    return result
+
+
+def load_corpus() -> dict:
+    corpus = {}
+    for path in sorted(VIDEOS_DIR.glob('*.json')):
+        if path.name == 'index.json':
+            continue
+        subs = json.loads(path.read_text(encoding='utf-8'))
+        corpus[path.stem] = [
+            {k: s[k] for k in ('index', 'start', 'end', 'text')} for s in subs
+        ]
+    return corpus
+
+
+def scramble(subs: list, seed: int) -> list:
+    """앞뒤 자막을 무작위로 이어 붙이거나 쪼개서 시간 기준으로 잘린 원본 자막처럼 만듭니다."""
+    rng = random.Random(seed)
+    words = []
+    for s in subs:
+        w = s['text'].split()
+        per = (s['end'] - s['start']) / max(len(w), 1)
+        words.extend((x, s['start'] + i * per) for i, x in enumerate(w))
+    out = []
+    i = 0
+    while i < len(words):
+        # 3~12단어씩 자르되, 문장 부호에서 끊을 확률을 높여 구두점 비율을 유지
+        n = rng.randint(3, 12)
+        for j in range(i, min(i + n, len(words))):
+            if words[j][0][-1] in '.!?' and rng.random() < 0.6:
+                n = j - i + 1
+                break
+        chunk = words[i:i + n]
+        end = words[i + n][1] if i + n < len(words) else chunk[-1][1] + 0.5
+        out.append({'index': len(out) + 1, 'start': round(chunk[0][1], 2),
+                    'end': round(end, 2), 'text': ' '.join(x for x, _ in chunk)})
+        i += n
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description='문장 분할 엔진 검증/벤치마크')
+    parser.add_argument('--words', type=int, default=1_000_000, help='벤치마크 단어 수')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    corpus = load_corpus()
+
+    # 1. 결과 동일성
+    mismatches = 0
+    for video_id, subs in corpus.items():
+        for label, case in [('원본', subs), ('재분할', scramble(subs, seed=len(video_id)))]:
+            expected = fix_sentence_boundaries_legacy([dict(s) for s in case])
+            actual = segment_sentences([dict(s) for s in case])
+            ok = expected == actual
+            mismatches += not ok
+            print(f"  {video_id:<16} {label:<4} {len(case):>4} → {len(actual):>4}  {'동일' if ok else '불일치!'}")
+    print(f"결과 비교: {'모두 동일' if not mismatches else f'{mismatches}건 불일치'}\n")
+
+    # 2. 처리량 (전체 자막을 이어 붙여 반복)
+    base = [s for subs in corpus.values() for s in subs]
+    base_words = sum(len(s['text'].split()) for s in base)
+    big = base * max(1, args.words // base_words)
+    n_words = sum(len(s['text'].split()) for s in big)
+    print(f"처리량: 자막 {len(big):,}개, {n_words:,} 단어")
+
+    for label, fn in [('기존 구현', fix_sentence_boundaries_legacy),
+                      ('segmenter', segment_sentences)]:
+        # 3회 중 최솟값 (다른 프로세스로 인한 흔들림 제거)
+        elapsed = float('inf')
+        for _ in range(3):
+            t0 = time.perf_counter()
+            result = fn(big)
+            elapsed = min(elapsed, time.perf_counter() - t0)
+        print(f"  {label:<10} → {len(result):>7,} 문장  "
+              f"{elapsed:6.2f}s  {n_words / elapsed / 1e6:5.2f}M 단어/s")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
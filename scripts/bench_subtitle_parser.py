@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자막 파서 벤치마크: 정규식 파서(_parse_vtt_content/_parse_srt_content) vs 스트리밍 파서(subtitle_parser)
+
+몇 시간 분량의 자동 생성 스타일 VTT/SRT를 만들어 두 구현의 실행 시간과
+최대 메모리(tracemalloc)를 비교하고, 결과가 같은지 확인합니다.
+
+사용법:
+    python scripts/bench_subtitle_parser.py            # 기본 3시간 분량
+    python scripts/bench_subtitle_parser.py --hours 6
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from extract_subtitles import SubtitleExtractor  # noqa: E402
+from subtitle_parser import iter_subtitle_file  # noqa: E402
+
+WORDS = "so what I want to do today is show you how to practice speaking by yourself".split()
+
+
+def _ts(seconds: float, sep: str = '.') -> str:
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return f"{int(h):02d}:{int(m):02d}:{s:06.3f}".replace('.', sep)
+
+
+def write_vtt(path: str, hours: float) -> int:
+    """YouTube 자동 자막처럼 줄이 굴러가는(rolling) VTT를 만듭니다."""
+    cues = int(hours * 3600 / 2)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("WEBVTT\nKind: captions\nLanguage: en\n\n")
+        f.write("STYLE\n::cue { color: white }\n\nNOTE generated for benchmark\n\n")
+        prev = ' '  # 자동 자막의 첫 큐는 공백 한 칸짜리 줄로 시작
+        for i in range(cues):
+            t = i * 2.0
+            words = [WORDS[(i + j) % len(WORDS)] for j in range(6)]
+            tagged = words[0] + ''.join(
+                f"<{_ts(t + 0.3 * (j + 1))}><c> {w}</c>" for j, w in enumerate(words[1:])
+            )
+            f.write(f"{_ts(t)} --> {_ts(t + 2)} align:start position:0%\n{prev}\n{tagged}\n\n")
+            prev = ' '.join(words)
+    return cues
+
+
+def write_srt(path: str, hours: float) -> int:
+    cues = int(hours * 3600 / 2)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(cues):
+            t = i * 2.0
+            words = [WORDS[(i + j) % len(WORDS)] for j in range(8)]
+            f.write(f"{i + 1}\n{_ts(t, ',')} --> {_ts(t + 2, ',')}\n{' '.join(words[:4])}\n"
+                    f"<i>{' '.join(words[4:])}</i>\n\n")
+    return cues
+
+
+def measure(fn):
+    """(결과, 실행 시간, 최대 메모리). 시간은 tracemalloc 없이 따로 잽니다."""
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def bench(label: str, path: str, regex_parse) -> None:
+    def regex():
+        with open(path, 'r', encoding='utf-8') as f:
+            return len(regex_parse(f.read()))
+
+    def streaming():
+        # 결과를 리스트로 모으지 않고 개수만 셈 → 파서 자체의 메모리 사용량
+        return sum(1 for _ in iter_subtitle_file(path))
+
+    size_mb = os.path.getsize(path) / 1e6
+    n_regex, t_regex, m_regex = measure(regex)
+    n_stream, t_stream, m_stream = measure(streaming)
+    print(f"[{label}] {size_mb:.1f} MB")
+    print(f"  정규식     : {n_regex:>7}개  {t_regex:6.2f}s  peak {m_regex / 1e6:7.1f} MB")
+    print(f"  스트리밍   : {n_stream:>7}개  {t_stream:6.2f}s  peak {m_stream / 1e6:7.1f} MB")
+    print(f"  속도 {t_regex / t_stream:.1f}x, 메모리 {m_regex / max(m_stream, 1):.0f}x 절감")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='VTT/SRT 파서 벤치마크')
+    parser.add_argument('--hours', type=float, default=3.0, help='생성할 자막 분량 (시간)')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    extractor = SubtitleExtractor()
+
+    with tempfile.TemporaryDirectory() as d:
+        vtt = os.path.join(d, 'bench.en.vtt')
+        srt = os.path.join(d, 'bench.en.srt')
+        write_vtt(vtt, args.hours)
+        write_srt(srt, args.hours)
+
+        # 결과 동일성 확인 (LF 파일 기준)
+        for path, regex_parse in [(vtt, extractor._parse_vtt_content), (srt, extractor._parse_srt_content)]:
+            with open(path, 'r', encoding='utf-8') as f:
+                expected = regex_parse(f.read())
+            actual = list(iter_subtitle_file(path))
+            status = "동일" if expected == actual else "불일치!"
+            print(f"결과 비교 ({os.path.basename(path)}): {status} ({len(actual)}개)")
+
+        # CRLF 파일: 정규식 버전은 줄바꿈을 변환하지 않은 문자열에서 큐를 찾지 못함
+        crlf = os.path.join(d, 'crlf.en.vtt')
+        with open(vtt, 'r', encoding='utf-8') as src, open(crlf, 'w', encoding='utf-8', newline='\r\n') as dst:
+            for _ in range(200):
+                dst.write(src.readline())
+        with open(crlf, 'r', encoding='utf-8', newline='') as f:
+            n_regex = len(extractor._parse_vtt_content(f.read()))
+        print(f"CRLF VTT: 정규식 {n_regex}개, 스트리밍 {sum(1 for _ in iter_subtitle_file(crlf))}개")
+
+        print()
+        bench('VTT', vtt, extractor._parse_vtt_content)
+        bench('SRT', srt, extractor._parse_srt_content)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ingest_subtitles 검증: 수동 자막의 반복 문장이 그대로 남는지 확인
+
+임시 폴더에 자막 파일을 만들어 ingest_subtitles.process_video로 처리합니다 (public/videos는 건드리지 않음).
+1. 같은 문장을 시간 간격을 두고 반복하는 수동 SRT (패턴 연습 영상) → 자막이 하나도 바뀌지 않아야 함
+2. 같은 내용의 타임스탬프 없는 VTT → 마찬가지
+3. 줄이 굴러가는(rolling) 자동 생성 VTT (단어별 타임스탬프) → 겹친 단어가 잘려야 함
+
+사용법:
+    python scripts/check_ingest.py
+"""
+
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import video_store  # noqa: E402
+from ingest_subtitles import process_video  # noqa: E402
+
+# 문장마다 한 자막, 뒤 자막이 앞 자막의 끝 단어로 시작 (rolling 제거가 잘못 돌면 잘리는 형태)
+DRILL = [
+    (0.0, 3.0, "Repeat after me, nice to meet you."),
+    (4.0, 6.0, "Nice to meet you."),
+    (7.0, 9.5, "I said nice to meet you."),
+    (10.0, 12.0, "Nice to meet you."),
+    (13.0, 15.5, "How have you been lately?"),
+]
+
+ROLLING_VTT = """WEBVTT
+Kind: captions
+Language: en
+
+00:00:00.000 --> 00:00:02.000
+so<00:00:00.500><c> what</c><00:00:01.000><c> I</c><00:00:01.500><c> want</c>
+
+00:00:01.500 --> 00:00:04.000
+I<00:00:01.800><c> want</c><00:00:02.200><c> to</c><00:00:02.800><c> do</c><00:00:03.300><c> today</c>
+"""
+
+
+def _ts(seconds: float, sep: str) -> str:
+    m, s = divmod(seconds, 60)
+    return f"00:{int(m):02d}:{s:06.3f}".replace('.', sep)
+
+
+def write_srt(path: Path) -> None:
+    blocks = [f"{i}\n{_ts(start, ',')} --> {_ts(end, ',')}\n{text}\n"
+              for i, (start, end, text) in enumerate(DRILL, 1)]
+    path.write_text('\n'.join(blocks), encoding='utf-8')
+
+
+def write_vtt(path: Path) -> None:
+    blocks = [f"{_ts(start, '.')} --> {_ts(end, '.')}\n{text}\n" for start, end, text in DRILL]
+    path.write_text("WEBVTT\n\n" + '\n'.join(blocks), encoding='utf-8')
+
+
+def ingest(tmp: Path, video_id: str, filename: str, write) -> list:
+    path = tmp / 'subs' / filename
+    path.parent.mkdir(exist_ok=True)
+    if callable(write):
+        write(path)
+    else:
+        path.write_text(write, encoding='utf-8')
+    process_video(video_id, [str(path)])
+    return video_store.load_video_data(video_id)
+
+
+def main():
+    logging.disable(logging.WARNING)
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        video_store.VIDEOS_DIR = tmp / 'videos'
+        video_store.INDEX_FILE = video_store.VIDEOS_DIR / 'index.json'
+
+        expected = list(DRILL)
+        for label, video_id, filename, write in [
+            ('수동 SRT 반복 문장', 'drillSrt000', 'drillSrt000.en.srt', write_srt),
+            ('타임스탬프 없는 VTT 반복 문장', 'drillVtt000', 'drillVtt000.en.vtt', write_vtt),
+        ]:
+            subs = ingest(tmp, video_id, filename, write)
+            got = [(s['start'], s['end'], s['text']) for s in subs]
+            same = got == expected
+            ok &= same
+            print(f"  {label}: {'그대로 유지' if same else '바뀜!'}")
+            if not same:
+                for line in got:
+                    print(f"      {line}")
+
+        subs = ingest(tmp, 'rollingVtt0', 'rollingVtt0.en.vtt', ROLLING_VTT)
+        texts = [s['text'] for s in subs]
+        deduped = texts == ['so what I want to do today'] or texts == ['so what I want', 'to do today']
+        ok &= deduped
+        print(f"  자동 생성 rolling VTT: {'겹침 제거됨' if deduped else f'겹침 남음! {texts}'}")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CLI 시작 시간 회귀 검사
+
+1. `movietalk.py --help`가 제한 시간(기본 100ms), 각 하위 명령의 `--help`가
+   그 두 배 안에 끝나는지 (여러 번 실행해 가장 빠른 값 기준) 확인합니다.
+2. 스크립트 모듈을 import해도 로그 파일이 생기지 않고, anthropic /
+   youtube_transcript_api / yt_dlp가 import되지 않는지 확인합니다.
+
+문제가 있으면 종료 코드 1을 반환합니다.
+
+사용법:
+    python scripts/check_startup.py
+    python scripts/check_startup.py --limit-ms 150 --runs 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+ENTRY = str(PROJECT_DIR / 'movietalk.py')
+
+HEAVY_MODULES = ('anthropic', 'youtube_transcript_api', 'yt_dlp')
+SCRIPT_MODULES = ('movietalk', 'extract_subtitles', 'fetch_english_subs', 'add_video',
+                  'gen_pronunciation', 'merge_subtitles', 'ingest_subtitles',
+                  'anthropic_backend', 'pronunciation_cache', 'pronunciation_journal',
+                  'pronunciation_batcher', 'claude_worker', 'json_stream', 'rule_pronunciation',
+                  'translation_memory', 'model_router', 'transcript_cache', 'video_store',
+                  'pronunciation_pipeline')
+
+
+def best_time(cmd, runs: int, cwd: str) -> float:
+    best = float('inf')
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run(cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CLI 시작 시간 회귀 검사')
+    parser.add_argument('--limit-ms', type=float, default=100.0, help='허용 시간 (기본: 100ms)')
+    parser.add_argument('--runs', type=int, default=5, help='명령별 실행 횟수 (기본: 5)')
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as cwd:
+        # 1. 시작 시간
+        baseline = best_time([sys.executable, '-c', 'pass'], args.runs, cwd)
+        print(f"python 자체 시작: {baseline * 1000:6.1f}ms")
+        commands = [[]] + [[name] for name in ('add', 'extract', 'fetch-en', 'pronounce', 'ingest')]
+        for sub in commands:
+            elapsed = best_time([sys.executable, ENTRY] + sub + ['--help'], args.runs, cwd)
+            # 하위 명령은 해당 스크립트 모듈까지 import하므로 두 배까지 허용
+            ok = elapsed * 1000 <= args.limit_ms * (2 if sub else 1)
+            failed |= not ok
+            label = ' '.join(['movietalk'] + sub + ['--help'])
+            print(f"{label:<32} {elapsed * 1000:6.1f}ms  {'OK' if ok else '느림!'}")
+
+        # 2. import 부작용
+        code = (
+            f"import sys; sys.path.insert(0, {str(PROJECT_DIR)!r})\n"
+            f"import {', '.join(SCRIPT_MODULES)}\n"
+            f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, '-c', code], cwd=cwd,
+                                capture_output=True, text=True, check=True)
+        heavy = result.stdout.split()
+        created = os.listdir(cwd)
+        print(f"import 시 무거운 모듈: {heavy or '없음'}")
+        print(f"import 시 생성된 파일: {created or '없음'}")
+        failed |= bool(heavy) or bool(created)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
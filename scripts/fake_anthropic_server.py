@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 가짜 Anthropic Messages API 서버
+
+POST /v1/messages에 프롬프트 속 자막(add_video의 JSON 입력 또는 gen_pronunciation의
+INDEX=N TEXT="..." 줄)마다 가짜 발음 데이터를 만들어 응답합니다.
+일정 간격으로 429(retry-after 포함)/529를 돌려주고, 동시 처리 중인 요청 수를 기록하여
+anthropic_backend의 재시도와 동시성 상한을 네트워크/API 키 없이 확인할 수 있습니다.
+"stream": true 요청에는 SSE 이벤트로 조금씩 응답하고, --truncate-every N이면 N번째 응답마다
+중간에서 자르고 stop_reason을 max_tokens로 보냅니다 (json_stream의 부분 응답 복구 확인용).
+--fast-reject R이면 기본 모델이 아닌 모델(난이도 라우팅의 fast 모델) 요청에서 자막의 비율 R만큼
+발음에 영어를 섞어 보냅니다 (validate_batch 거부 → 기본 모델 승격 확인용).
+
+사용법:
+    # 서버만 띄우기 → 다른 터미널에서 ANTHROPIC_BASE_URL로 지정
+    python scripts/fake_anthropic_server.py --port 8765 --rate-limit-every 5
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=fake python add_video.py --generate-pronunciation VIDEO_ID
+
+    # add_video.generate_pronunciation을 가짜 서버에 돌려 보고 결과 검사
+    python scripts/fake_anthropic_server.py --check
+    python scripts/fake_anthropic_server.py --check --truncate-every 4
+    python scripts/fake_anthropic_server.py --check --route --fast-reject 0.2
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+from anthropic_backend import DEFAULT_MODEL  # noqa: E402
+from json_stream import parse_json_items  # noqa: E402
+
+
+class FakeState:
+    def __init__(self, rate_limit_every: int, overload_every: int, latency: float,
+                 truncate_every: int = 0, fast_reject: float = 0.0):
+        self.rate_limit_every = rate_limit_every
+        self.overload_every = overload_every
+        self.latency = latency
+        self.truncate_every = truncate_every
+        self.fast_reject = fast_reject
+        self.models = Counter()    # 모델별 성공 요청 수
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.errors = {429: 0, 529: 0}
+        self.truncated = 0
+        self.truncated_items = 0   # 잘린 응답에 들어 있던 자막 수
+        self.truncated_kept = 0    # 그중 잘리기 전에 닫힌 항목 수
+
+
+def fake_items(prompt: str) -> list:
+    """프롬프트 속 자막마다 가짜 발음 항목을 만듭니다."""
+    lines = re.findall(r'INDEX=(\d+) TEXT="(.*)"', prompt)
+    if lines:
+        subs = [{'index': int(i), 'text': t} for i, t in lines]
+    else:
+        match = re.search(r'입력:\n(\[[\s\S]*?\n\])\n', prompt)
+        subs = json.loads(match.group(1)) if match else []
+    return [
+        dict(s, pronunciation=f"발음{s['index']}", translation=f"번역{s['index']}", notes=[])
+        for s in subs
+    ]
+
+
+def make_handler(state: FakeState):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, body: dict, headers: dict = None):
+            data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _send_stream(self, message: dict, text: str):
+            """Messages API 스트리밍(SSE) 형식으로 text를 조각내어 보냅니다."""
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.end_headers()
+            start = dict(message, content=[], stop_reason=None,
+                         usage=dict(message['usage'], output_tokens=0))
+            events = [('message_start', {'type': 'message_start', 'message': start}),
+                      ('content_block_start', {'type': 'content_block_start', 'index': 0,
+                                               'content_block': {'type': 'text', 'text': ''}})]
+            events += [('content_block_delta', {'type': 'content_block_delta', 'index': 0,
+                                                'delta': {'type': 'text_delta', 'text': text[i:i + 40]}})
+                       for i in range(0, len(text), 40)]
+            events += [('content_block_stop', {'type': 'content_block_stop', 'index': 0}),
+                       ('message_delta', {'type': 'message_delta',
+                                          'delta': {'stop_reason': message['stop_reason'],
+                                                    'stop_sequence': None},
+                                          'usage': {'output_tokens': message['usage']['output_tokens']}}),
+                       ('message_stop', {'type': 'message_stop'})]
+            for name, data in events:
+                self.wfile.write(f"event: {name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+                                 .encode('utf-8'))
+                self.wfile.flush()
+
+        def do_GET(self):
+            with state.lock:
+                self._send(200, {'requests': state.requests, 'max_in_flight': state.max_in_flight,
+                                 'errors': state.errors})
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            with state.lock:
+                state.requests += 1
+                n = state.requests
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            try:
+                time.sleep(state.latency)
+                if state.rate_limit_every and n % state.rate_limit_every == 0:
+                    state.errors[429] += 1
+                    return self._send(429, {'type': 'error', 'error': {
+                        'type': 'rate_limit_error', 'message': 'fake rate limit'}},
+                        {'retry-after': '0.2'})
+                if state.overload_every and n % state.overload_every == 0:
+                    state.errors[529] += 1
+                    return self._send(529, {'type': 'error', 'error': {
+                        'type': 'overloaded_error', 'message': 'fake overload'}})
+
+                prompt = body['messages'][0]['content']
+                items = fake_items(prompt)
+                model = body.get('model', '')
+                with state.lock:
+                    state.models[model] += 1
+                if model != DEFAULT_MODEL:
+                    # 자막 index로 정해지는 일부 자막에서 영어를 섞음 (다시 보내도 같은 자막)
+                    for item in items:
+                        if item['index'] * 2654435761 % 1000 < state.fast_reject * 1000:
+                            item['pronunciation'] += ' gonna'
+                text = json.dumps(items, ensure_ascii=False)
+                stop_reason = 'end_turn'
+                if state.truncate_every and n % state.truncate_every == 0:
+                    text = text[:len(text) * 2 // 3]
+                    stop_reason = 'max_tokens'
+                    with state.lock:
+                        state.truncated += 1
+                        state.truncated_items += len(items)
+                        state.truncated_kept += len(parse_json_items(text))
+                message = {
+                    'id': f'msg_fake_{n}', 'type': 'message', 'role': 'assistant',
+                    'model': body.get('model', 'fake'),
+                    'content': [{'type': 'text', 'text': text}],
+                    'stop_reason': stop_reason, 'stop_sequence': None,
+                    'usage': {'input_tokens': len(prompt) // 3, 'output_tokens': len(text) // 3},
+                }
+                if body.get('stream'):
+                    self._send_stream(message, text)
+                else:
+                    self._send(200, message)
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+    return Handler
+
+
+def start_server(port: int, state: FakeState) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_check(state: FakeState, concurrency: int, route: bool = False) -> bool:
+    """add_video.generate_pronunciation을 가짜 서버에 대고 실행해 결과를 검사합니다."""
+    from add_video import generate_pronunciation
+    from anthropic_backend import RateLimiter
+
+    subtitles = [{'index': i, 'start': float(i), 'end': i + 0.9, 'text': f'line {i}'}
+                 for i in range(120)]
+    limiter = RateLimiter(requests_per_minute=6000, tokens_per_minute=10_000_000,
+                          max_concurrency=concurrency)
+    t0 = time.perf_counter()
+    # 백엔드만 시험하므로 발음 캐시는 끔 (캐시 적중 시 요청이 나가지 않음)
+    result = generate_pronunciation(subtitles, limiter=limiter, use_cache=False, route_models=route)
+    elapsed = time.perf_counter() - t0
+
+    expected = [s['text'] for s in subtitles]
+    if state.truncated:
+        # 잘린 응답에서 빠진 자막은 결과에 없으므로 순서만 확인
+        got = [r['text'] for r in result or []]
+        ok_texts = bool(got) and got == [t for t in expected if t in set(got)]
+    else:
+        ok_texts = result is not None and [r['text'] for r in result] == expected
+    ok_concurrency = 1 < state.max_in_flight <= concurrency
+    ok_retried = state.errors[429] > 0 and state.errors[529] > 0
+    print(f"\n요청 {state.requests}회 (429 {state.errors[429]}회, 529 {state.errors[529]}회), "
+          f"최대 동시 {state.max_in_flight}개, {elapsed:.2f}s")
+    print(f"  결과 순서/개수: {'OK' if ok_texts else '실패'}")
+    print(f"  동시성 상한({concurrency}): {'OK' if ok_concurrency else '실패'}")
+    print(f"  429/529 재시도: {'OK' if ok_retried else '실패'}")
+    ok_truncated = True
+    if state.truncate_every:
+        ok_truncated = state.truncated > 0 and state.truncated_kept > 0
+        print(f"  잘린 응답 {state.truncated}개: 자막 {state.truncated_items}개 중 "
+              f"{state.truncated_kept}개 항목 살림 (배열 전체를 파싱하면 0개)")
+    ok_route = True
+    if route:
+        # 빠른 모델이 영어를 섞은 자막은 기본 모델 결과로 바뀌어 있어야 함
+        english = sum(bool(re.search(r'[a-zA-Z]', r.get('pronunciation', ''))) for r in result or [])
+        ok_route = len(state.models) > 1 and (not state.fast_reject or state.models[DEFAULT_MODEL] > 0) \
+            and english == 0
+        print(f"  모델별 요청: {dict(state.models)}, 영어 섞인 발음 {english}개: "
+              f"{'OK' if ok_route else '실패'}")
+    return ok_texts and ok_concurrency and ok_retried and ok_truncated and ok_route
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 가짜 Anthropic Messages API 서버')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--rate-limit-every', type=int, default=5, help='N번째 요청마다 429 (0: 안 함)')
+    parser.add_argument('--overload-every', type=int, default=7, help='N번째 요청마다 529 (0: 안 함)')
+    parser.add_argument('--latency', type=float, default=0.1, help='응답 지연 (초)')
+    parser.add_argument('--truncate-every', type=int, default=0,
+                        help='N번째 응답마다 중간에서 자르고 max_tokens로 끝냄 (0: 안 함)')
+    parser.add_argument('--fast-reject', type=float, default=0.0,
+                        help='기본 모델이 아닌 요청에서 발음에 영어를 섞을 자막 비율 (0~1)')
+    parser.add_argument('--route', action='store_true', help='--check에서 난이도 라우팅을 켭니다')
+    parser.add_argument('--check', action='store_true',
+                        help='서버를 띄우고 add_video.generate_pronunciation을 실행해 검사')
+    parser.add_argument('--concurrency', type=int, default=4, help='--check에서 쓸 동시 요청 수')
+    args = parser.parse_args()
+
+    state = FakeState(args.rate_limit_every, args.overload_every, args.latency, args.truncate_every,
+                      args.fast_reject)
+    server = start_server(0 if args.check else args.port, state)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    if args.check:
+        os.environ['ANTHROPIC_BASE_URL'] = url
+        os.environ['ANTHROPIC_API_KEY'] = 'fake-key'
+        ok = run_check(state, args.concurrency, args.route)
+        server.shutdown()
+        sys.exit(0 if ok else 1)
+
+    print(f"가짜 Anthropic API: {url}  (Ctrl+C로 종료)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 가짜 claude CLI
+
+gen_pronunciation이 쓰는 두 가지 호출 방식을 흉내 냅니다.
+- 한 번 실행: claude -p 프롬프트 --output-format json
+- 상주 워커: claude -p --input-format stream-json --output-format stream-json --verbose ...
+  (stdin의 메시지 한 줄마다 assistant/result 이벤트를 stdout에 씀.
+  --include-partial-messages가 있으면 자막 항목마다 text_delta stream_event도 씀)
+
+프롬프트 속 INDEX=N TEXT="..." 줄마다 가짜 발음 데이터를 돌려주며 (아래에 REF 줄이 있으면
+"notes": "REF"), 지연은 환경 변수로 조절합니다.
+    FAKE_CLAUDE_STARTUP    프로세스 시작 지연 (초, 기본 1.0)
+    FAKE_CLAUDE_PER_KCHAR  입력(규칙 + 대화 기록 포함) 1000글자당 지연 (초, 기본 0.1)
+    FAKE_CLAUDE_PER_ITEM   자막 하나 출력 지연 (초, 기본 0.02)
+    FAKE_CLAUDE_MODEL_SPEED   --model을 지정한 호출(빠른 모델)의 지연 배율 (기본 0.3)
+    FAKE_CLAUDE_MODEL_REJECT  --model을 지정한 호출에서 발음에 영어를 섞을 자막 비율 (기본 0,
+                              validate_batch 거부 → 모델 승격 확인용)
+
+실제 claude 대신 쓰려면 PATH 앞쪽에 이 파일을 실행하는 `claude`를 두면 됩니다
+(scripts/bench_claude_worker.py 참고).
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+STARTUP = float(os.environ.get('FAKE_CLAUDE_STARTUP', '1.0'))
+PER_KCHAR = float(os.environ.get('FAKE_CLAUDE_PER_KCHAR', '0.1'))
+PER_ITEM = float(os.environ.get('FAKE_CLAUDE_PER_ITEM', '0.02'))
+MODEL_SPEED = float(os.environ.get('FAKE_CLAUDE_MODEL_SPEED', '0.3'))
+MODEL_REJECT = float(os.environ.get('FAKE_CLAUDE_MODEL_REJECT', '0'))
+
+
+def answer_chunks(prompt: str, context_chars: int, model: str = None):
+    """응답 JSON 배열을 자막 항목 단위 조각으로 yield합니다 (입력 처리 + 항목마다 지연)."""
+    # (index, 바로 아래에 REF 줄이 있는지)
+    items = [(m.group(1), m.group(2) is not None)
+             for m in re.finditer(r'INDEX=(\d+) TEXT=".*"(\n  REF )?', prompt)]
+    speed = MODEL_SPEED if model else 1.0
+    time.sleep(context_chars / 1000 * PER_KCHAR * speed)
+    yield '['
+    for n, (i, has_ref) in enumerate(items):
+        time.sleep(PER_ITEM * speed)
+        # 빠른 모델은 자막 index로 정해지는 일부 자막에서 영어를 섞음 (실행마다 같은 자막)
+        reject = model and int(i) * 2654435761 % 1000 < MODEL_REJECT * 1000
+        item = {'index': int(i), 'pronunciation': f'발음{i}' + (' gonna' if reject else ''),
+                'translation': f'번역{i}', 'notes': 'REF' if has_ref else []}
+        yield (', ' if n else '') + json.dumps(item, ensure_ascii=False)
+    yield ']'
+
+
+def emit(event: dict) -> None:
+    sys.stdout.write(json.dumps(event, ensure_ascii=False) + '\n')
+    sys.stdout.flush()
+
+
+def main():
+    args = sys.argv[1:]
+    if '--version' in args:
+        print('0.0.0 (fake claude)')
+        return
+
+    time.sleep(STARTUP)
+    model = args[args.index('--model') + 1] if '--model' in args else None
+
+    if 'stream-json' in args:
+        system_prompt = args[args.index('--append-system-prompt') + 1] if '--append-system-prompt' in args else ''
+        partial = '--include-partial-messages' in args
+        emit({'type': 'system', 'subtype': 'init', 'session_id': 'fake'})
+        history = len(system_prompt)
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            content = json.loads(line)['message']['content']
+            if isinstance(content, list):
+                content = ''.join(block.get('text', '') for block in content)
+            history += len(content)
+            chunks = []
+            for chunk in answer_chunks(content, history, model):
+                chunks.append(chunk)
+                if partial:
+                    emit({'type': 'stream_event', 'event': {
+                        'type': 'content_block_delta', 'index': 0,
+                        'delta': {'type': 'text_delta', 'text': chunk}}})
+            text = ''.join(chunks)
+            history += len(text)
+            emit({'type': 'assistant', 'message': {'role': 'assistant',
+                                                   'content': [{'type': 'text', 'text': text}]}})
+            emit({'type': 'result', 'subtype': 'success', 'is_error': False, 'result': text,
+                  'session_id': 'fake'})
+        return
+
+    prompt = args[args.index('-p') + 1]
+    text = ''.join(answer_chunks(prompt, len(prompt), model))
+    print(json.dumps({'type': 'result', 'subtype': 'success', 'is_error': False, 'result': text}))
+
+
+if __name__ == '__main__':
+    main()
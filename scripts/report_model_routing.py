@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+난이도 라우팅(model_router) 분포 보고
+
+public/videos의 자막에 난이도 점수를 매겨, 기준값(threshold)마다 빠른 모델(fast)로 가는 자막과
+추정 토큰의 비율을 보여줍니다. --route-threshold를 고를 때 참고하고, 선택한 기준값으로 나뉜
+자막 예시를 단계별로 보여줍니다.
+
+사용법:
+    python scripts/report_model_routing.py
+    python scripts/report_model_routing.py --threshold 1.5 --samples 15
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+from video_store import VIDEOS_DIR  # noqa: E402
+from model_router import DEFAULT_THRESHOLD, TIERS, difficulty, route  # noqa: E402
+from pronunciation_batcher import batch_tokens  # noqa: E402
+
+THRESHOLDS = (0.8, 1.0, 1.2, 1.5, 2.0)
+
+
+def load_cues() -> list:
+    cues = []
+    for path in sorted(VIDEOS_DIR.glob('*.json')):
+        if path.name == 'index.json':
+            continue
+        cues.extend(json.loads(path.read_text(encoding='utf-8')))
+    return cues
+
+
+def main():
+    parser = argparse.ArgumentParser(description='난이도 점수 분포와 기준값별 fast 모델 비율')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='예시를 나눌 기준값')
+    parser.add_argument('--samples', type=int, default=8, help='단계별로 보여줄 자막 수')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    cues = load_cues()
+    total_tokens = batch_tokens(cues)
+    print(f"자막 {len(cues)}개, 약 {total_tokens:,} 토큰\n")
+    print(f"{'기준값':>6} {'fast 자막':>10} {'비율':>6} {'fast 토큰':>10}")
+    for threshold in sorted(set(THRESHOLDS + (args.threshold,))):
+        fast = route(cues, threshold)[TIERS[0]]
+        mark = ' ←' if threshold == args.threshold else ''
+        print(f"{threshold:>6.1f} {len(fast):>10} {len(fast) / len(cues):>6.0%} "
+              f"{batch_tokens(fast) / total_tokens:>10.0%}{mark}")
+
+    rng = random.Random(args.seed)
+    for tier, tier_cues in route(cues, args.threshold).items():
+        print(f"\n[{tier}] 예시")
+        for s in rng.sample(tier_cues, min(args.samples, len(tier_cues))):
+            text = ' '.join(s['text'].split())
+            print(f"  {difficulty(s['text']):4.2f}  {text[:70]}")
+
+
+if __name__ == '__main__':
+    main()
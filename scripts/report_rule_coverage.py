@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+규칙 발음(rule_pronunciation) 적용 범위 보고
+
+public/videos의 영상마다 규칙만으로 채울 수 있는 자막 수와 그만큼 줄어드는 LLM 배치 수를
+gen_pronunciation(claude CLI, 토큰 예산 3600 / 최대 40개)과 add_video(API, 1500 / 12개)
+기준으로 보여줍니다. 이미 발음이 있는 자막은 LLM 결과와 나란히 비교할 수 있습니다.
+
+사용법:
+    python scripts/report_rule_coverage.py
+    python scripts/report_rule_coverage.py --samples 20
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+from add_video import API_BATCH_MAX_CUES, API_BATCH_TOKENS  # noqa: E402
+from video_store import VIDEOS_DIR  # noqa: E402
+from pronunciation_batcher import DEFAULT_BUDGET, pack_batches  # noqa: E402
+from rule_pronunciation import fill_known  # noqa: E402
+
+
+def saved_batches(subtitles: list, filled: dict, budget: float, max_cues: int) -> int:
+    rest = [s for s in subtitles if s['index'] not in filled]
+    return len(pack_batches(subtitles, budget, max_cues)) - len(pack_batches(rest, budget, max_cues))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='규칙 발음 적용 범위와 절약되는 LLM 호출 수')
+    parser.add_argument('--samples', type=int, default=10, help='LLM 결과와 비교해 보여줄 자막 수')
+    args = parser.parse_args()
+
+    total = {'cues': 0, 'filled': 0, 'cli': 0, 'api': 0}
+    samples = []
+    print(f"{'영상':<14} {'자막':>6} {'규칙':>6} {'비율':>6} {'CLI 절약':>9} {'API 절약':>9}")
+    for path in sorted(VIDEOS_DIR.glob('*.json')):
+        if path.name == 'index.json':
+            continue
+        subtitles = json.loads(path.read_text(encoding='utf-8'))
+        filled = fill_known(subtitles)
+        cli = saved_batches(subtitles, filled, DEFAULT_BUDGET, 40)
+        api = saved_batches(subtitles, filled, API_BATCH_TOKENS, API_BATCH_MAX_CUES)
+        print(f"{path.stem:<14} {len(subtitles):>6} {len(filled):>6} {len(filled) / len(subtitles):>6.1%} "
+              f"{cli:>9} {api:>9}")
+        for key, n in (('cues', len(subtitles)), ('filled', len(filled)), ('cli', cli), ('api', api)):
+            total[key] += n
+        samples.extend((s, filled[s['index']]) for s in subtitles
+                       if s['index'] in filled and s.get('pronunciation'))
+
+    print(f"{'합계':<14} {total['cues']:>6} {total['filled']:>6} {total['filled'] / total['cues']:>6.1%} "
+          f"{total['cli']:>9} {total['api']:>9}")
+    print("\n(CLI/API 절약: 규칙 적용으로 줄어드는 LLM 배치 호출 수)")
+
+    if samples and args.samples:
+        print(f"\n규칙 결과 vs 기존 LLM 결과 ({min(args.samples, len(samples))}/{len(samples)}개)")
+        for s, r in samples[:args.samples]:
+            print(f"  {s['text']}\n    규칙 {r['pronunciation']} / {r['translation']}"
+                  f"\n    LLM  {s['pronunciation']} / {s.get('translation', '')}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+번역 메모리(translation_memory) 효과 보고
+
+public/videos의 영상마다 "나머지 영상만으로 만든 번역 메모리"를 두고(영상 하나씩 빼고 색인),
+그 영상의 자막 중 그대로 재사용되는 수와 참고로 붙는 수, 그리고 줄어드는 출력 토큰을 추정합니다.
+
+- 재사용: 그 자막의 출력(발음/번역/notes) 전체가 줄어듦
+- 참고: 기존 결과의 notes가 참고 자막의 notes와 같으면 모델이 "notes": "REF"로만 답할 수 있으므로
+  그만큼 줄어듦 (대신 REF 줄만큼 입력이 늘어남)
+- 토큰은 anthropic_backend.estimate_tokens(글자 수 기준) 추정치입니다.
+
+사용법:
+    python scripts/report_translation_memory.py
+    python scripts/report_translation_memory.py --reuse 0.9 --reference 0.4
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+from anthropic_backend import estimate_tokens  # noqa: E402
+from gen_pronunciation import build_prompt  # noqa: E402
+from translation_memory import (DEFAULT_REFERENCE, DEFAULT_REUSE, VIDEOS_DIR,  # noqa: E402
+                                TranslationMemory, lookup)
+
+
+def output_tokens(s: dict) -> int:
+    return estimate_tokens(json.dumps({'index': s['index'], 'pronunciation': s['pronunciation'],
+                                       'translation': s.get('translation', ''),
+                                       'notes': s.get('notes', [])}, ensure_ascii=False))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='번역 메모리 재사용/참고 비율과 줄어드는 출력 토큰 추정')
+    parser.add_argument('--reuse', type=float, default=DEFAULT_REUSE, help='그대로 쓸 최소 유사도')
+    parser.add_argument('--reference', type=float, default=DEFAULT_REFERENCE, help='참고로 넣을 최소 유사도')
+    args = parser.parse_args()
+
+    videos = {}
+    for path in sorted(VIDEOS_DIR.glob('*.json')):
+        if path.name != 'index.json':
+            videos[path.stem] = [s for s in json.loads(path.read_text(encoding='utf-8'))
+                                 if s.get('pronunciation')]
+
+    totals = dict(cues=0, reused=0, referenced=0, out=0, saved=0, extra_in=0)
+    build_time = query_time = 0.0
+    print(f"{'영상':<14} {'자막':>6} {'재사용':>6} {'참고':>6} {'출력 토큰':>9} {'절약':>7}")
+    for video_id, subtitles in videos.items():
+        t0 = time.perf_counter()
+        memory = TranslationMemory()
+        for other, others in videos.items():
+            if other != video_id:
+                for s in others:
+                    memory.add(s['text'], s)
+        t1 = time.perf_counter()
+        reused, references = lookup(memory, subtitles, args.reuse, args.reference)
+        build_time += t1 - t0
+        query_time += time.perf_counter() - t1
+
+        out = sum(output_tokens(s) for s in subtitles)
+        saved = sum(output_tokens(s) for s in subtitles if s['index'] in reused)
+        extra_in = 0
+        for s in subtitles:
+            ref = references.get(s['index'])
+            if ref is None:
+                continue
+            if s.get('notes', []) == ref['notes'] and ref['notes']:
+                saved += estimate_tokens(json.dumps(ref['notes'], ensure_ascii=False)) - estimate_tokens('"REF"')
+            extra_in += estimate_tokens(build_prompt([dict(s, reference=ref)])) - estimate_tokens(build_prompt([s]))
+
+        print(f"{video_id:<14} {len(subtitles):>6} {len(reused):>6} {len(references):>6} {out:>9,} {saved:>7,}")
+        for key, n in (('cues', len(subtitles)), ('reused', len(reused)), ('referenced', len(references)),
+                       ('out', out), ('saved', saved), ('extra_in', extra_in)):
+            totals[key] += n
+
+    print(f"{'합계':<14} {totals['cues']:>6} {totals['reused']:>6} {totals['referenced']:>6} "
+          f"{totals['out']:>9,} {totals['saved']:>7,}")
+    print(f"\n출력 토큰 {totals['saved'] / max(1, totals['out']):.1%} 절약 추정, "
+          f"REF 줄로 늘어나는 입력 약 {totals['extra_in']:,} 토큰")
+    print(f"색인 {build_time / len(videos) * 1000:.0f}ms/영상, "
+          f"조회 {query_time / max(1, totals['cues']) * 1e6:.0f}µs/자막")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 단어 단위 타임라인
+
+자막 전체를 단어 단위로 펼친 타임라인입니다. (word, start, end) 튜플 리스트 대신
+시작/끝 시간을 array('d') 열에, 단어는 중복 없는 단어 표의 번호(array('I'))로 저장하여
+긴 영상에서도 메모리를 적게 씁니다.
+
+자막에 단어별 시작 시간(word_starts, subtitle_parser 참고)이 있으면 그 값을 쓰고,
+없으면 자막 시간을 단어 수로 고르게 나눕니다.
+bench_sentence_segmenter.py의 기준 구현(fix_sentence_boundaries_legacy)이 씁니다.
+"""
+
+from array import array
+from typing import Dict, List, Optional
+
+
+class WordTimeline:
+    """단어 표 + 시작/끝 시간 열로 구성된 단어 타임라인"""
+
+    __slots__ = ('starts', 'ends', 'ids', 'vocab', '_vocab_ids')
+
+    def __init__(self):
+        self.starts = array('d')
+        self.ends = array('d')
+        self.ids = array('I')
+        self.vocab: List[str] = []
+        self._vocab_ids: Dict[str, int] = {}
+
+    @classmethod
+    def from_subtitles(cls, subtitles: List[Dict]) -> 'WordTimeline':
+        """자막 목록으로 타임라인을 만듭니다 (non-breaking space는 공백으로 취급)."""
+        timeline = cls()
+        for sub in subtitles:
+            timeline.add_cue(sub['text'].replace('\xa0', ' '), sub['start'], sub['end'],
+                             sub.get('word_starts'))
+        return timeline
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _intern(self, word: str) -> int:
+        word_id = self._vocab_ids.get(word)
+        if word_id is None:
+            word_id = self._vocab_ids[word] = len(self.vocab)
+            self.vocab.append(word)
+        return word_id
+
+    def append(self, word: str, start: float, end: float) -> None:
+        self.ids.append(self._intern(word))
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def add_cue(self, text: str, start: float, end: float,
+                word_starts: Optional[List[float]] = None) -> None:
+        """자막 하나의 단어를 추가합니다.
+
+        word_starts가 단어 수와 맞으면 실제 단어 시작 시간을 쓰고
+        (각 단어의 끝 = 다음 단어의 시작, 마지막 단어는 자막 끝),
+        아니면 자막 시간을 단어 수로 고르게 나눕니다.
+        """
+        words = text.split()
+        if not words:
+            return
+        if word_starts and len(word_starts) == len(words):
+            for i, w in enumerate(words):
+                we = word_starts[i + 1] if i + 1 < len(words) else end
+                self.append(w, word_starts[i], we)
+            return
+        per_word = (end - start) / len(words)
+        for i, w in enumerate(words):
+            self.append(w, start + i * per_word, start + (i + 1) * per_word)
+
+    def word(self, i: int) -> str:
+        return self.vocab[self.ids[i]]
+
+    def words(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """[start, stop) 범위의 단어 목록"""
+        vocab = self.vocab
+        return [vocab[i] for i in self.ids[start:stop]]
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 문장 분할 엔진
+
+SubtitleExtractor._fix_sentence_boundaries의 구현입니다.
+YouTube 자막은 시간 기준으로 잘려 문장 중간에서 끊기는 경우가 많아,
+문장 부호(. ! ?)를 기준으로 자막을 다시 나눕니다.
+
+속도를 위해:
+- 전체 자막을 한 번만 토큰화하고 (str.split), 문장 끝 후보는
+  미리 컴파일한 정규식 하나로 전체 텍스트에서 찾습니다.
+- 문장은 단어 인덱스 범위로만 다루고, 합치기/나누기가 끝난 뒤 한 번만 문자열을 만듭니다.
+- 단어별 시간은 미리 펼치지 않고 문장 경계 단어에 대해서만 자막 단위로 계산합니다.
+
+출력은 기존 단어별 구현(scripts/bench_sentence_segmenter.py의 fix_sentence_boundaries_legacy)과 동일합니다.
+"""
+
+import logging
+import re
+from bisect import bisect_right
+from itertools import accumulate, chain
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+ABBREVS = frozenset({
+    'Mr.', 'Mrs.', 'Ms.', 'Dr.', 'St.', 'Jr.', 'Sr.', 'Prof.',
+    'vs.', 'etc.', 'i.e.', 'e.g.', 'U.S.', 'U.K.', 'a.m.', 'p.m.',
+    'Mt.', 'Ft.', 'Lt.', 'Gen.', 'Gov.', 'Sgt.', 'Inc.', 'Ltd.',
+    'Corp.', 'Co.', 'Dept.', 'Univ.', 'Ave.', 'Blvd.', 'No.',
+})
+
+# 긴 문장을 나눌 때 분할 지점이 되는 접속사
+CONJUNCTIONS = frozenset({
+    'and', 'but', 'or', 'so', 'because', 'when', 'while', 'if', 'though',
+    'although', 'since', 'where', 'which', 'before', 'after',
+})
+
+MAX_WORDS = 20           # 이보다 긴 문장은 절 단위로 분리
+MIN_PUNCT_RATIO = 0.3    # 문장 부호로 끝나는 자막 비율이 이보다 낮으면 보정하지 않음
+
+_OPENERS = '"“‘('
+_PUNCT_END_RE = re.compile(r'[.!?]["\'”’)]*$')
+# 단어 끝의 문장 부호 (뒤에 닫는 따옴표/괄호만 올 수 있음). match.start()가 그 부호 위치
+_CANDIDATE_RE = re.compile(r'[.!?]["\'”’)]*(?= |\Z)')
+_INITIAL_RE = re.compile(r'^[A-Z]\.$')
+_DECIMAL_RE = re.compile(r'^[\$€£¥]?\d+\.\d*$')
+
+
+class _CueTimes:
+    """단어 인덱스 → 시간. 자막별 첫 단어 위치만 저장하고 필요한 단어만 계산합니다.
+
+    자막에 단어별 시작 시간(word_starts)이 있으면 사용하고,
+    없으면 자막 시간을 단어 수로 고르게 나눕니다 (scripts/word_timeline.py의 WordTimeline과 같은 계산).
+    문장 경계는 앞에서부터 차례로 조회하므로 이진 탐색 대신 커서를 앞으로만 옮깁니다.
+    """
+
+    __slots__ = ('subtitles', 'offsets', 'counts', '_k')
+
+    def __init__(self, subtitles: List[Dict], counts: List[int]):
+        self.subtitles = subtitles
+        self.counts = counts
+        self.offsets = list(accumulate(counts, initial=0))
+        self._k = 0
+
+    def _locate(self, i: int):
+        offsets = self.offsets
+        k = self._k
+        if offsets[k] > i:
+            k = bisect_right(offsets, i) - 1
+        while offsets[k + 1] <= i:
+            k += 1
+        self._k = k
+        return self.subtitles[k], i - offsets[k], self.counts[k]
+
+    def start(self, i: int) -> float:
+        sub, j, n = self._locate(i)
+        ws = sub.get('word_starts')
+        if ws and len(ws) == n:
+            return ws[j]
+        return sub['start'] + j * ((sub['end'] - sub['start']) / n)
+
+    def end(self, i: int) -> float:
+        sub, j, n = self._locate(i)
+        ws = sub.get('word_starts')
+        if ws and len(ws) == n:
+            return ws[j + 1] if j + 1 < n else sub['end']
+        return sub['start'] + (j + 1) * ((sub['end'] - sub['start']) / n)
+
+
+def _find_boundaries(text: str, words: List[str]) -> List[int]:
+    """문장이 끝나는 단어 인덱스 목록 (오름차순)"""
+    n_words = len(words)
+    boundaries = []
+    word_idx = 0
+    last = 0
+    for m in _CANDIDATE_RE.finditer(text):
+        pos = m.start()
+        word_idx += text.count(' ', last, pos)
+        last = pos
+        word = words[word_idx]
+        stripped = text[text.rfind(' ', 0, pos) + 1:pos + 1]
+
+        # 약어, 이니셜 (A. B. 등), 소수점 (3.5, $10.99 등) 제외
+        if stripped in ABBREVS or word in ABBREVS:
+            continue
+        # (정규식은 길이/숫자 조건을 먼저 본 뒤에만 실행)
+        if len(stripped) == 2 and _INITIAL_RE.match(stripped):
+            continue
+        if stripped[-2:-1].isdecimal() and _DECIMAL_RE.match(stripped):
+            continue
+
+        # 줄임표(...) — 다음 단어가 대문자면 문장 끝
+        if stripped.endswith('...'):
+            if word_idx + 1 < n_words:
+                nxt = words[word_idx + 1].lstrip(_OPENERS)
+                if nxt and nxt[0].isupper():
+                    boundaries.append(word_idx)
+            continue
+
+        # !나 ?는 거의 항상 문장 끝
+        if stripped[-1] in '!?':
+            boundaries.append(word_idx)
+            continue
+
+        # . 의 경우: 다음 단어가 대문자면 문장 끝, 마지막 단어면 문장 끝
+        if word_idx + 1 < n_words:
+            nxt = words[word_idx + 1].lstrip(_OPENERS)
+            if nxt and nxt[0].isupper():
+                boundaries.append(word_idx)
+        else:
+            boundaries.append(word_idx)
+
+    return boundaries
+
+
+def segment_sentences(subtitles: List[Dict]) -> List[Dict]:
+    """자막을 문장 단위로 재분할합니다.
+
+    - 구두점 비율 30% 미만이면 보정을 건너뜁니다 (자동 생성 자막 등).
+    - 1~2단어 조각은 인접 자막에 합칩니다.
+    - 20단어 초과 문장은 쉼표/접속사에서 분리합니다.
+    """
+    if not subtitles or len(subtitles) < 2:
+        return subtitles
+
+    texts = [s['text'] for s in subtitles]
+
+    # 구두점이 있는 자막 비율 확인 — 너무 낮으면 보정 불가
+    punctuated = sum(map(bool, map(_PUNCT_END_RE.search, map(str.strip, texts))))
+    ratio = punctuated / len(subtitles)
+    if ratio < MIN_PUNCT_RATIO:
+        logger.info(f"  문장 부호 비율 {ratio:.0%} — 문장 보정 건너뜀")
+        return subtitles
+
+    # 1. 토큰화 (non-breaking space 정규화)
+    cue_words = [t.replace('\xa0', ' ').split() for t in texts]
+    words = list(chain.from_iterable(cue_words))
+    n_words = len(words)
+    if not n_words:
+        return subtitles
+    times = _CueTimes(subtitles, list(map(len, cue_words)))
+    text = ' '.join(words)
+
+    # 2. 문장 경계 탐지
+    boundaries = _find_boundaries(text, words)
+    if not boundaries:
+        return subtitles
+    if boundaries[-1] != n_words - 1:
+        boundaries.append(n_words - 1)
+
+    # 3~4. 문장 범위 [a, b] 생성 + 1~2단어 문장은 앞 문장에 합치기
+    ranges = []
+    a = 0
+    for b in boundaries:
+        if b - a + 1 <= 2 and ranges:
+            ranges[-1][1] = b
+        else:
+            ranges.append([a, b])
+        a = b + 1
+
+    # 첫 항목이 여전히 1~2단어면 다음에 합치기
+    if len(ranges) >= 2 and ranges[0][1] - ranges[0][0] + 1 <= 2:
+        ranges[1][0] = ranges[0][0]
+        ranges.pop(0)
+
+    # 5. 너무 긴 문장은 중간에 가장 가까운 쉼표/접속사에서 분리
+    # 6. 문자열은 여기서 한 번만 만들고, 인덱스 재부여 및 시간 반올림
+    result = []
+    for a, b in ranges:
+        start, end = times.start(a), times.end(b)
+        n = b - a + 1
+        best_pos = _split_position(words, a, n) if n > MAX_WORDS else None
+
+        if best_pos is None:
+            result.append({'index': len(result), 'start': round(start, 2),
+                           'end': round(end, 2), 'text': ' '.join(words[a:b + 1])})
+            continue
+
+        mid_time = round(start + (end - start) * (best_pos / n), 2)
+        result.append({'index': len(result), 'start': round(start, 2),
+                       'end': round(mid_time, 2), 'text': ' '.join(words[a:a + best_pos])})
+        result.append({'index': len(result), 'start': round(mid_time, 2),
+                       'end': round(end, 2), 'text': ' '.join(words[a + best_pos:b + 1])})
+
+    return result
+
+
+def _split_position(words: List[str], a: int, n: int):
+    """words[a:a+n] 문장에서 중간에 가장 가까운 분할 위치(앞부분 단어 수). 후보가 없으면 None.
+
+    쉼표로 끝나는 단어는 그 뒤에서, 접속사는 그 앞에서 나눕니다.
+    문장 앞뒤 3단어 안쪽은 후보에서 제외합니다.
+    중간에서 바깥쪽으로 찾으므로 대부분 몇 단어만 보고 끝납니다 (거리가 같으면 앞쪽 우선).
+    """
+    mid = n // 2
+    lo, hi = 3, n - 3
+
+    def is_candidate(pos):
+        j = pos - 1
+        if lo <= j <= hi and words[a + j].endswith(','):
+            return True
+        return lo <= pos <= hi and words[a + pos].lower() in CONJUNCTIONS
+
+    for d in range(n):
+        if is_candidate(mid - d):
+            return mid - d
+        if d and is_candidate(mid + d):
+            return mid + d
+        if mid - d <= lo and mid + d > hi + 1:
+            break
+    return None
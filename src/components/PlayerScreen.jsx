@@ -33,7 +33,8 @@ export function PlayerScreen({
     try { return localStorage.getItem("videoCollapsed") === "true"; } catch { return false; }
   });
 
-  const hasPronunciation = subtitles.length > 0 && "pronunciation" in subtitles[0];
+  // Videos still being generated (--progressive) only have pronunciation on the cues done so far
+  const hasPronunciation = subtitles.some((s) => "pronunciation" in s);
 
   // ── Shared refs ──
   const loopTargetRef = useRef(null);
@@ -176,6 +176,17 @@ export function VideoListScreen({ videos, onSelect, favoriteIds, onToggleFavorit
                     {video.subtitleCount}
                   </div>
                 </div>
+                {video.pronunciationProgress && (
+                  <>
+                    <div style={{ width: "1px", height: "24px", background: "rgba(80,80,100,0.3)" }} />
+                    <div>
+                      <div style={{ fontSize: "8px", color: T.textMuted, fontFamily: "monospace", textTransform: "uppercase", letterSpacing: "0.12em", marginBottom: "2px" }}>PRONUNCIATION</div>
+                      <div style={{ fontSize: "13px", color: T.cockpit.amberText, fontFamily: "monospace", fontWeight: "700" }}>
+                        {Math.floor(video.pronunciationProgress.done / video.pronunciationProgress.total * 100)}%
+                      </div>
+                    </div>
+                  </>
+                )}
               </div>
             </div>
 
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 스트리밍 자막 파서
+
+VTT/SRT 파일을 한 줄씩 읽는 상태 기계로 파싱하여 자막 큐를 하나씩 yield합니다.
+전체 파일을 문자열로 읽거나 정규식으로 훑지 않으므로 몇 시간짜리 자동 생성 자막도
+선형 시간, 일정한 메모리로 처리합니다.
+
+- CRLF/CR 줄바꿈, UTF-8 BOM 처리
+- VTT 헤더, 큐 식별자, 큐 설정(align:start position:0% 등) 처리
+- VTT NOTE / STYLE / REGION 블록 건너뜀
+- 자동 자막의 단어별 타임스탬프(<00:00:01.230><c> word</c>)를 word_starts로 보존 (선택)
+
+사용 예:
+    with open('subs.en.vtt', encoding='utf-8-sig') as f:
+        for cue in iter_vtt_cues(f):
+            print(cue['start'], cue['text'])
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_INLINE_TS_RE = re.compile(r'<((?:\d+:)?\d{2}:\d{2}[.,]\d{3})>')
+
+# 파서 상태
+_IDLE = 0      # 블록 사이 (빈 줄 대기)
+_CUE = 1       # 큐 텍스트 수집 중
+_SKIP = 2      # NOTE/STYLE/REGION/헤더 등 무시할 블록
+_TIMING = 3    # 큐 식별자 다음 줄 (타이밍 줄 대기)
+
+
+def parse_timestamp(value: str) -> float:
+    """'hh:mm:ss.ttt', 'mm:ss.ttt' (또는 ',' 구분) 타임스탬프를 초 단위로 변환합니다."""
+    parts = value.strip().replace(',', '.').split(':')
+    try:
+        if len(parts) == 3:
+            seconds = int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
+        elif len(parts) == 2:
+            seconds = int(parts[0]) * 60 + float(parts[1])
+        else:
+            raise ValueError(value)
+    except ValueError:
+        raise ValueError(f"타임스탬프 파싱 실패: {value!r}")
+    return round(seconds, 2)
+
+
+def _parse_timing_line(line: str):
+    """'00:00:01.000 --> 00:00:02.000 align:start' → (start, end). 설정은 무시합니다."""
+    left, _, right = line.partition('-->')
+    right = right.split()
+    if not right:
+        raise ValueError(f"타이밍 줄 파싱 실패: {line!r}")
+    return parse_timestamp(left), parse_timestamp(right[0])
+
+
+def _clean_text(lines) -> str:
+    """태그를 제거하고 공백을 정리합니다."""
+    return ' '.join(_TAG_RE.sub('', ' '.join(lines)).split())
+
+
+def _inline_word_starts(lines, start: float, end: float, n_words: int):
+    """VTT 큐 본문의 단어별 타임스탬프로 각 단어의 시작 시간을 계산합니다.
+
+    타임스탬프 사이에 단어가 여러 개 있으면 그 구간을 고르게 나눕니다.
+    타임스탬프가 없거나 단어 수가 본문과 맞지 않으면 None을 반환합니다.
+    """
+    segments = []  # (구간 시작 시간, 단어 목록)
+    found = False
+    for line in lines:
+        parts = _INLINE_TS_RE.split(line)
+        # parts = [앞 텍스트, ts1, 텍스트1, ts2, 텍스트2, ...]
+        seg_start = start
+        for i in range(0, len(parts), 2):
+            if i:
+                seg_start = parse_timestamp(parts[i - 1])
+                found = True
+            words = _TAG_RE.sub('', parts[i]).split()
+            if words:
+                segments.append((seg_start, words))
+
+    if not found:
+        return None
+
+    starts = []
+    for j, (seg_start, words) in enumerate(segments):
+        seg_end = segments[j + 1][0] if j + 1 < len(segments) else end
+        step = max(seg_end - seg_start, 0.0) / len(words)
+        starts.extend(round(seg_start + k * step, 2) for k in range(len(words)))
+
+    return starts if len(starts) == n_words else None
+
+
+def _lines(source: Iterable[str]) -> Iterator[str]:
+    """BOM과 줄 끝(\\r\\n, \\n)을 정리한 줄을 yield합니다.
+
+    파일은 newline=''(또는 기본값)으로 열어야 CR 단독 줄바꿈도 줄 단위로 나뉩니다.
+    """
+    source = iter(source)
+    for line in source:
+        yield line.lstrip('\ufeff').rstrip('\r\n')
+        break
+    for line in source:
+        yield line.rstrip('\r\n')
+
+
+def iter_vtt_cues(source: Iterable[str], word_times: bool = False) -> Iterator[Dict]:
+    """WebVTT 줄 스트림에서 {'index', 'start', 'end', 'text'} 큐를 yield합니다.
+
+    index는 텍스트가 있는 큐에 1부터 순서대로 부여합니다.
+    word_times가 True이고 큐에 단어별 타임스탬프가 있으면
+    text.split()과 같은 길이의 'word_starts' 목록을 함께 넣습니다.
+    """
+    state = _IDLE
+    index = 1
+    start = end = 0.0
+    text_lines = []
+
+    for line in _lines(source):
+        if state == _CUE:
+            # 큐는 완전히 빈 줄에서만 끝남 (자동 자막은 공백 한 칸짜리 줄을 큐 안에 넣음)
+            if not line:
+                cue = _make_vtt_cue(index, start, end, text_lines, word_times)
+                if cue:
+                    yield cue
+                    index += 1
+                text_lines = []
+                state = _IDLE
+            else:
+                text_lines.append(line)
+            continue
+
+        if state == _SKIP:
+            if not line:
+                state = _IDLE
+            continue
+
+        if not line.strip():
+            state = _IDLE
+            continue
+
+        if '-->' in line:
+            try:
+                start, end = _parse_timing_line(line)
+            except ValueError:
+                state = _SKIP
+                continue
+            state = _CUE
+            continue
+
+        if state == _TIMING:
+            # 식별자 다음에 타이밍 줄이 오지 않음 → 알 수 없는 블록
+            state = _SKIP
+            continue
+
+        head = line.split(None, 1)[0]
+        if head in ('WEBVTT', 'NOTE', 'STYLE', 'REGION'):
+            state = _SKIP
+        else:
+            # 큐 식별자
+            state = _TIMING
+
+    if state == _CUE:
+        cue = _make_vtt_cue(index, start, end, text_lines, word_times)
+        if cue:
+            yield cue
+
+
+def _make_vtt_cue(index: int, start: float, end: float, text_lines, word_times: bool):
+    text = _clean_text(text_lines)
+    if not text:
+        return None
+    cue = {'index': index, 'start': start, 'end': end, 'text': text}
+    if word_times and '<' in ''.join(text_lines):
+        starts = _inline_word_starts(text_lines, start, end, len(text.split()))
+        if starts:
+            cue['word_starts'] = starts
+    return cue
+
+
+def iter_srt_cues(source: Iterable[str]) -> Iterator[Dict]:
+    """SRT 줄 스트림에서 {'index', 'start', 'end', 'text'} 큐를 yield합니다.
+
+    index는 파일에 적힌 번호를 사용하며, 없으면 순서대로 부여합니다.
+    """
+    state = _IDLE
+    counter = 0
+    index = 0
+    start = end = 0.0
+    text_lines = []
+
+    for line in _lines(source):
+        if state == _CUE:
+            # 큐는 완전히 빈 줄에서만 끝남 (자동 자막은 공백 한 칸짜리 줄을 큐 안에 넣음)
+            if not line:
+                text = _clean_text(text_lines)
+                if text:
+                    yield {'index': index, 'start': start, 'end': end, 'text': text}
+                text_lines = []
+                state = _IDLE
+            else:
+                text_lines.append(line)
+            continue
+
+        if state == _SKIP:
+            if not line:
+                state = _IDLE
+            continue
+
+        if not line.strip():
+            state = _IDLE
+            continue
+
+        if '-->' in line:
+            try:
+                start, end = _parse_timing_line(line)
+            except ValueError:
+                state = _SKIP
+                continue
+            counter += 1
+            if state != _TIMING:
+                index = counter
+            state = _CUE
+            continue
+
+        if state == _IDLE and line.strip().isdigit():
+            index = int(line.strip())
+            state = _TIMING
+        else:
+            state = _SKIP
+
+    if state == _CUE:
+        text = _clean_text(text_lines)
+        if text:
+            yield {'index': index, 'start': start, 'end': end, 'text': text}
+
+
+def iter_subtitle_file(filepath: str, word_times: bool = False) -> Iterator[Dict]:
+    """확장자(.vtt / 그 외 SRT)에 맞는 파서로 자막 파일을 스트리밍 파싱합니다."""
+    with open(filepath, 'r', encoding='utf-8-sig', newline='') as f:
+        if Path(filepath).suffix.lower() == '.vtt':
+            yield from iter_vtt_cues(f, word_times=word_times)
+        else:
+            yield from iter_srt_cues(f)
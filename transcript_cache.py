@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 원본 자막 디스크 캐시
+
+유튜브에서 받아온 원본 자막 큐(중복 병합/문장 보정 전)를 디스크에 저장해
+같은 영상을 다시 처리할 때 네트워크 요청을 건너뜁니다.
+
+구조:
+    {cache_dir}/refs/{video_id}.json        # 영상별 참조 (선택된 트랙 키 또는 "자막 없음")
+    {cache_dir}/objects/{key[:2]}/{key}.json  # 자막 큐 본문
+
+- key는 (video_id, 언어, 소스, 수동/자동 여부)의 SHA-256 해시입니다.
+- "자막 없음" 결과도 짧은 TTL로 캐시하여 죽은 영상에 yt-dlp를 반복 호출하지 않습니다.
+- 만료된 항목은 조회 시 삭제되며, prune()으로 한꺼번에 정리할 수 있습니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from video_store import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+PROJECT_DIR = Path(__file__).parent
+DEFAULT_CACHE_DIR = Path(os.environ.get('MOVIETALK_CACHE_DIR', PROJECT_DIR / '.cache')) / 'transcripts'
+
+DEFAULT_TTL = 30 * 24 * 3600        # 자막: 30일
+DEFAULT_NEGATIVE_TTL = 24 * 3600    # 자막 없음: 1일
+
+# get()이 "자막 없음" 캐시 항목을 만났을 때 반환하는 값
+NO_TRANSCRIPT = object()
+
+
+class TranscriptCache:
+    """원본 자막 큐를 video_id/언어/소스/생성방식 기준으로 캐시하는 클래스"""
+
+    def __init__(self, cache_dir=None, ttl: float = DEFAULT_TTL,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    @staticmethod
+    def make_key(video_id: str, language: str, source: str, generated: Optional[bool]) -> str:
+        """트랙 식별 정보로 캐시 키를 만듭니다."""
+        kind = 'unknown' if generated is None else ('auto' if generated else 'manual')
+        raw = f"{video_id}|{language}|{source}|{kind}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _ref_path(self, video_id: str) -> Path:
+        return self.cache_dir / 'refs' / f"{video_id}.json"
+
+    def _object_path(self, key: str) -> Path:
+        return self.cache_dir / 'objects' / key[:2] / f"{key}.json"
+
+    def _is_expired(self, ref: Dict, now: float) -> bool:
+        ttl = self.negative_ttl if ref.get('missing') else self.ttl
+        return now - ref.get('fetched_at', 0) > ttl
+
+    def get(self, video_id: str):
+        """캐시된 자막을 조회합니다.
+
+        Returns:
+            None: 캐시 없음 (또는 만료)
+            NO_TRANSCRIPT: "자막 없음"으로 캐시된 영상
+            (subtitles, track): 캐시된 원본 자막 큐와 트랙 정보
+        """
+        ref_path = self._ref_path(video_id)
+        try:
+            with open(ref_path, 'r', encoding='utf-8') as f:
+                ref = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if self._is_expired(ref, time.time()):
+            self._evict(ref_path, ref)
+            return None
+
+        if ref.get('missing'):
+            return NO_TRANSCRIPT
+
+        try:
+            with open(self._object_path(ref['key']), 'r', encoding='utf-8') as f:
+                obj = json.load(f)
+        except (OSError, KeyError, json.JSONDecodeError):
+            return None
+
+        track = {k: ref.get(k) for k in ('language', 'source', 'generated')}
+        return obj['subtitles'], track
+
+    def put(self, video_id: str, subtitles: List[Dict], track: Dict) -> str:
+        """원본 자막 큐를 저장하고 캐시 키를 반환합니다."""
+        key = self.make_key(video_id, track.get('language', ''), track.get('source', ''),
+                            track.get('generated'))
+        write_json_atomic(self._object_path(key), {
+            'video_id': video_id,
+            **track,
+            'subtitles': subtitles,
+        }, indent=None)
+        write_json_atomic(self._ref_path(video_id), {
+            'key': key,
+            **track,
+            'fetched_at': time.time(),
+        }, indent=None)
+        return key
+
+    def put_missing(self, video_id: str) -> None:
+        """자막을 찾을 수 없는 영상으로 기록합니다."""
+        write_json_atomic(self._ref_path(video_id), {
+            'missing': True,
+            'fetched_at': time.time(),
+        }, indent=None)
+
+    def _evict(self, ref_path: Path, ref: Dict) -> None:
+        for path in [ref_path] + ([self._object_path(ref['key'])] if ref.get('key') else []):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def prune(self) -> Tuple[int, int]:
+        """만료된 참조와 어디서도 참조하지 않는 자막 본문을 삭제합니다.
+
+        Returns: (삭제한 참조 수, 삭제한 본문 수)
+        """
+        now = time.time()
+        live_keys = set()
+        removed_refs = 0
+        for ref_path in (self.cache_dir / 'refs').glob('*.json'):
+            try:
+                with open(ref_path, 'r', encoding='utf-8') as f:
+                    ref = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                ref = {}
+            if not ref or self._is_expired(ref, now):
+                try:
+                    os.remove(ref_path)
+                    removed_refs += 1
+                except OSError:
+                    pass
+            elif ref.get('key'):
+                live_keys.add(ref['key'])
+
+        removed_objects = 0
+        for obj_path in (self.cache_dir / 'objects').glob('*/*.json'):
+            if obj_path.stem not in live_keys:
+                try:
+                    os.remove(obj_path)
+                    removed_objects += 1
+                except OSError:
+                    pass
+
+        if removed_refs or removed_objects:
+            logger.info(f"자막 캐시 정리: 참조 {removed_refs}개, 본문 {removed_objects}개 삭제")
+        return removed_refs, removed_objects
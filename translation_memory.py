@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 번역 메모리 (비슷한 문장 찾기)
+
+패턴 연습 영상은 "I'm going to…" / "I'm going to the…"처럼 조금씩 바뀐 문장을 반복하므로
+정확히 같은 문장만 찾는 발음 캐시(pronunciation_cache)로는 놓칩니다. 이 모듈은 public/videos에
+이미 만든 자막들로 색인을 만들어, 새 자막마다 가장 비슷한 기존 자막을 찾습니다.
+
+- 문장을 소문자/문장부호 제거로 정규화한 뒤 글자 3-gram 해시(crc32) 집합으로 만들고,
+  MinHash 서명(32개, 해시에 난수 마스크를 XOR한 최솟값)을 16개 밴드로 나눈 LSH 버킷으로
+  후보를 찾은 다음 후보만 실제 Jaccard 유사도로 비교합니다.
+- 유사도가 reuse 기준(기본 1.0 = 대소문자/문장부호만 다름) 이상이면 기존 결과를 그대로 씁니다.
+  1.0일 때는 정규화한 문장(match_key)이 같은 경우만 씁니다 (반복 글자 때문에 3-gram 집합만 같은 경우 제외).
+- reference 기준(기본 0.5) 이상이면 프롬프트에 참고로 넣습니다 (gen_pronunciation.build_prompt).
+  모델은 발음 포인트가 참고와 같으면 "notes": "REF"로만 답하므로 출력 토큰이 줄어듭니다.
+- 텍스트가 바뀐(textHash 불일치) 자막과 지금 다시 만드는 영상(load의 exclude)은 색인하지 않습니다.
+- 같은 실행 안에서 대소문자/문장부호만 다른 자막(패턴 영상의 ">> 시간 문제야." / "시간 문제야.")은
+  group_same()으로 하나만 보내고 copy_results()로 결과를 나눠 씁니다.
+
+사용 예:
+    memory = TranslationMemory.load()
+    reused, references = lookup(memory, subtitles)
+"""
+
+import json
+import random
+import re
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pronunciation_cache import normalize_text
+
+PROJECT_DIR = Path(__file__).parent
+VIDEOS_DIR = PROJECT_DIR / "public" / "videos"
+
+NGRAM = 3
+NUM_PERM = 32
+BANDS = 16
+DEFAULT_REUSE = 1.0        # 이 이상이면 기존 결과를 그대로 사용
+DEFAULT_REFERENCE = 0.5    # 이 이상이면 프롬프트에 참고로 넣음
+
+_NON_WORD = re.compile(r"[^\w' ]+")
+
+
+def match_key(text: str) -> str:
+    """비교용 정규화: 소문자, 문장부호 제거, 공백 정리"""
+    text = _NON_WORD.sub(' ', normalize_text(text).lower())
+    return ' '.join(text.split())
+
+
+def shingles(text: str) -> frozenset:
+    """정규화한 문장의 글자 n-gram 해시 집합"""
+    key = f" {match_key(text)} "
+    return frozenset(zlib.crc32(key[i:i + NGRAM].encode('utf-8'))
+                     for i in range(max(1, len(key) - NGRAM + 1)))
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class TranslationMemory:
+    """이미 만든 자막 결과의 MinHash/LSH 색인"""
+
+    def __init__(self, num_perm: int = NUM_PERM, bands: int = BANDS, seed: int = 1):
+        rng = random.Random(seed)
+        self._masks = [rng.getrandbits(32) for _ in range(num_perm)]
+        self._rows = num_perm // bands
+        self._bands = bands
+        self.entries: List[Dict] = []
+        self._shingles: List[frozenset] = []
+        self._buckets = defaultdict(list)
+        self._keys = set()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _signature(self, grams: frozenset) -> List[int]:
+        return [min([g ^ mask for g in grams]) for mask in self._masks]
+
+    def _bands_of(self, signature: List[int]):
+        for band in range(self._bands):
+            yield band, tuple(signature[band * self._rows:(band + 1) * self._rows])
+
+    def add(self, text: str, result: Dict) -> None:
+        """자막 하나의 결과를 색인에 넣습니다 (정규화한 문장이 같으면 처음 것만)."""
+        key = match_key(text)
+        if not key or key in self._keys:
+            return
+        self._keys.add(key)
+        grams = shingles(text)
+        entry_id = len(self.entries)
+        self.entries.append({'text': text, 'pronunciation': result['pronunciation'],
+                             'translation': result.get('translation', ''),
+                             'notes': result.get('notes', [])})
+        self._shingles.append(grams)
+        for band in self._bands_of(self._signature(grams)):
+            self._buckets[band].append(entry_id)
+
+    def query(self, text: str) -> Optional[Tuple[float, Dict]]:
+        """가장 비슷한 기존 자막을 (유사도, 항목)으로 반환합니다. 후보가 없으면 None."""
+        if not match_key(text):
+            return None
+        grams = shingles(text)
+        candidates = set()
+        for band in self._bands_of(self._signature(grams)):
+            candidates.update(self._buckets.get(band, ()))
+        best = None
+        for entry_id in candidates:
+            score = jaccard(grams, self._shingles[entry_id])
+            if best is None or score > best[0]:
+                best = (score, self.entries[entry_id])
+        return best
+
+    @classmethod
+    def load(cls, videos_dir: Path = VIDEOS_DIR, exclude: Iterable[str] = ()) -> 'TranslationMemory':
+        """public/videos의 영상에서 발음이 현재 텍스트로 만들어진 자막을 색인합니다.
+
+        exclude: 색인하지 않을 영상 ID (지금 다시 만드는 영상; 자기 예전 발음을 그대로 쓰지 않도록)
+        """
+        from pronunciation_cache import CUE_GENERATED, CUE_UNTRACKED, cue_state
+
+        exclude = set(exclude)
+        memory = cls()
+        for path in sorted(videos_dir.glob('*.json')):
+            if path.name == 'index.json' or path.stem in exclude:
+                continue
+            try:
+                subtitles = json.loads(path.read_text(encoding='utf-8'))
+            except (OSError, json.JSONDecodeError):
+                continue
+            for s in subtitles:
+                if cue_state(s) in (CUE_GENERATED, CUE_UNTRACKED):
+                    memory.add(s['text'], s)
+        return memory
+
+
+def lookup(memory: TranslationMemory, subtitles: List[Dict], reuse: float = DEFAULT_REUSE,
+           reference: float = DEFAULT_REFERENCE) -> Tuple[Dict[int, Dict], Dict[int, Dict]]:
+    """자막 목록에서 (그대로 쓸 결과 {index: 결과}, 참고로 넣을 항목 {index: 항목})을 반환합니다."""
+    reused, references = {}, {}
+    for s in subtitles:
+        found = memory.query(s['text'])
+        if found is None:
+            continue
+        score, entry = found
+        # 3-gram 집합이 같아도 문장은 다를 수 있음 ("Haha." / "Hahaha.") → 1.0이면 정규화 문장까지 비교
+        if score >= reuse and (reuse < 1.0 or match_key(s['text']) == match_key(entry['text'])):
+            reused[s['index']] = {'index': s['index'], 'pronunciation': entry['pronunciation'],
+                                  'translation': entry['translation'], 'notes': entry['notes']}
+        elif score >= reference:
+            references[s['index']] = entry
+    return reused, references
+
+
+def group_same(pending: List[Dict], resolved: List[Dict] = ()) -> Tuple[List[Dict], Dict[int, List[int]]]:
+    """같은 실행 안에서 대소문자/문장부호만 다른 자막끼리 묶습니다.
+
+    resolved(이미 결과가 있는 자막)에 같은 문장이 있으면 그 자막을 대표로 씁니다.
+    Returns: (LLM에 보낼 pending 자막 목록, {대표 index: [결과를 복사할 index, ...]})
+    """
+    representative = {}
+    for s in resolved:
+        representative.setdefault(match_key(s['text']), s['index'])
+    unique, copies = [], defaultdict(list)
+    for s in pending:
+        key = match_key(s['text'])
+        if key in representative:
+            copies[representative[key]].append(s['index'])
+        else:
+            representative[key] = s['index']
+            unique.append(s)
+    return unique, dict(copies)
+
+
+def copy_results(results: Dict[int, Dict], copies: Dict[int, List[int]]) -> List[int]:
+    """대표 자막의 결과를 같은 문장인 자막들에 복사합니다. 복사한 index 목록을 반환합니다."""
+    copied = []
+    for rep, indices in copies.items():
+        if rep in results:
+            for idx in indices:
+                results[idx] = dict(results[rep], index=idx)
+                copied.append(idx)
+    return copied
+
+
+def report(memory: TranslationMemory, pending: List[Dict], reused: Dict, references: Dict) -> str:
+    return (f"번역 메모리 {len(memory):,}개 문장: {len(pending)}개 중 "
+            f"재사용 {len(reused)}개, 참고 {len(references)}개")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MovieTalk 영상 데이터 저장소 (public/videos)
+
+영상 자막 파일과 영상 목록을 읽고 쓰는 함수를 한곳에 모았습니다.
+add_video, gen_pronunciation, ingest_subtitles, merge_subtitles는 서로를 import하지 않고 이 모듈로 저장합니다.
+
+구조:
+    public/videos/{video_id}.json   # 영상 자막 (발음/번역 포함)
+    public/videos/index.json        # 영상 목록 (hasPronunciation, pronunciationProgress 등)
+
+- 모든 파일은 write_json_atomic으로 임시 파일에 쓴 뒤 교체하므로, 앱이 읽는 도중에도 깨진 JSON을 보지 않습니다.
+- index.json은 update_index로만 고칩니다. 잠금을 잡은 채 저장 직전에 다시 읽고 고쳐서 바로 쓰므로,
+  --progressive 중간 저장(mark_has_pronunciation)과 영상 등록이 서로의 변경을 덮어쓰지 않습니다.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+PROJECT_DIR = Path(__file__).parent
+VIDEOS_DIR = PROJECT_DIR / "public" / "videos"
+INDEX_FILE = VIDEOS_DIR / "index.json"
+
+_index_lock = threading.RLock()
+
+
+def write_json_atomic(path: Path, data, indent: Optional[int] = 2) -> None:
+    """임시 파일에 쓴 뒤 교체하여, 쓰는 중에 앱이 파일을 읽거나 프로세스가 죽어도 깨진 JSON이 남지 않게 합니다."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp_', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def video_path(video_id: str) -> Path:
+    """영상 자막 파일 경로"""
+    return VIDEOS_DIR / f"{video_id}.json"
+
+
+def load_video_data(video_id: str) -> list:
+    """영상 자막 데이터를 로드합니다."""
+    with open(video_path(video_id), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_video_data(video_id: str, data: list) -> Path:
+    """영상 자막 데이터를 저장합니다. 저장한 파일 경로를 반환합니다."""
+    filepath = video_path(video_id)
+    write_json_atomic(filepath, data)
+    return filepath
+
+
+def load_index() -> list:
+    """영상 목록 index.json을 로드합니다 (없으면 빈 목록)."""
+    if INDEX_FILE.exists():
+        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return []
+
+
+def update_index(update: Callable[[list], None]) -> list:
+    """index.json을 다시 읽어 update(index)로 고친 뒤 저장합니다. 저장한 목록을 반환합니다."""
+    with _index_lock:
+        index = load_index()
+        update(index)
+        write_json_atomic(INDEX_FILE, index)
+        return index
+
+
+def pronunciation_progress(subtitles: list) -> dict:
+    """발음 진행 상황: 발음이 있는 자막 수, 전체 수, 처음부터 끊김 없이 발음이 있는 구간의 끝 시간(초)"""
+    from pronunciation_cache import CUE_MISSING, cue_state
+
+    done = [cue_state(s) != CUE_MISSING for s in subtitles]
+    ready_until = 0
+    for s, ok in zip(subtitles, done):
+        if not ok:
+            break
+        ready_until = s['end']
+    return {'done': sum(done), 'total': len(subtitles), 'readyUntil': ready_until}
+
+
+def set_pronunciation_progress(entry: dict, subtitles: list) -> bool:
+    """index.json 항목의 hasPronunciation을 자막 상태(발음 없는 자막이 없는지)에 맞춥니다.
+
+    발음 없는 자막이 남아 있으면 pronunciationProgress(pronunciation_progress 참고)도 기록하고,
+    모두 채워지면 지웁니다. hasPronunciation 값을 반환합니다.
+    """
+    progress = pronunciation_progress(subtitles)
+    has_pronunciation = progress['done'] == progress['total']
+    entry['hasPronunciation'] = has_pronunciation
+    if has_pronunciation:
+        entry.pop('pronunciationProgress', None)
+    else:
+        entry['pronunciationProgress'] = progress
+    return has_pronunciation
+
+
+def mark_has_pronunciation(video_id: str, subtitles: list, subtitle_count: bool = False) -> bool:
+    """index.json에서 영상의 hasPronunciation/pronunciationProgress를 갱신합니다 (set_pronunciation_progress).
+
+    subtitle_count면 subtitleCount도 자막 수로 맞춥니다. 발음이 모두 채워졌는지 반환합니다.
+    """
+    def update(index):
+        for v in index:
+            if v['id'] == video_id:
+                set_pronunciation_progress(v, subtitles)
+                if subtitle_count:
+                    v['subtitleCount'] = len(subtitles)
+
+    update_index(update)
+    return pronunciation_progress(subtitles)['done'] == len(subtitles)
@@ -3,6 +3,9 @@ import react from '@vitejs/plugin-react'
 import fs from 'fs'
 import path from 'path'
 
+// 편집으로 발음이 텍스트와 어긋난 자막의 textHash (pronunciation_cache.EDITED_TEXT_HASH와 같아야 함)
+const EDITED_TEXT_HASH = 'edited'
+
 function subtitleEditPlugin() {
   return {
     name: 'subtitle-edit-api',
@@ -42,6 +45,9 @@ function subtitleEditPlugin() {
             } else {
               delete prev.translation
             }
+            // 이어붙인 발음은 근사치 → 텍스트와 맞지 않는 textHash를 넣어 gen_pronunciation --incremental이
+            // 다시 생성하게 함 (textHash가 없던 이전 데이터도 포함)
+            if (prev.pronunciation) prev.textHash = EDITED_TEXT_HASH; else delete prev.textHash
             // 노트는 합침
             if (prev.notes && curr.notes) {
               prev.notes = [...prev.notes, ...curr.notes]
@@ -113,6 +119,11 @@ function subtitleEditPlugin() {
 
               const subA = { ...sub, text: textA, end: midTime }
               const subB = { text: textB, start: midTime, end: sub.end }
+              // 나눈 발음은 근사치 → 텍스트와 맞지 않는 textHash를 넣어 gen_pronunciation --incremental이
+              // 다시 생성하게 함 (textHash가 없던 이전 데이터도 포함)
+              delete subA.textHash
+              if (pronA) subA.textHash = EDITED_TEXT_HASH
+              if (pronB) subB.textHash = EDITED_TEXT_HASH
 
               if (pronA) subA.pronunciation = pronA; else delete subA.pronunciation
               if (pronB) subB.pronunciation = pronB